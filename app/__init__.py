@@ -4,7 +4,7 @@ Flask Application Factory
 from flask import Flask
 from flask_cors import CORS
 from config import get_config
-from app.db import db, init_db
+from app.db import db, init_db, configure_engine, init_sqlite, init_read_replicas
 from app.models import freelancer
 
 
@@ -17,9 +17,25 @@ def create_app():
     config = get_config()
     app.config.from_object(config)
 
-    # 데이터베이스 초기화
+    # 데이터베이스 초기화 (커넥션 풀 설정 포함)
+    configure_engine(app)
     db.init_app(app)
 
+    # 읽기 복제본 라우팅 (DB_REPLICA_URLS 설정 시)
+    init_read_replicas(app)
+
+    # 요청별 쿼리 계측 (Server-Timing 헤더 / 요청 로그 / 느린 쿼리 로그)
+    from app.instrumentation import init_instrumentation
+    init_instrumentation(app)
+
+    # Prometheus 지표 (/metrics)
+    from app.metrics import init_metrics
+    init_metrics(app)
+
+    # 쓰기 직렬화 큐 (WRITE_QUEUE=true 일 때만 동작)
+    from app.write_queue import write_queue
+    write_queue.init_app(app)
+
     # CORS 설정
     CORS(app, resources={
         r"/api/*": {
@@ -39,8 +55,18 @@ def create_app():
     # 데이터베이스 초기화 (실패해도 앱은 시작됨)
     with app.app_context():
         try:
+            for engine in db.engines.values():
+                init_sqlite(engine)  # WAL / busy_timeout 등 (SQLite 파일 DB, 복제본 포함)
             db.create_all()
             print('✅ 데이터베이스 테이블 생성/확인 완료')
+
+            # 전문 검색 인덱스 (FTS5 / FULLTEXT 는 create_all 로 만들 수 없음)
+            from app.services.search_service import DocumentSearchService
+            DocumentSearchService.ensure_index()
+
+            # 면접 분석 집계 (최초 배포 시 기존 평가로 채움)
+            from app.services.analytics_service import InterviewAnalyticsService
+            InterviewAnalyticsService.ensure_stats()
         except Exception as e:
             print(f'⚠️  데이터베이스 연결 실패: {str(e)}')
             print('📝 setup.py를 실행하거나 데이터베이스 서버를 확인하세요')
@@ -50,10 +76,11 @@ def create_app():
 
 def register_routes(app):
     """라우트 등록"""
-    from app.routes import freelancer_routes, interview_routes
+    from app.routes import freelancer_routes, interview_routes, dashboard_routes
 
     app.register_blueprint(freelancer_routes.bp)
     app.register_blueprint(interview_routes.bp)
+    app.register_blueprint(dashboard_routes.bp)
 
 
 def register_error_handlers(app):
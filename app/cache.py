@@ -0,0 +1,92 @@
+"""
+프로세스 메모리 캐시 (stale-while-revalidate)
+- TTL 안에서는 저장된 값을 그대로 반환
+- TTL 이 지났거나 무효화된 값은 일단 그대로 반환하고 백그라운드 스레드에서 한 번만 다시 계산
+- 값이 없거나 max_stale 보다 오래된 경우에만 요청 스레드에서 계산 (같은 키는 한 스레드만 계산)
+"""
+import time
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Entry:
+    __slots__ = ('value', 'computed_at', 'generation')
+
+    def __init__(self, value, computed_at: float, generation: int):
+        self.value = value
+        self.computed_at = computed_at
+        self.generation = generation
+
+
+class StaleWhileRevalidateCache:
+    """키별 값 + 계산 시각 보관, 만료 값은 백그라운드에서 재계산"""
+
+    def __init__(self, ttl: float, max_stale: Optional[float] = None):
+        self.ttl = ttl
+        self.max_stale = max_stale  # None 이면 아무리 오래돼도 stale 값 반환
+        self._entries: Dict[str, _Entry] = {}
+        self._generations: Dict[str, int] = {}  # invalidate 마다 증가 → 계산 중 무효화된 값은 stale 로 저장
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Tuple[Any, Dict[str, Any]]:
+        """(값, 캐시 상태) - 상태: {'hit', 'stale', 'ageSeconds'}"""
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry is not None and not self._is_stale(key, entry, now):
+            return entry.value, self._status(entry, now, hit=True, stale=False)
+
+        if entry is not None and (self.max_stale is None or now - entry.computed_at <= self.max_stale):
+            self._refresh_in_background(key, loader)
+            return entry.value, self._status(entry, now, hit=True, stale=True)
+
+        # 값이 없거나 너무 오래됨 → 직접 계산 (동시에 들어온 요청은 먼저 계산한 결과 사용)
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+            if entry is None or self._is_stale(key, entry, time.monotonic()):
+                entry = self._load(key, loader)
+        return entry.value, self._status(entry, time.monotonic(), hit=False, stale=False)
+
+    def invalidate(self, key: Optional[str] = None):
+        """다음 조회부터 stale 로 취급 (None 이면 전체)"""
+        with self._lock:
+            for k in ([key] if key is not None else list(self._entries)):
+                self._generations[k] = self._generations.get(k, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _is_stale(self, key: str, entry: _Entry, now: float) -> bool:
+        return now - entry.computed_at > self.ttl or entry.generation != self._generations.get(key, 0)
+
+    def _load(self, key: str, loader: Callable[[], Any]) -> _Entry:
+        generation = self._generations.get(key, 0)
+        started = time.monotonic()
+        entry = _Entry(loader(), started, generation)
+        self._entries[key] = entry
+        return entry
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any]):
+        lock = self._key_lock(key)
+        if not lock.acquire(blocking=False):
+            return  # 다른 스레드가 이미 계산 중
+
+        def run():
+            try:
+                self._load(key, loader)
+            except Exception as e:
+                print(f'⚠️  캐시 갱신 실패 ({key}): {str(e)}')
+            finally:
+                lock.release()
+
+        threading.Thread(target=run, name=f'cache-refresh-{key}', daemon=True).start()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _status(entry: _Entry, now: float, hit: bool, stale: bool) -> Dict[str, Any]:
+        return {'hit': hit, 'stale': stale, 'ageSeconds': round(now - entry.computed_at, 1)}
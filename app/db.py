@@ -1,14 +1,390 @@
 """
 Database initialization and setup
 """
+import os
+import zlib
+import time
+import random
+import threading
+from contextlib import contextmanager
+from typing import List
+
+from flask import g, has_request_context, request
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, exc
+from sqlalchemy.dialects import mysql
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.elements import TextClause
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+# ==================== 읽기 복제본 라우팅 ====================
+# SQLALCHEMY_BINDS 의 replica_* 엔진 = 읽기 복제본 (config.DB_REPLICA_URLS)
+# - GET / HEAD 요청의 세션은 복제본 하나를 골라 조회를 보냄
+# - flush / DML / SELECT ... FOR UPDATE 는 항상 primary, 세션이 한 번 쓰면 이후 조회도 primary
+# - 쓰기 요청을 보낸 클라이언트는 DB_REPLICA_STICKY_SECONDS 동안 쿠키로 primary 고정 (복제 지연 동안 자기 쓰기 확인)
+
+REPLICA_BIND_PREFIX = 'replica_'
+READ_METHODS = ('GET', 'HEAD')
+STICKY_COOKIE = 'db_primary_until'
+_REPLICA_INFO_KEY = 'read_replica'  # session.info 에 선택한 복제본 bind key
+
+
+def _is_write(clause) -> bool:
+    """primary 로 보내야 하는 문장인지 (DML / 잠금 조회 / SELECT 가 아닌 원시 SQL)"""
+    if clause is None:
+        return False
+    if getattr(clause, 'is_dml', False) or getattr(clause, '_for_update_arg', None) is not None:
+        return True
+    if isinstance(clause, TextClause):
+        return not clause.text.lstrip().upper().startswith(('SELECT', 'WITH'))
+    return False
+
+
+class RoutingSession(Session):
+    """읽기 요청의 조회는 복제본, 나머지는 primary (Flask-SQLAlchemy bind 선택 위에 덧붙임)"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        replica = self.info.get(_REPLICA_INFO_KEY)
+        if bind is None and replica is not None and not self._flushing and not _is_write(clause):
+            engine = self._db.engines.get(replica)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
 
 # SQLAlchemy instance
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def replica_bind_keys() -> List[str]:
+    """설정된 읽기 복제본 bind key 목록 (앱 컨텍스트 필요)"""
+    return sorted(key for key in db.engines if key and key.startswith(REPLICA_BIND_PREFIX))
+
+
+def mark_primary():
+    """현재 세션의 이후 조회를 primary 로 + 요청 중이면 응답에 primary 고정 쿠키"""
+    db.session.info.pop(_REPLICA_INFO_KEY, None)
+    if has_request_context():
+        g.db_wrote = True
+
+
+@contextmanager
+def use_primary():
+    """블록 안의 조회만 primary 로 (복제 지연이 있으면 안 되는 캐시 갱신 등)"""
+    replica = db.session.info.pop(_REPLICA_INFO_KEY, None)
+    try:
+        yield
+    finally:
+        if replica is not None:
+            db.session.info[_REPLICA_INFO_KEY] = replica
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _stick_to_primary_after_flush(session, flush_context):
+    # 같은 세션 / 요청에서 방금 쓴 값을 복제본에서 읽지 않도록
+    session.info.pop(_REPLICA_INFO_KEY, None)
+    if has_request_context():
+        g.db_wrote = True
+
+
+def init_read_replicas(app):
+    """복제본이 설정된 경우 요청별 라우팅 훅 등록 (db.init_app 이후)"""
+    if not any(key.startswith(REPLICA_BIND_PREFIX) for key in (app.config.get('SQLALCHEMY_BINDS') or {})):
+        return
+    sticky_seconds = app.config.get('DB_REPLICA_STICKY_SECONDS', 5)
+
+    @app.before_request
+    def _route_reads_to_replica():
+        if request.method not in READ_METHODS:
+            return
+        try:
+            primary_until = float(request.cookies.get(STICKY_COOKIE, 0))
+        except ValueError:
+            primary_until = 0
+        if primary_until > time.time():
+            return  # 최근에 쓴 클라이언트 → primary
+        keys = replica_bind_keys()
+        if keys:
+            db.session.info[_REPLICA_INFO_KEY] = random.choice(keys)
+
+    @app.after_request
+    def _set_primary_cookie(response):
+        wrote = g.pop('db_wrote', False) or (request.method not in READ_METHODS and response.status_code < 400)
+        if wrote and sticky_seconds > 0:
+            response.set_cookie(STICKY_COOKIE, str(int(time.time() + sticky_seconds)), max_age=int(sticky_seconds) + 1,
+                                httponly=True, samesite='Lax')
+        return response
 
 
 def init_db(app):
     """데이터베이스 초기화"""
+    configure_engine(app)
     db.init_app(app)
     with app.app_context():
+        for engine in db.engines.values():
+            init_sqlite(engine)
         db.create_all()
+
+
+def configure_engine(app):
+    """파일 / 서버 DB는 계측 풀 사용 (메모리 SQLite는 Flask-SQLAlchemy 기본 풀 유지)"""
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI', '')
+    options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})  # 설정 클래스의 dict 는 공유되므로 복사
+    if ':memory:' in uri or uri in ('sqlite://', 'sqlite:///'):
+        for key in ('pool_size', 'max_overflow', 'pool_timeout'):
+            options.pop(key, None)  # StaticPool 은 크기 옵션을 받지 않음
+    else:
+        options.setdefault('poolclass', InstrumentedQueuePool)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+
+
+# ==================== SQLite 동시성 설정 ====================
+# 연결마다 PRAGMA 적용 - WAL 로 읽기와 쓰기가 서로 막지 않게 하고, 잠금 충돌 시 바로 실패하지 않고 대기
+
+SQLITE_TUNING = os.getenv('SQLITE_TUNING', 'true').lower() == 'true'
+SQLITE_PRAGMAS = {
+    'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),  # 읽기는 쓰기 중에도 마지막 커밋 시점을 읽음
+    'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),  # WAL 에서는 NORMAL 도 손상 없음 (정전 시 마지막 커밋만 유실 가능)
+    'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),  # 잠금 대기 (ms) - 넘으면 database is locked
+    'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', -64000)),  # 음수는 KB 단위 (연결당 약 64MB)
+    'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),  # 읽기를 메모리 매핑으로 (바이트)
+    'temp_store': os.getenv('SQLITE_TEMP_STORE', 'MEMORY'),  # 정렬 / 임시 테이블을 메모리에서
+}
+
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record=None, pragmas=None):
+    """SQLite 연결에 PRAGMA 적용 (engine 'connect' 이벤트)"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in (SQLITE_PRAGMAS if pragmas is None else pragmas).items():
+            cursor.execute(f'PRAGMA {name}={value}')
+    finally:
+        cursor.close()
+
+
+SQLITE_BEGIN_OPTION = 'sqlite_begin'
+
+
+def disable_pysqlite_transactions(dbapi_connection, connection_record=None):
+    """pysqlite 의 자체 BEGIN 처리 끄기 (engine 'connect' 이벤트) - 트랜잭션 시작은 begin_sqlite_transaction 이 담당"""
+    dbapi_connection.isolation_level = None
+
+
+def begin_sqlite_transaction(conn):
+    """트랜잭션 시작 시 BEGIN 명시 (engine 'begin' 이벤트)
+    - pysqlite 기본 동작은 DML 직전에만 BEGIN → 그 전에 연 SAVEPOINT 는 바깥 트랜잭션 없이 시작되어
+      RELEASE 시점에 바로 커밋됨 (begin_nested 가 바깥 COMMIT / ROLLBACK 과 묶이지 않음)
+    - 실행 옵션 sqlite_begin='IMMEDIATE' 이면 시작할 때 쓰기 잠금을 잡음 (쓰기 큐 writer)
+    - 드라이버 연결에 바로 실행 → 쿼리 계측(요청별 쿼리 수 / 예산)에 잡히지 않음 (다른 DB 의 암묵적 BEGIN 과 동일)
+    """
+    dbapi_connection = conn.connection.dbapi_connection
+    if dbapi_connection.in_transaction:
+        return  # 메모리 DB(StaticPool)는 여러 Connection 이 sqlite3 연결 하나를 공유 → 이미 열린 트랜잭션에 합류
+    mode = conn.get_execution_options().get(SQLITE_BEGIN_OPTION)
+    dbapi_connection.execute(f'BEGIN {mode}' if mode in ('DEFERRED', 'IMMEDIATE', 'EXCLUSIVE') else 'BEGIN')
+
+
+def init_sqlite(engine):
+    """SQLite 엔진 연결 설정 (연결 전에 호출)
+    - 모든 SQLite 엔진: BEGIN 을 직접 내보내 SAVEPOINT 가 바깥 트랜잭션 안에서 열리도록
+    - 파일 DB: 새 연결마다 PRAGMA 적용
+    """
+    if engine.dialect.name != 'sqlite':
+        return
+    if not event.contains(engine, 'connect', disable_pysqlite_transactions):
+        event.listen(engine, 'connect', disable_pysqlite_transactions)
+        event.listen(engine, 'begin', begin_sqlite_transaction)
+    if not SQLITE_TUNING or engine.url.database in (None, '', ':memory:'):
+        return  # 메모리 DB는 WAL / mmap 대상 아님
+    if not event.contains(engine, 'connect', apply_sqlite_pragmas):
+        event.listen(engine, 'connect', apply_sqlite_pragmas)
+
+
+# ==================== 커넥션 풀 계측 ====================
+# 커넥션 대여(checkout)에 걸린 시간 / 타임아웃 / 끊긴 연결 재생성 횟수를 누적 → 풀 크기 조정 근거
+# 대기 시간은 풀이 비어 기다린 시간 + 새 연결 생성 + pre-ping 을 포함
+
+CHECKOUT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """프로세스 단위 풀 지표 (풀이 재생성되어도 누적 유지)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners = []  # 외부 지표 수집기 (app.metrics) - (종류, 초) 로 호출
+        self.reset()
+
+    def add_listener(self, listener):
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _notify(self, kind: str, seconds: float = 0.0):
+        for listener in self._listeners:
+            listener(kind, seconds)
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.wait_total = 0.0  # 초
+            self.wait_max = 0.0
+            self.timeouts = 0
+            self.invalidated = 0  # pre-ping 실패 / 끊긴 연결로 폐기된 연결 수
+            self.buckets = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)  # 마지막은 상한 초과
+
+    def record_checkout(self, seconds: float):
+        bucket = next((i for i, upper in enumerate(CHECKOUT_BUCKETS_MS) if seconds * 1000 <= upper),
+                      len(CHECKOUT_BUCKETS_MS))
+        with self._lock:
+            self.checkouts += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            self.buckets[bucket] += 1
+        self._notify('checkout', seconds)
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+        self._notify('timeout')
+
+    def record_invalidate(self):
+        with self._lock:
+            self.invalidated += 1
+        self._notify('invalidate')
+
+    def snapshot(self, pool=None) -> dict:
+        """현재 풀 상태 + 누적 지표"""
+        with self._lock:
+            result = {
+                'checkouts': self.checkouts,
+                'checkoutWaitAvgMs': round(self.wait_total / self.checkouts * 1000, 2) if self.checkouts else 0.0,
+                'checkoutWaitMaxMs': round(self.wait_max * 1000, 2),
+                'checkoutWaitHistogramMs': {
+                    **{f'le_{upper}': count for upper, count in zip(CHECKOUT_BUCKETS_MS, self.buckets)},
+                    'le_inf': self.buckets[-1],
+                },
+                'timeouts': self.timeouts,
+                'invalidated': self.invalidated,
+            }
+        if isinstance(pool, QueuePool):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            result.update({
+                'poolSize': pool.size(),
+                'maxOverflow': pool._max_overflow,
+                'checkedOut': pool.checkedout(),
+                'checkedIn': pool.checkedin(),
+                'overflow': max(pool.overflow(), 0),
+                'saturation': round(pool.checkedout() / capacity, 3) if capacity > 0 else None,
+            })
+        elif pool is not None:
+            result['poolClass'] = type(pool).__name__
+        return result
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """checkout 소요 시간 / 타임아웃을 pool_metrics 에 기록하는 QueuePool"""
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_metrics.record_timeout()
+            raise
+        pool_metrics.record_checkout(time.perf_counter() - started)
+        return connection
+
+
+@event.listens_for(InstrumentedQueuePool, 'invalidate')
+def _record_invalidate(dbapi_connection, connection_record, exception):
+    pool_metrics.record_invalidate()
+
+
+# ==================== 압축 컬럼 타입 ====================
+# 저장 형식: MAGIC(3바이트) + 코덱(1바이트) + 본문
+#   z = zlib, s = zstd, n = 무압축 (작은 값 / 압축 효과 없음)
+# 헤더가 없는 값은 압축 도입 전 평문으로 간주 (마이그레이션 전 행도 그대로 읽힘)
+
+COMPRESSION_MAGIC = b'\x00cz'
+CODEC_ZLIB = b'z'
+CODEC_ZSTD = b's'
+CODEC_NONE = b'n'
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class CompressedText(TypeDecorator):
+    """압축 저장되는 텍스트 컬럼 (읽을 때 자동 해제)"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    CODEC = os.getenv('TEXT_COMPRESSION', 'zlib').lower()  # zlib, zstd, none
+    LEVEL = int(os.getenv('TEXT_COMPRESSION_LEVEL', 6))
+    MIN_SIZE = int(os.getenv('TEXT_COMPRESSION_MIN_SIZE', 512))  # 이보다 작은 값은 압축하지 않음 (바이트)
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'mysql':
+            return dialect.type_descriptor(mysql.LONGBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return compress_bytes(self._serialize(value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return self._deserialize(value)  # SQLite TEXT 로 저장된 기존 행
+        return self._deserialize(decompress_bytes(bytes(value)).decode('utf-8'))
+
+    def _serialize(self, value) -> bytes:
+        return value.encode('utf-8')
+
+    def _deserialize(self, value: str):
+        return value
+
+
+def compress_bytes(data: bytes) -> bytes:
+    """헤더 + 압축 본문 (작거나 압축 효과가 없으면 무압축 헤더)"""
+    codec = CompressedText.CODEC
+    if len(data) >= CompressedText.MIN_SIZE and codec != 'none':
+        if codec == 'zstd' and zstandard is not None:
+            compressed = COMPRESSION_MAGIC + CODEC_ZSTD + zstandard.ZstdCompressor(
+                level=CompressedText.LEVEL).compress(data)
+        else:
+            compressed = COMPRESSION_MAGIC + CODEC_ZLIB + zlib.compress(data, CompressedText.LEVEL)
+        if len(compressed) < len(data):
+            return compressed
+    return COMPRESSION_MAGIC + CODEC_NONE + data
+
+
+def decompress_bytes(data: bytes) -> bytes:
+    """compress_bytes 역변환 (헤더가 없으면 평문 그대로)"""
+    if not is_compressed(data):
+        return data
+    codec, body = data[3:4], data[4:]
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(body)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError('zstd로 압축된 데이터를 읽으려면 zstandard 패키지가 필요합니다')
+        return zstandard.ZstdDecompressor().decompress(body)
+    if codec == CODEC_NONE:
+        return body
+    raise ValueError(f'알 수 없는 압축 형식입니다: {codec!r}')
+
+
+def is_compressed(raw) -> bool:
+    """DB 원시 값이 압축 헤더 형식인지 (마이그레이션 대상 판별용)"""
+    return isinstance(raw, (bytes, bytearray, memoryview)) and bytes(raw[:3]) == COMPRESSION_MAGIC
@@ -0,0 +1,237 @@
+"""
+요청별 쿼리 계측 (SQLALCHEMY_ECHO 대체)
+- 엔진 before/after_cursor_execute 이벤트로 요청마다 쿼리 수 / DB 시간 합계 / 가장 느린 문장을 집계
+- 응답 헤더 Server-Timing (브라우저 개발자 도구 Timing 탭에 표시) + 요청당 JSON 로그 한 줄 (app.requests)
+- SLOW_QUERY_MS 를 넘는 문장은 문장 / 파라미터 / 호출 위치(app 코드 스택)를 JSON 으로 기록 (app.slow_query)
+- 요청 밖(백그라운드 캐시 갱신, 쓰기 큐 writer 스레드)의 쿼리는 요청 집계에 포함되지 않고 느린 쿼리 로그만 남음
+- @query_budget(n) 을 붙인 라우트가 n 개보다 많이 조회하면 경고 로그 (app.query_budget),
+  QUERY_BUDGET_STRICT (테스트 설정) 이면 QueryBudgetExceeded 로 요청 실패 → N+1 회귀 검출 (check_query_budgets.py)
+"""
+import os
+import sys
+import json
+import time
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from flask import current_app, has_request_context, request
+from sqlalchemy import event
+
+from app.db import db
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATEMENT_LOG_LIMIT = 2000  # 로그에 남길 문장 / 파라미터 최대 길이 (문자)
+ORIGIN_DEPTH = 5  # 느린 쿼리 로그에 남길 호출 위치 수 (안쪽부터)
+
+request_logger = logging.getLogger('app.requests')
+slow_query_logger = logging.getLogger('app.slow_query')
+budget_logger = logging.getLogger('app.query_budget')
+
+_current_stats: ContextVar[Optional['QueryStats']] = ContextVar('query_stats', default=None)
+
+
+class QueryStats:
+    """요청 하나의 쿼리 집계"""
+
+    __slots__ = ('count', 'total', 'slowest', 'slowest_statement', 'started', 'statements')
+
+    def __init__(self, keep_statements: bool = False):
+        self.count = 0
+        self.total = 0.0  # 초
+        self.slowest = 0.0
+        self.slowest_statement = None
+        self.started = time.perf_counter()
+        self.statements = [] if keep_statements else None  # 쿼리 예산 초과 시 원인 표시용 (엄격 모드)
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.slowest:
+            self.slowest = seconds
+            self.slowest_statement = statement
+        if self.statements is not None:
+            self.statements.append(statement)
+
+    def repeated_statements(self, limit: int = 3) -> List[str]:
+        """두 번 이상 실행된 문장 (많은 순) - N+1 후보"""
+        counts = Counter(_one_line(statement) for statement in self.statements or ())
+        return [f'{count}× {_truncate(statement, 200)}' for statement, count in counts.most_common(limit) if count > 1]
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (ms)"""
+        elapsed = time.perf_counter() - self.started
+        return (f'db;dur={self.total * 1000:.2f};desc="{self.count} queries", '
+                f'db-slowest;dur={self.slowest * 1000:.2f}, '
+                f'app;dur={elapsed * 1000:.2f}')
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'queries': self.count,
+            'dbMs': round(self.total * 1000, 2),
+            'slowestMs': round(self.slowest * 1000, 2),
+            'slowestStatement': _truncate(_one_line(self.slowest_statement), 200),
+        }
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """현재 요청의 쿼리 집계 (요청 밖이면 None)"""
+    return _current_stats.get()
+
+
+class QueryBudgetExceeded(AssertionError):
+    """라우트가 선언한 쿼리 수 초과 (QUERY_BUDGET_STRICT)"""
+
+    def __init__(self, endpoint: str, used: int, budget: int, repeated: List[str] = ()):
+        message = f'{endpoint}: 쿼리 {used}개 실행 (예산 {budget}개)'
+        if repeated:
+            message += '\n  ' + '\n  '.join(repeated)
+        super().__init__(message)
+        self.endpoint = endpoint
+        self.used = used
+        self.budget = budget
+
+
+def query_budget(max_queries: int):
+    """라우트의 요청당 최대 쿼리 수 선언 (데이터 양과 무관한 상수여야 함 - 넘으면 N+1 의심)"""
+
+    def decorator(view):
+        view.query_budget = max_queries  # 래핑 없이 표시만 (검사는 after_request 에서)
+        return view
+
+    return decorator
+
+
+def init_instrumentation(app):
+    """모든 엔진(primary / 복제본)에 계측 이벤트 + 요청 훅 등록 (db.init_app 이후)"""
+    stats_enabled = app.config.get('QUERY_STATS', True)
+    request_log = app.config.get('REQUEST_LOG', True)
+    slow_threshold = app.config.get('SLOW_QUERY_MS', 200) / 1000
+    log_params = app.config.get('SLOW_QUERY_LOG_PARAMS', True)
+    strict_budget = app.config.get('QUERY_BUDGET_STRICT', False)
+
+    if not stats_enabled and slow_threshold <= 0:
+        return
+    _ensure_handler(request_logger)
+    _ensure_handler(slow_query_logger)
+    _ensure_handler(budget_logger)
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['query_started'].pop()
+        seconds = time.perf_counter() - started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, seconds)
+        if 0 < slow_threshold <= seconds:
+            _log_slow_query(conn, statement, parameters if log_params else None, seconds, executemany)
+
+    def handle_error(exception_context):
+        # 실패한 문장은 after_cursor_execute 가 호출되지 않음 → 시작 시각만 정리
+        conn = exception_context.connection
+        if conn is not None and conn.info.get('query_started'):
+            conn.info['query_started'].pop()
+
+    with app.app_context():
+        for engine in db.engines.values():
+            event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', after_cursor_execute)
+            event.listen(engine, 'handle_error', handle_error)
+
+    if not stats_enabled:
+        return
+
+    @app.before_request
+    def _start_query_stats():
+        request.environ['app.query_stats_token'] = _current_stats.set(QueryStats(keep_statements=strict_budget))
+
+    @app.after_request
+    def _report_query_stats(response):
+        stats = _current_stats.get()
+        if stats is None:
+            return response
+        response.headers['Server-Timing'] = stats.server_timing()
+        if request_log:
+            request_logger.info(json.dumps({
+                'method': request.method,
+                'path': request.full_path.rstrip('?'),
+                'status': response.status_code,
+                'durationMs': round((time.perf_counter() - stats.started) * 1000, 2),
+                **stats.as_dict(),
+            }, ensure_ascii=False))
+        _check_query_budget(stats, strict_budget)
+        return response
+
+    @app.teardown_request
+    def _reset_query_stats(exc=None):
+        token = request.environ.pop('app.query_stats_token', None)
+        if token is not None:
+            _current_stats.reset(token)
+
+
+def _check_query_budget(stats: QueryStats, strict: bool):
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, 'query_budget', None)
+    if budget is None or stats.count <= budget:
+        return
+    budget_logger.warning(json.dumps({
+        'endpoint': request.endpoint,
+        'request': f'{request.method} {request.path}',
+        'queries': stats.count,
+        'budget': budget,
+    }, ensure_ascii=False))
+    if strict:
+        raise QueryBudgetExceeded(request.endpoint, stats.count, budget, stats.repeated_statements())
+
+
+def _log_slow_query(conn, statement, parameters, seconds, executemany):
+    record = {
+        'durationMs': round(seconds * 1000, 2),
+        'database': conn.engine.url.render_as_string(hide_password=True),
+        'statement': _truncate(_one_line(statement), STATEMENT_LOG_LIMIT),
+        'origin': _app_origin(),
+    }
+    if parameters is not None:
+        record['parameters'] = _truncate(repr(parameters), STATEMENT_LOG_LIMIT)
+    if executemany:
+        record['executemany'] = True
+    if has_request_context():
+        record['request'] = f'{request.method} {request.path}'
+    slow_query_logger.warning(json.dumps(record, ensure_ascii=False, default=str))
+
+
+def _app_origin() -> List[str]:
+    """쿼리를 실행한 프로젝트 코드 위치 (안쪽부터, 라이브러리 / 계측 코드 제외)"""
+    origin = []
+    frame = sys._getframe(1)
+    while frame is not None and len(origin) < ORIGIN_DEPTH:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(PROJECT_ROOT) and filename != __file__
+                and 'site-packages' not in filename and not filename.endswith(os.path.join('app', 'db.py'))):
+            origin.append(f'{os.path.relpath(filename, PROJECT_ROOT)}:{frame.f_lineno} {frame.f_code.co_name}')
+        frame = frame.f_back
+    return origin
+
+
+def _one_line(statement: Optional[str]) -> Optional[str]:
+    return ' '.join(statement.split()) if statement is not None else None
+
+
+def _truncate(value: Optional[str], limit: int) -> Optional[str]:
+    if value is None or len(value) <= limit:
+        return value
+    return value[:limit] + f'... ({len(value)}자)'
+
+
+def _ensure_handler(logger: logging.Logger):
+    """핸들러가 없으면 stderr 로 메시지(JSON)만 출력 (gunicorn 에서는 errorlog 로 수집)"""
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.INFO)
@@ -0,0 +1,137 @@
+"""
+Prometheus 지표 (/metrics, 텍스트 형식)
+- 요청: 엔드포인트별 지연 히스토그램 / 응답 크기 / 요청당 쿼리 수, 상태 코드별 요청 수
+- DB: 커넥션 풀 사용 중 연결 / 용량, checkout 대기 히스토그램, 타임아웃 / 폐기 연결 수
+- 캐시: 대시보드 통계 / 문서 추출 캐시 적중 여부 (적중률 = hit / 전체)
+- 문서: 형식별 텍스트 추출 시간
+- gunicorn 워커 여러 개: PROMETHEUS_MULTIPROC_DIR 가 설정되면 워커별 파일에 기록하고 /metrics 에서 합산
+  (gunicorn.conf.py 가 기본 디렉토리 설정 / 시작 시 정리 / 종료 워커 정리)
+"""
+import os
+import time
+from functools import partial
+
+from flask import Response, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+
+from app.db import db, pool_metrics
+
+# 요청 지연 (초) - 대부분 수십 ms, 문서 업로드 / 분석은 수 초
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)  # 응답 크기 (바이트)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)  # app.db.CHECKOUT_BUCKETS_MS 와 같은 구간
+EXTRACTION_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+UNMATCHED_ENDPOINT = 'unmatched'  # 라우트가 없는 요청 (404) - 경로를 라벨로 쓰지 않도록 하나로 묶음
+
+http_requests = Counter(
+    'http_requests_total', '요청 수', ['endpoint', 'method', 'status'])
+http_request_duration = Histogram(
+    'http_request_duration_seconds', '요청 처리 시간', ['endpoint', 'method'], buckets=LATENCY_BUCKETS)
+http_response_size = Histogram(
+    'http_response_size_bytes', '응답 본문 크기', ['endpoint'], buckets=SIZE_BUCKETS)
+http_request_queries = Histogram(
+    'http_request_db_queries', '요청당 실행한 쿼리 수', ['endpoint'], buckets=QUERY_COUNT_BUCKETS)
+
+db_pool_checked_out = Gauge(
+    'db_pool_checked_out_connections', '사용 중인 연결 수', ['pool'], multiprocess_mode='livesum')
+db_pool_capacity = Gauge(
+    'db_pool_capacity_connections', '최대 연결 수 (pool_size + max_overflow)', ['pool'], multiprocess_mode='livesum')
+db_pool_checkout_wait = Histogram(
+    'db_pool_checkout_wait_seconds', '연결 대여 대기 시간 (새 연결 / pre-ping 포함)', buckets=POOL_WAIT_BUCKETS)
+db_pool_timeouts = Counter('db_pool_timeouts_total', '연결 대여 타임아웃 수')
+db_pool_invalidated = Counter('db_pool_invalidated_total', '끊겨서 폐기된 연결 수')
+
+cache_requests = Counter(
+    'cache_requests_total', '캐시 조회 (result: hit / stale / miss)', ['cache', 'result'])
+document_extraction_duration = Histogram(
+    'document_extraction_duration_seconds', '문서 텍스트 추출 시간 (캐시 미적중)', ['format', 'outcome'],
+    buckets=EXTRACTION_BUCKETS)
+
+
+def multiprocess_enabled() -> bool:
+    # prometheus_client 가 import 시점에 보는 값과 같은 기준 (설정돼 있으면 워커별 mmap 파일에 기록)
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+def init_metrics(app):
+    """/metrics 라우트 + 요청 / 커넥션 풀 계측 등록 (db.init_app 이후)"""
+    if not app.config.get('METRICS_ENABLED', True):
+        return
+
+    app.add_url_rule('/metrics', 'metrics', metrics_view, methods=['GET'])
+
+    @app.before_request
+    def _start_request_timer():
+        request.environ['app.metrics_started'] = time.perf_counter()
+
+    @app.after_request
+    def _observe_request(response):
+        started = request.environ.get('app.metrics_started')
+        if started is None:
+            return response
+        endpoint = request.endpoint or UNMATCHED_ENDPOINT
+        http_requests.labels(endpoint, request.method, str(response.status_code)).inc()
+        http_request_duration.labels(endpoint, request.method).observe(time.perf_counter() - started)
+        if response.content_length is not None:
+            http_response_size.labels(endpoint).observe(response.content_length)
+
+        from app.instrumentation import current_query_stats
+        stats = current_query_stats()
+        if stats is not None:
+            http_request_queries.labels(endpoint).observe(stats.count)
+        return response
+
+    # 풀 이벤트는 engine.dispose() 로 풀이 다시 만들어져도 유지됨
+    with app.app_context():
+        for key, engine in db.engines.items():
+            gauge = db_pool_checked_out.labels(key or 'primary')
+            event.listen(engine.pool, 'checkout', partial(_on_checkout, gauge))
+            event.listen(engine.pool, 'checkin', partial(_on_checkin, gauge))
+        set_pool_capacity()
+    pool_metrics.add_listener(_on_pool_event)
+
+
+def set_pool_capacity():
+    """풀 용량 게이지 기록 (앱 컨텍스트 필요) - 멀티프로세스 값은 fork 후 0 으로 시작하므로 워커마다 다시 호출"""
+    for key, engine in db.engines.items():
+        if isinstance(engine.pool, QueuePool):
+            db_pool_capacity.labels(key or 'primary').set(engine.pool.size() + max(engine.pool._max_overflow, 0))
+
+
+def metrics_view():
+    """Prometheus 텍스트 형식 (워커 여러 개면 전체 합산)"""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_dead(pid: int):
+    """종료된 gunicorn 워커의 livesum 게이지 파일 정리 (child_exit)"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
+
+
+def _on_checkout(gauge, dbapi_connection, connection_record, connection_proxy):
+    gauge.inc()
+
+
+def _on_checkin(gauge, dbapi_connection, connection_record):
+    gauge.dec()
+
+
+def _on_pool_event(kind: str, seconds: float = 0.0):
+    if kind == 'checkout':
+        db_pool_checkout_wait.observe(seconds)
+    elif kind == 'timeout':
+        db_pool_timeouts.inc()
+    elif kind == 'invalidate':
+        db_pool_invalidated.inc()
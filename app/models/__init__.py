@@ -7,7 +7,8 @@ from app.models.freelancer import (
     InterviewEvaluation, InterviewCategory, InterviewQuestion,
     InterviewCheckpoint, InterviewRedFlag,
     InterviewCategoryScore, InterviewEvaluationResult, InterviewRedFlagFinding,
-    FreelancerDocument,
+    InterviewCategoryScoreStat, InterviewRedFlagStat,
+    FreelancerDocument, DocumentExtractionCache,
     freelancer_skill
 )
 
@@ -17,6 +18,7 @@ __all__ = [
     'InterviewEvaluation', 'InterviewCategory', 'InterviewQuestion',
     'InterviewCheckpoint', 'InterviewRedFlag',
     'InterviewCategoryScore', 'InterviewEvaluationResult', 'InterviewRedFlagFinding',
-    'FreelancerDocument',
+    'InterviewCategoryScoreStat', 'InterviewRedFlagStat',
+    'FreelancerDocument', 'DocumentExtractionCache',
     'freelancer_skill'
 ]
@@ -6,7 +6,7 @@ Freelancer Model - 3NF Normalized Structure with Interview Evaluation
 - 3NF: 이행 함수 종속성 제거
 """
 from datetime import datetime
-from app.db import db
+from app.db import db, CompressedText
 
 # ==================== Association Tables ====================
 
@@ -174,7 +174,7 @@ class Freelancer(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
 
     def __repr__(self):
         return f'<Freelancer {self.name}>'
@@ -251,7 +251,7 @@ class FreelancerProfile(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     freelancer = db.relationship('Freelancer', back_populates='profile')
@@ -334,7 +334,7 @@ class Review(db.Model):
 
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     freelancer = db.relationship('Freelancer', back_populates='reviews')
@@ -374,7 +374,7 @@ class InterviewEvaluation(db.Model):
     # Timestamps
     evaluated_at = db.Column(db.DateTime, nullable=False, index=True)  # 평가 날짜
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     freelancer = db.relationship('Freelancer', back_populates='interview_evaluations')
@@ -524,6 +524,83 @@ class InterviewRedFlagFinding(db.Model):
         }
 
 
+# ==================== Analytics (집계 테이블) ====================
+# 평가 쓰기 경로에서 증분 갱신 - 대시보드는 원본 점수/발견 이력을 스캔하지 않고 이 테이블만 읽음
+
+class InterviewCategoryScoreStat(db.Model):
+    """카테고리별 점수 분포 집계 (카테고리당 1행)"""
+    __tablename__ = 'interview_category_score_stat'
+
+    category_id = db.Column(db.String(36), db.ForeignKey('interview_category.id', ondelete='CASCADE'), primary_key=True)
+    score_count = db.Column(db.Integer, nullable=False, default=0)  # 점수가 매겨진 평가 수
+    score_sum = db.Column(db.Float, nullable=False, default=0.0)
+    score_1_count = db.Column(db.Integer, nullable=False, default=0)  # 하(1)
+    score_3_count = db.Column(db.Integer, nullable=False, default=0)  # 중(3)
+    score_5_count = db.Column(db.Integer, nullable=False, default=0)  # 상(5)
+    checked_sum = db.Column(db.Integer, nullable=False, default=0)  # 체크된 항목 수 합계
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    category = db.relationship('InterviewCategory')
+
+    def __repr__(self):
+        return f'<InterviewCategoryScoreStat {self.category_id} n={self.score_count}>'
+
+    def to_dict(self):
+        count = self.score_count or 0
+        return {
+            'categoryId': self.category_id,
+            'categoryName': self.category.name if self.category else None,
+            'count': count,
+            'averageScore': round(self.score_sum / count, 2) if count else None,
+            'averageCheckedCount': round(self.checked_sum / count, 2) if count else None,
+            'distribution': {
+                '하(1)': self.score_1_count,
+                '중(3)': self.score_3_count,
+                '상(5)': self.score_5_count,
+            },
+        }
+
+
+class InterviewRedFlagStat(db.Model):
+    """레드플래그별 발견 빈도 집계 (레드플래그당 1행)"""
+    __tablename__ = 'interview_red_flag_stat'
+
+    red_flag_id = db.Column(db.String(36), db.ForeignKey('interview_red_flag.id', ondelete='CASCADE'), primary_key=True)
+    finding_count = db.Column(db.Integer, nullable=False, default=0)  # 확인한 평가 수 (발견 여부 무관)
+    found_count = db.Column(db.Integer, nullable=False, default=0, index=True)  # 실제 발견된 평가 수
+    severity_low_count = db.Column(db.Integer, nullable=False, default=0)  # 발견 시 실제 심각도별 건수
+    severity_medium_count = db.Column(db.Integer, nullable=False, default=0)
+    severity_high_count = db.Column(db.Integer, nullable=False, default=0)
+    severity_critical_count = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Relationships
+    red_flag = db.relationship('InterviewRedFlag')
+
+    def __repr__(self):
+        return f'<InterviewRedFlagStat {self.red_flag_id} found={self.found_count}>'
+
+    def to_dict(self):
+        return {
+            'redFlagId': self.red_flag_id,
+            'categoryId': self.red_flag.category_id if self.red_flag else None,
+            'flagText': self.red_flag.flag_text if self.red_flag else None,
+            'severity': self.red_flag.severity if self.red_flag else None,
+            'findingCount': self.finding_count,
+            'foundCount': self.found_count,
+            'foundRate': round(self.found_count / self.finding_count, 4) if self.finding_count else None,
+            'severityActual': {
+                'low': self.severity_low_count,
+                'medium': self.severity_medium_count,
+                'high': self.severity_high_count,
+                'critical': self.severity_critical_count,
+            },
+        }
+
+
 # ==================== File Management ====================
 
 class FreelancerDocument(db.Model):
@@ -539,9 +616,12 @@ class FreelancerDocument(db.Model):
     file_path = db.Column(db.String(500), nullable=False)  # 상대 경로
     file_size = db.Column(db.Integer, nullable=False)  # 바이트
     mime_type = db.Column(db.String(100), nullable=False)  # application/pdf, etc
+    content_hash = db.Column(db.String(64), nullable=True, index=True)  # 파일 내용 SHA-256
 
     # 분석 결과
-    extracted_text = db.Column(db.Text, nullable=True)  # 추출된 텍스트
+    # 추출 텍스트는 압축 저장 + 지연 로딩 - 목록 조회 등에서는 읽지도 압축 해제하지도 않음
+    extracted_text = db.deferred(db.Column(CompressedText, nullable=True))  # 추출된 텍스트
+    # 구조화 데이터는 작고 SQL 에서 JSON_EXTRACT 로 조회하므로 (queries.sql 6.3) JSON 그대로 저장
     extracted_data = db.Column(db.JSON, nullable=True)  # 분석된 구조화 데이터
     # 예시:
     # {
@@ -558,9 +638,11 @@ class FreelancerDocument(db.Model):
     # Timestamps
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    deleted_at = db.Column(db.DateTime, nullable=True, index=True)  # 삭제 표시 (파일은 GC가 정리)
 
     # Relationships
-    freelancer = db.relationship('Freelancer', backref='documents')
+    # 프리랜서 삭제 시 문서 레코드도 삭제 (파일은 GC가 정리)
+    freelancer = db.relationship('Freelancer', backref=db.backref('documents', cascade='all, delete-orphan'))
 
     def __repr__(self):
         return f'<FreelancerDocument {self.id} - {self.document_type}>'
@@ -573,6 +655,7 @@ class FreelancerDocument(db.Model):
             'originalFilename': self.original_filename,
             'fileSize': self.file_size,
             'mimeType': self.mime_type,
+            'contentHash': self.content_hash,
             'isAnalyzed': self.is_analyzed,
             'analysisError': self.analysis_error,
             'extractedData': self.extracted_data,
@@ -584,3 +667,26 @@ class FreelancerDocument(db.Model):
             data['extractedText'] = self.extracted_text
 
         return data
+
+
+
+class DocumentExtractionCache(db.Model):
+    """문서 텍스트 추출 캐시 - 파일 내용 해시 + 추출기 버전 기준 (동일 파일은 한 번만 파싱)"""
+    __tablename__ = 'document_extraction_cache'
+
+    id = db.Column(db.String(36), primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)  # 파일 내용 SHA-256
+    file_format = db.Column(db.String(10), nullable=False)  # txt, md, docx, pdf, xlsx
+    extractor_version = db.Column(db.Integer, nullable=False)  # FileService.EXTRACTOR_VERSION
+    extracted_text = db.Column(CompressedText, nullable=False)  # 압축 저장
+    extraction_meta = db.Column(db.JSON, nullable=True)  # 추출 메타데이터 (PDF 페이지 수, 잘림 사유 등)
+
+    # Timestamps
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('content_hash', 'file_format', 'extractor_version', name='uq_extraction_cache_key'),
+    )
+
+    def __repr__(self):
+        return f'<DocumentExtractionCache {self.content_hash[:12]} v{self.extractor_version}>'
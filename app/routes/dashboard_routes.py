@@ -0,0 +1,19 @@
+"""
+Dashboard API Routes
+대시보드 통계 API 엔드포인트
+"""
+from flask import Blueprint
+from app.services import DashboardService
+from app.utils import handle_error, handle_success
+
+bp = Blueprint('dashboard', __name__, url_prefix='/api/dashboard')
+
+
+@bp.route('/stats', methods=['GET'])
+def get_dashboard_stats():
+    """대시보드 통계 (전체 통계 / 시장 분석 / 경력별 분포, 캐시)"""
+    try:
+        stats = DashboardService.get_stats()
+        return handle_success(stats, '대시보드 통계 조회 성공', 200)
+    except Exception as e:
+        return handle_error(str(e), 400)
@@ -2,9 +2,10 @@
 Freelancer Routes (CRUD API)
 """
 import os
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, send_file
 from marshmallow import ValidationError
 from app.services import FreelancerService, FreelancerDocumentService
+from app.services.upload_service import ChunkedUploadService
 from app.schemas import (
     FreelancerSchema,
     FreelancerCreateSchema,
@@ -12,6 +13,9 @@ from app.schemas import (
     SkillSchema,
 )
 from app.utils import handle_success, handle_error
+from app.instrumentation import query_budget
+from app.db import db, pool_metrics, replica_bind_keys
+from app.write_queue import write_queue
 
 # Blueprint 생성
 bp = Blueprint('freelancer', __name__, url_prefix='/api/freelancers')
@@ -26,6 +30,7 @@ skills_schema = SkillSchema(many=True)
 
 
 @bp.route('', methods=['GET'])
+@query_budget(14)
 def list_freelancers():
     """프리랜서 목록 조회"""
     try:
@@ -70,6 +75,7 @@ def list_freelancers():
 
 
 @bp.route('/<freelancer_id>', methods=['GET'])
+@query_budget(8)
 def get_freelancer(freelancer_id):
     """프리랜서 상세 조회"""
     try:
@@ -83,6 +89,7 @@ def get_freelancer(freelancer_id):
 
 
 @bp.route('', methods=['POST'])
+@query_budget(13)
 def create_freelancer():
     """프리랜서 생성"""
     try:
@@ -103,6 +110,7 @@ def create_freelancer():
 
 
 @bp.route('/<freelancer_id>', methods=['PUT'])
+@query_budget(14)
 def update_freelancer(freelancer_id):
     """프리랜서 정보 수정"""
     try:
@@ -123,6 +131,7 @@ def update_freelancer(freelancer_id):
 
 
 @bp.route('/<freelancer_id>', methods=['DELETE'])
+@query_budget(27)
 def delete_freelancer(freelancer_id):
     """프리랜서 삭제"""
     try:
@@ -135,7 +144,23 @@ def delete_freelancer(freelancer_id):
         return handle_error(f'서버 오류: {str(e)}', 500)
 
 
+@bp.route('/match', methods=['POST'])
+@query_budget(15)
+def match_freelancers():
+    """프로젝트 조건에 맞는 프리랜서 추천 (점수 상위 N명)"""
+    try:
+        data = request.get_json() or {}
+        result = FreelancerService.match(data)
+        return handle_success(result, '프리랜서 매칭 성공', 200)
+
+    except ValueError as e:
+        return handle_error(str(e), 400)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
 @bp.route('/skills', methods=['GET'])
+@query_budget(3)
 def get_skills():
     """전체 스킬 목록 조회"""
     try:
@@ -149,6 +174,7 @@ def get_skills():
 # ==================== Document Upload Routes ====================
 
 @bp.route('/<freelancer_id>/documents', methods=['POST'])
+@query_budget(14)
 def upload_document(freelancer_id):
     """프리랜서 문서 업로드 및 분석"""
     try:
@@ -185,7 +211,101 @@ def upload_document(freelancer_id):
         return handle_error(f'서버 오류: {str(e)}', 500)
 
 
+# ==================== Chunked Upload Routes ====================
+
+def _chunk_root():
+    """분할 업로드 청크 저장 디렉토리"""
+    return os.path.join(current_app.config['UPLOAD_FOLDER'], 'chunks')
+
+
+@bp.route('/<freelancer_id>/documents/uploads', methods=['POST'])
+@query_budget(3)
+def init_chunked_upload(freelancer_id):
+    """분할 업로드 시작 (filename, fileSize, documentType, sha256)"""
+    try:
+        result = ChunkedUploadService.init_upload(
+            freelancer_id=freelancer_id,
+            data=request.get_json() or {},
+            chunk_root=_chunk_root()
+        )
+        return handle_success(result, '분할 업로드 시작', 201)
+
+    except ValueError as e:
+        return handle_error(str(e), 404 if '찾을 수 없습니다' in str(e) else 400)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
+@bp.route('/documents/uploads/<upload_id>/chunks/<int:index>', methods=['PUT'])
+@query_budget(2)
+def put_upload_chunk(upload_id, index):
+    """청크 업로드 (요청 본문 = 청크 바이트, 메모리에 올리지 않고 파일로 스트리밍)"""
+    try:
+        result = ChunkedUploadService.put_chunk(
+            upload_id=upload_id,
+            index=index,
+            stream=request.stream,
+            content_length=request.content_length,
+            chunk_root=_chunk_root()
+        )
+        return handle_success(result, '청크 업로드 완료', 200)
+
+    except ValueError as e:
+        return handle_error(str(e), 404 if '찾을 수 없습니다' in str(e) else 400)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
+@bp.route('/documents/uploads/<upload_id>', methods=['GET'])
+@query_budget(2)
+def get_upload_status(upload_id):
+    """분할 업로드 상태 조회 (받은 청크 / 남은 청크)"""
+    try:
+        result = ChunkedUploadService.get_status(upload_id, _chunk_root())
+        return handle_success(result, '업로드 상태 조회 성공', 200)
+
+    except ValueError as e:
+        return handle_error(str(e), 404)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
+@bp.route('/documents/uploads/<upload_id>/complete', methods=['POST'])
+@query_budget(11)
+def complete_chunked_upload(upload_id):
+    """분할 업로드 완료 - 병합, 해시 검증, 문서 분석"""
+    try:
+        data = request.get_json(silent=True) or {}
+        result = FreelancerDocumentService.complete_chunked_upload(
+            upload_id=upload_id,
+            sha256=data.get('sha256'),
+            chunk_root=_chunk_root(),
+            upload_dir_root=os.path.join(current_app.config['UPLOAD_FOLDER'], 'freelancer')
+        )
+        return handle_success(result, '문서 업로드 및 분석 완료', 201)
+
+    except ValueError as e:
+        return handle_error(str(e), 404 if '찾을 수 없습니다' in str(e) else 400)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
+@bp.route('/documents/uploads/<upload_id>', methods=['DELETE'])
+@query_budget(2)
+def abort_chunked_upload(upload_id):
+    """분할 업로드 취소"""
+    try:
+        ChunkedUploadService.abort(upload_id, _chunk_root())
+        return handle_success(None, '분할 업로드 취소', 200)
+
+    except ValueError as e:
+        return handle_error(str(e), 404)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
 @bp.route('/<freelancer_id>/documents', methods=['GET'])
+@query_budget(4)
 def get_documents(freelancer_id):
     """프리랜서 문서 목록 조회"""
     try:
@@ -206,7 +326,34 @@ def get_documents(freelancer_id):
         return handle_error(f'서버 오류: {str(e)}', 500)
 
 
+@bp.route('/documents/search', methods=['GET'])
+@query_budget(3)
+def search_documents():
+    """문서 전문 검색 (이력서/포트폴리오 추출 텍스트)"""
+    try:
+        query = request.args.get('q', '')
+        document_type = request.args.get('documentType', None)
+        limit = request.args.get('limit', 50, type=int)
+
+        if limit < 1 or limit > 200:
+            limit = 50
+
+        result = FreelancerDocumentService.search_documents(
+            query=query,
+            document_type=document_type,
+            limit=limit
+        )
+
+        return handle_success(result, '문서 검색 성공', 200)
+
+    except ValueError as e:
+        return handle_error(str(e), 400)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
 @bp.route('/documents/<document_id>', methods=['GET'])
+@query_budget(4)
 def get_document(document_id):
     """문서 상세 조회"""
     try:
@@ -219,7 +366,39 @@ def get_document(document_id):
         return handle_error(f'서버 오류: {str(e)}', 500)
 
 
+@bp.route('/documents/<document_id>/content', methods=['GET'])
+@query_budget(3)
+def get_document_content(document_id):
+    """문서 원본 파일 다운로드 (Range / If-None-Match 지원, ETag = 내용 해시)"""
+    try:
+        document = FreelancerDocumentService.get_document_file(document_id)
+
+        # conditional=True: Range(206), If-None-Match / If-Modified-Since(304) 처리
+        # 파일 본문은 wsgi.file_wrapper 로 전달되어 gunicorn 에서는 sendfile 로 전송됨
+        response = send_file(
+            os.path.abspath(document.file_path),
+            mimetype=document.mime_type,
+            as_attachment=request.args.get('download', type=int) == 1,
+            download_name=document.original_filename,
+            conditional=True,
+            etag=document.content_hash,
+            max_age=current_app.config['DOCUMENT_CACHE_MAX_AGE'],
+        )
+        # 이력서 등 개인 문서 → 공유 캐시(프록시/CDN)에는 저장하지 않음
+        response.cache_control.public = False
+        response.cache_control.private = True
+        # PDF 뷰어(pdf.js 등)는 이 헤더를 보고 필요한 구간만 Range 로 요청
+        response.accept_ranges = 'bytes'
+        return response
+
+    except ValueError as e:
+        return handle_error(str(e), 404)
+    except Exception as e:
+        return handle_error(f'서버 오류: {str(e)}', 500)
+
+
 @bp.route('/documents/<document_id>', methods=['DELETE'])
+@query_budget(5)
 def delete_document(document_id):
     """문서 삭제"""
     try:
@@ -233,6 +412,7 @@ def delete_document(document_id):
 
 
 @bp.route('/documents/<document_id>/re-analyze', methods=['POST'])
+@query_budget(11)
 def re_analyze_document(document_id):
     """문서 재분석"""
     try:
@@ -247,6 +427,15 @@ def re_analyze_document(document_id):
 
 # Health check endpoint
 @bp.route('/health', methods=['GET'])
+@query_budget(2)
 def health():
-    """헬스 체크"""
-    return jsonify({'status': 'ok', 'message': 'Freelancer API is running'}), 200
+    """헬스 체크 (DB 커넥션 풀 상태 / checkout 대기 지표 포함)"""
+    return jsonify({
+        'status': 'ok',
+        'message': 'Freelancer API is running',
+        'database': {
+            'pool': pool_metrics.snapshot(db.engine.pool),
+            'writeQueue': write_queue.stats(),
+            'readReplicas': replica_bind_keys(),
+        },
+    }), 200
@@ -6,9 +6,10 @@ from flask import Blueprint, request
 from app.services import (
     InterviewCategoryService, InterviewQuestionService,
     InterviewCheckpointService, InterviewRedFlagService,
-    InterviewEvaluationService
+    InterviewEvaluationService, InterviewAnalyticsService
 )
 from app.utils import handle_error, handle_success
+from app.instrumentation import query_budget
 import uuid
 
 bp = Blueprint('interview', __name__, url_prefix='/api/interviews')
@@ -17,6 +18,7 @@ bp = Blueprint('interview', __name__, url_prefix='/api/interviews')
 # ==================== Interview Category Endpoints ====================
 
 @bp.route('/categories', methods=['GET'])
+@query_budget(4)
 def get_categories():
     """면접 카테고리 목록 조회"""
     try:
@@ -36,6 +38,7 @@ def get_categories():
 
 
 @bp.route('/categories/<category_id>', methods=['GET'])
+@query_budget(3)
 def get_category(category_id):
     """카테고리 조회"""
     try:
@@ -48,6 +51,7 @@ def get_category(category_id):
 
 
 @bp.route('/categories', methods=['POST'])
+@query_budget(5)
 def create_category():
     """카테고리 생성"""
     try:
@@ -70,6 +74,7 @@ def create_category():
 
 
 @bp.route('/categories/<category_id>', methods=['PUT'])
+@query_budget(5)
 def update_category(category_id):
     """카테고리 수정"""
     try:
@@ -83,6 +88,7 @@ def update_category(category_id):
 
 
 @bp.route('/categories/<category_id>', methods=['DELETE'])
+@query_budget(9)
 def delete_category(category_id):
     """카테고리 삭제"""
     try:
@@ -97,6 +103,7 @@ def delete_category(category_id):
 # ==================== Interview Question Endpoints ====================
 
 @bp.route('/categories/<category_id>/questions', methods=['GET'])
+@query_budget(4)
 def get_questions(category_id):
     """카테고리별 질문 조회"""
     try:
@@ -112,6 +119,7 @@ def get_questions(category_id):
 
 
 @bp.route('/questions', methods=['POST'])
+@query_budget(5)
 def create_question():
     """질문 생성"""
     try:
@@ -132,6 +140,7 @@ def create_question():
 
 
 @bp.route('/questions/<question_id>', methods=['PUT'])
+@query_budget(4)
 def update_question(question_id):
     """질문 수정"""
     try:
@@ -145,6 +154,7 @@ def update_question(question_id):
 
 
 @bp.route('/questions/<question_id>', methods=['DELETE'])
+@query_budget(4)
 def delete_question(question_id):
     """질문 삭제"""
     try:
@@ -159,6 +169,7 @@ def delete_question(question_id):
 # ==================== Interview Checkpoint Endpoints ====================
 
 @bp.route('/categories/<category_id>/checkpoints', methods=['GET'])
+@query_budget(4)
 def get_checkpoints(category_id):
     """카테고리별 체크포인트 조회"""
     try:
@@ -174,6 +185,7 @@ def get_checkpoints(category_id):
 
 
 @bp.route('/checkpoints', methods=['POST'])
+@query_budget(5)
 def create_checkpoint():
     """체크포인트 생성"""
     try:
@@ -194,6 +206,7 @@ def create_checkpoint():
 
 
 @bp.route('/checkpoints/<checkpoint_id>', methods=['PUT'])
+@query_budget(4)
 def update_checkpoint(checkpoint_id):
     """체크포인트 수정"""
     try:
@@ -207,6 +220,7 @@ def update_checkpoint(checkpoint_id):
 
 
 @bp.route('/checkpoints/<checkpoint_id>', methods=['DELETE'])
+@query_budget(5)
 def delete_checkpoint(checkpoint_id):
     """체크포인트 삭제"""
     try:
@@ -221,6 +235,7 @@ def delete_checkpoint(checkpoint_id):
 # ==================== Interview Red Flag Endpoints ====================
 
 @bp.route('/categories/<category_id>/red-flags', methods=['GET'])
+@query_budget(4)
 def get_red_flags(category_id):
     """카테고리별 레드플래그 조회"""
     try:
@@ -236,6 +251,7 @@ def get_red_flags(category_id):
 
 
 @bp.route('/red-flags', methods=['POST'])
+@query_budget(5)
 def create_red_flag():
     """레드플래그 생성"""
     try:
@@ -257,6 +273,7 @@ def create_red_flag():
 
 
 @bp.route('/red-flags/<red_flag_id>', methods=['PUT'])
+@query_budget(5)
 def update_red_flag(red_flag_id):
     """레드플래그 수정"""
     try:
@@ -270,6 +287,7 @@ def update_red_flag(red_flag_id):
 
 
 @bp.route('/red-flags/<red_flag_id>', methods=['DELETE'])
+@query_budget(5)
 def delete_red_flag(red_flag_id):
     """레드플래그 삭제"""
     try:
@@ -284,6 +302,7 @@ def delete_red_flag(red_flag_id):
 # ==================== Interview Evaluation Endpoints ====================
 
 @bp.route('/evaluations', methods=['GET'])
+@query_budget(7)
 def get_evaluations():
     """평가 목록 조회"""
     try:
@@ -306,10 +325,11 @@ def get_evaluations():
 
 
 @bp.route('/evaluations/<evaluation_id>', methods=['GET'])
+@query_budget(6)
 def get_evaluation(evaluation_id):
     """평가 조회"""
     try:
-        evaluation = InterviewEvaluationService.get_by_id(evaluation_id)
+        evaluation = InterviewEvaluationService.get_by_id(evaluation_id, with_details=True)
         return handle_success(evaluation.to_dict(), '평가 조회 성공', 200)
     except ValueError as e:
         return handle_error(str(e), 404)
@@ -318,6 +338,7 @@ def get_evaluation(evaluation_id):
 
 
 @bp.route('/evaluations', methods=['POST'])
+@query_budget(8)
 def create_evaluation():
     """평가 생성"""
     try:
@@ -340,6 +361,7 @@ def create_evaluation():
 
 
 @bp.route('/evaluations/<evaluation_id>', methods=['PUT'])
+@query_budget(7)
 def update_evaluation(evaluation_id):
     """평가 수정"""
     try:
@@ -353,6 +375,7 @@ def update_evaluation(evaluation_id):
 
 
 @bp.route('/evaluations/<evaluation_id>', methods=['DELETE'])
+@query_budget(17)
 def delete_evaluation(evaluation_id):
     """평가 삭제"""
     try:
@@ -367,6 +390,7 @@ def delete_evaluation(evaluation_id):
 # ==================== Category Score Endpoints ====================
 
 @bp.route('/evaluations/<evaluation_id>/category-scores', methods=['POST'])
+@query_budget(9)
 def add_category_score(evaluation_id):
     """카테고리 점수 추가"""
     try:
@@ -389,6 +413,7 @@ def add_category_score(evaluation_id):
 
 
 @bp.route('/evaluations/<evaluation_id>/category-scores/<category_id>', methods=['PUT'])
+@query_budget(11)
 def update_category_score(evaluation_id, category_id):
     """카테고리 점수 수정"""
     try:
@@ -413,6 +438,7 @@ def update_category_score(evaluation_id, category_id):
 # ==================== Checkpoint Result Endpoints ====================
 
 @bp.route('/evaluations/<evaluation_id>/checkpoint-results', methods=['POST'])
+@query_budget(8)
 def add_checkpoint_result(evaluation_id):
     """체크포인트 결과 추가"""
     try:
@@ -434,6 +460,7 @@ def add_checkpoint_result(evaluation_id):
 
 
 @bp.route('/evaluations/<evaluation_id>/checkpoint-results/<checkpoint_id>', methods=['PUT'])
+@query_budget(6)
 def update_checkpoint_result(evaluation_id, checkpoint_id):
     """체크포인트 결과 수정"""
     try:
@@ -454,6 +481,7 @@ def update_checkpoint_result(evaluation_id, checkpoint_id):
 # ==================== Red Flag Finding Endpoints ====================
 
 @bp.route('/evaluations/<evaluation_id>/red-flag-findings', methods=['POST'])
+@query_budget(11)
 def add_red_flag_finding(evaluation_id):
     """레드플래그 발견 추가"""
     try:
@@ -476,6 +504,7 @@ def add_red_flag_finding(evaluation_id):
 
 
 @bp.route('/evaluations/<evaluation_id>/red-flag-findings/<red_flag_id>', methods=['PUT'])
+@query_budget(11)
 def update_red_flag_finding(evaluation_id, red_flag_id):
     """레드플래그 발견 수정"""
     try:
@@ -497,6 +526,7 @@ def update_red_flag_finding(evaluation_id, red_flag_id):
 # ==================== Score Calculation Endpoints ====================
 
 @bp.route('/evaluations/<evaluation_id>/calculate-score', methods=['POST'])
+@query_budget(6)
 def calculate_total_score(evaluation_id):
     """총점 계산 및 저장"""
     try:
@@ -513,6 +543,7 @@ def calculate_total_score(evaluation_id):
 
 
 @bp.route('/evaluations/<evaluation_id>/set-recommendation', methods=['POST'])
+@query_budget(12)
 def set_recommendation(evaluation_id):
     """추천 여부 설정"""
     try:
@@ -530,3 +561,41 @@ def set_recommendation(evaluation_id):
         return handle_error(str(e), 400)
     except Exception as e:
         return handle_error(str(e), 400)
+
+
+# ==================== Analytics Endpoints ====================
+
+@bp.route('/analytics/category-scores', methods=['GET'])
+@query_budget(3)
+def get_category_score_analytics():
+    """카테고리별 점수 분포 (집계 테이블)"""
+    try:
+        stats = InterviewAnalyticsService.get_category_score_stats()
+        return handle_success({'items': stats, 'total': len(stats)}, '카테고리 점수 분석 조회 성공', 200)
+    except Exception as e:
+        return handle_error(str(e), 400)
+
+
+@bp.route('/analytics/red-flags', methods=['GET'])
+@query_budget(3)
+def get_red_flag_analytics():
+    """가장 많이 발견되는 레드플래그 (집계 테이블)"""
+    try:
+        category_id = request.args.get('categoryId', None)
+        limit = min(request.args.get('limit', 50, type=int), 500)
+
+        stats = InterviewAnalyticsService.get_red_flag_stats(category_id=category_id, limit=limit)
+        return handle_success({'items': stats, 'total': len(stats)}, '레드플래그 분석 조회 성공', 200)
+    except Exception as e:
+        return handle_error(str(e), 400)
+
+
+@bp.route('/analytics/rebuild', methods=['POST'])
+@query_budget(8)
+def rebuild_analytics():
+    """집계 테이블 전체 재계산 (원본 평가 데이터 기준)"""
+    try:
+        result = InterviewAnalyticsService.rebuild()
+        return handle_success(result, '면접 분석 집계 재계산 완료', 200)
+    except Exception as e:
+        return handle_error(str(e), 400)
@@ -7,12 +7,14 @@ from app.services.interview_service import (
     InterviewCheckpointService, InterviewRedFlagService,
     InterviewEvaluationService
 )
+from app.services.analytics_service import InterviewAnalyticsService
+from app.services.dashboard_service import DashboardService
 from app.services.file_service import FileService, ResumeAnalyzer, PortfolioAnalyzer
 
 __all__ = [
     'FreelancerService', 'FreelancerDocumentService',
     'InterviewCategoryService', 'InterviewQuestionService',
     'InterviewCheckpointService', 'InterviewRedFlagService',
-    'InterviewEvaluationService',
+    'InterviewEvaluationService', 'InterviewAnalyticsService', 'DashboardService',
     'FileService', 'ResumeAnalyzer', 'PortfolioAnalyzer'
 ]
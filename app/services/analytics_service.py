@@ -0,0 +1,222 @@
+"""
+면접 평가 분석 서비스
+- 카테고리별 점수 분포 / 레드플래그 발견 빈도를 집계 테이블에 유지
+- 평가 쓰기 경로(InterviewEvaluationService)에서 변경분만 증감 → 같은 트랜잭션에서 커밋
+- 조회는 집계 테이블(카테고리 / 레드플래그 수만큼의 행)만 읽음
+- 집계가 어긋났을 때는 rebuild 로 원본에서 다시 계산
+"""
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy.orm import contains_eager
+
+from app.db import db
+from app.models import (
+    InterviewCategory, InterviewRedFlag,
+    InterviewCategoryScore, InterviewRedFlagFinding,
+    InterviewCategoryScoreStat, InterviewRedFlagStat
+)
+
+SCORE_COLUMNS = {
+    1.0: 'score_1_count',
+    3.0: 'score_3_count',
+    5.0: 'score_5_count',
+}
+
+SEVERITY_COLUMNS = {
+    'low': 'severity_low_count',
+    'medium': 'severity_medium_count',
+    'high': 'severity_high_count',
+    'critical': 'severity_critical_count',
+}
+
+
+class InterviewAnalyticsService:
+    """면접 평가 집계 테이블 갱신 및 조회"""
+
+    # ==================== 증분 갱신 (커밋은 호출한 쪽에서) ====================
+
+    @staticmethod
+    def apply_category_score(category_id: str, score: float, checked_count: Optional[int], sign: int = 1):
+        """카테고리 점수 한 건 반영 (sign=-1 이면 제거)"""
+        InterviewAnalyticsService._increment(
+            InterviewCategoryScoreStat, 'category_id', category_id,
+            InterviewAnalyticsService._category_score_deltas(score, checked_count, sign)
+        )
+
+    @staticmethod
+    def apply_red_flag_finding(red_flag_id: str, is_found: bool, severity_actual: Optional[str], sign: int = 1):
+        """레드플래그 발견 한 건 반영 (sign=-1 이면 제거)"""
+        InterviewAnalyticsService._increment(
+            InterviewRedFlagStat, 'red_flag_id', red_flag_id,
+            InterviewAnalyticsService._red_flag_deltas(is_found, severity_actual, sign)
+        )
+
+    @staticmethod
+    def remove_evaluations(evaluation_ids: Iterable[str]):
+        """삭제될 평가들의 점수 / 발견을 집계에서 제거 (평가 삭제 전에 호출)"""
+        evaluation_ids = list(evaluation_ids)
+        if not evaluation_ids:
+            return
+
+        # 카테고리 / 레드플래그별로 합산해 키마다 한 번만 갱신 (평가 수와 무관한 쿼리 수)
+        category_deltas: Dict[str, Dict[str, Any]] = {}
+        scores = InterviewCategoryScore.query.filter(
+            InterviewCategoryScore.evaluation_id.in_(evaluation_ids)
+        ).all()
+        for score in scores:
+            _merge_deltas(category_deltas.setdefault(score.category_id, {}),
+                          InterviewAnalyticsService._category_score_deltas(score.score, score.checked_count, -1))
+        InterviewAnalyticsService._increment_many(InterviewCategoryScoreStat, 'category_id', category_deltas)
+
+        red_flag_deltas: Dict[str, Dict[str, Any]] = {}
+        findings = InterviewRedFlagFinding.query.filter(
+            InterviewRedFlagFinding.evaluation_id.in_(evaluation_ids)
+        ).all()
+        for finding in findings:
+            _merge_deltas(red_flag_deltas.setdefault(finding.red_flag_id, {}),
+                          InterviewAnalyticsService._red_flag_deltas(finding.is_found, finding.severity_actual, -1))
+        InterviewAnalyticsService._increment_many(InterviewRedFlagStat, 'red_flag_id', red_flag_deltas)
+
+    @staticmethod
+    def remove_category(category_id: str):
+        """카테고리 삭제 시 카테고리와 소속 레드플래그의 집계 행 삭제"""
+        red_flag_ids = db.session.query(InterviewRedFlag.id).filter_by(category_id=category_id)
+        db.session.execute(db.delete(InterviewRedFlagStat).where(InterviewRedFlagStat.red_flag_id.in_(red_flag_ids)))
+        db.session.execute(db.delete(InterviewCategoryScoreStat).where(
+            InterviewCategoryScoreStat.category_id == category_id
+        ))
+
+    @staticmethod
+    def remove_red_flag(red_flag_id: str):
+        """레드플래그 삭제 시 집계 행 삭제"""
+        db.session.execute(db.delete(InterviewRedFlagStat).where(InterviewRedFlagStat.red_flag_id == red_flag_id))
+
+    @staticmethod
+    def _category_score_deltas(score: float, checked_count: Optional[int], sign: int) -> Dict[str, Any]:
+        deltas = {
+            'score_count': sign,
+            'score_sum': sign * score,
+            'checked_sum': sign * (checked_count or 0),
+        }
+        if score in SCORE_COLUMNS:
+            deltas[SCORE_COLUMNS[score]] = sign
+        return deltas
+
+    @staticmethod
+    def _red_flag_deltas(is_found: bool, severity_actual: Optional[str], sign: int) -> Dict[str, Any]:
+        deltas = {'finding_count': sign}
+        if is_found:
+            deltas['found_count'] = sign
+            if severity_actual in SEVERITY_COLUMNS:
+                deltas[SEVERITY_COLUMNS[severity_actual]] = sign
+        return deltas
+
+    @staticmethod
+    def _increment(model, key_column: str, key: str, deltas: Dict[str, Any]):
+        """집계 행이 없으면 0으로 만들고 컬럼별로 원자적 증감 (동시 평가 저장에도 값이 유실되지 않음)"""
+        InterviewAnalyticsService._increment_many(model, key_column, {key: deltas})
+
+    @staticmethod
+    def _increment_many(model, key_column: str, deltas_by_key: Dict[str, Dict[str, Any]]):
+        """키 여러 개를 한 번에 증감 (INSERT / UPDATE 각각 executemany 한 번)"""
+        if not deltas_by_key:
+            return
+        table = model.__table__
+        columns = sorted({column for deltas in deltas_by_key.values() for column in deltas})
+        db.session.execute(
+            db.insert(table).prefix_with('OR IGNORE', dialect='sqlite').prefix_with('IGNORE', dialect='mysql'),
+            [{key_column: key} for key in deltas_by_key]
+        )
+        db.session.execute(
+            db.update(table).where(table.c[key_column] == db.bindparam('stat_key')).values({
+                column: table.c[column] + db.bindparam(f'delta_{column}') for column in columns
+            }),
+            [
+                {'stat_key': key, **{f'delta_{column}': deltas.get(column, 0) for column in columns}}
+                for key, deltas in deltas_by_key.items()
+            ]
+        )
+
+    # ==================== 조회 ====================
+
+    @staticmethod
+    def get_category_score_stats() -> List[Dict[str, Any]]:
+        """카테고리별 점수 분포 (카테고리 순서대로)"""
+        stats = InterviewCategoryScoreStat.query.join(InterviewCategory).options(
+            contains_eager(InterviewCategoryScoreStat.category)  # 이미 조인한 카테고리로 이름 채움 (행마다 조회 X)
+        ).filter(
+            InterviewCategoryScoreStat.score_count > 0
+        ).order_by(InterviewCategory.order).all()
+        return [stat.to_dict() for stat in stats]
+
+    @staticmethod
+    def get_red_flag_stats(category_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """가장 많이 발견되는 레드플래그 (발견 건수 순)"""
+        query = InterviewRedFlagStat.query.join(InterviewRedFlag).options(
+            contains_eager(InterviewRedFlagStat.red_flag)
+        ).filter(InterviewRedFlagStat.finding_count > 0)
+        if category_id:
+            query = query.filter(InterviewRedFlag.category_id == category_id)
+        stats = query.order_by(
+            InterviewRedFlagStat.found_count.desc(),
+            InterviewRedFlagStat.finding_count.desc(),
+            InterviewRedFlagStat.red_flag_id
+        ).limit(limit).all()
+        return [stat.to_dict() for stat in stats]
+
+    # ==================== 재계산 ====================
+
+    @staticmethod
+    def rebuild() -> Dict[str, int]:
+        """원본 점수 / 발견 이력에서 집계 테이블 전체 재계산"""
+        db.session.execute(db.delete(InterviewCategoryScoreStat))
+        db.session.execute(db.delete(InterviewRedFlagStat))
+
+        score = InterviewCategoryScore
+        score_columns = [
+            score.category_id,
+            db.func.count(score.id),
+            db.func.coalesce(db.func.sum(score.score), 0.0),
+            *[db.func.sum(db.case((score.score == value, 1), else_=0)) for value in SCORE_COLUMNS],
+            db.func.coalesce(db.func.sum(score.checked_count), 0),
+        ]
+        db.session.execute(db.insert(InterviewCategoryScoreStat).from_select(
+            ['category_id', 'score_count', 'score_sum', *SCORE_COLUMNS.values(), 'checked_sum'],
+            db.select(*score_columns).join(InterviewCategory, InterviewCategory.id == score.category_id)
+            .group_by(score.category_id)
+        ))
+
+        finding = InterviewRedFlagFinding
+        found = finding.is_found.is_(True)
+        finding_columns = [
+            finding.red_flag_id,
+            db.func.count(finding.id),
+            db.func.sum(db.case((found, 1), else_=0)),
+            *[db.func.sum(db.case((db.and_(found, finding.severity_actual == severity), 1), else_=0))
+              for severity in SEVERITY_COLUMNS],
+        ]
+        db.session.execute(db.insert(InterviewRedFlagStat).from_select(
+            ['red_flag_id', 'finding_count', 'found_count', *SEVERITY_COLUMNS.values()],
+            db.select(*finding_columns).join(InterviewRedFlag, InterviewRedFlag.id == finding.red_flag_id)
+            .group_by(finding.red_flag_id)
+        ))
+        db.session.commit()
+
+        return {
+            'categories': InterviewCategoryScoreStat.query.count(),
+            'redFlags': InterviewRedFlagStat.query.count(),
+        }
+
+    @staticmethod
+    def ensure_stats():
+        """집계 테이블이 비어 있는데 평가 이력이 있으면 (최초 배포) 재계산"""
+        if InterviewCategoryScoreStat.query.first() or InterviewRedFlagStat.query.first():
+            return
+        if InterviewCategoryScore.query.first() or InterviewRedFlagFinding.query.first():
+            result = InterviewAnalyticsService.rebuild()
+            print(f'✅ 면접 분석 집계 생성 완료 (카테고리 {result["categories"]}개, 레드플래그 {result["redFlags"]}개)')
+
+
+def _merge_deltas(target: Dict[str, Any], deltas: Dict[str, Any]):
+    for column, delta in deltas.items():
+        target[column] = target.get(column, 0) + delta
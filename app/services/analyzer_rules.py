@@ -0,0 +1,210 @@
+"""
+문서 분석 규칙 엔진
+- 모든 정규식은 모듈 로드 시 한 번만 컴파일
+- 줄 분리, 키워드 매칭 등 텍스트 전처리는 문서당 한 번만 수행해 모든 추출기가 공유
+"""
+import re
+import time
+from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.keyword_matcher import SkillMatcher, KIND_SKILL, KIND_LANGUAGE
+
+
+def _unique(items):
+    """순서를 유지한 중복 제거"""
+    return list(dict.fromkeys(items))
+
+
+class AnalyzedText:
+    """분석 대상 텍스트 - 정규화 결과를 캐시해 추출기 간 공유"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def lines(self) -> List[str]:
+        return self.text.split('\n')
+
+    @cached_property
+    def keyword_matches(self):
+        """스킬/언어 키워드 매칭 결과 (Aho-Corasick 한 번 순회)"""
+        return SkillMatcher.get().find(self.text)
+
+
+# ==================== Rules ====================
+
+class ExtractionRule(ABC):
+    """추출 규칙 기본 클래스"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @abstractmethod
+    def extract(self, doc: AnalyzedText) -> Any:
+        """문서에서 이 규칙의 값을 추출"""
+
+
+class FirstMatchRule(ExtractionRule):
+    """패턴을 순서대로 시도해 첫 매칭 그룹을 변환해 반환"""
+
+    def __init__(self, name: str, patterns: List[str], convert: Callable = str, flags: int = 0):
+        super().__init__(name)
+        self.patterns = [re.compile(p, flags) for p in patterns]
+        self.convert = convert
+
+    def extract(self, doc):
+        for pattern in self.patterns:
+            match = pattern.search(doc.text)
+            if match:
+                return self.convert(match.group(1))
+        return None
+
+
+class FindAllRule(ExtractionRule):
+    """모든 패턴의 매칭 결과를 모아 중복 제거"""
+
+    def __init__(self, name: str, patterns: List[str], flags: int = 0,
+                 strip: bool = False, limit: Optional[int] = None):
+        super().__init__(name)
+        self.patterns = [re.compile(p, flags) for p in patterns]
+        self.strip = strip
+        self.limit = limit
+
+    def extract(self, doc):
+        matches = []
+        for pattern in self.patterns:
+            matches.extend(pattern.findall(doc.text))
+
+        if self.strip:
+            matches = [m.strip() for m in matches if m.strip()]
+
+        matches = _unique(matches)
+        return matches[:self.limit] if self.limit is not None else matches
+
+
+class KeywordRule(ExtractionRule):
+    """키워드 매처 결과 중 한 종류 (skill / language) 반환"""
+
+    def __init__(self, name: str, kind: str):
+        super().__init__(name)
+        self.kind = kind
+
+    def extract(self, doc):
+        return SkillMatcher.split(doc.keyword_matches, self.kind)
+
+
+class SummaryRule(ExtractionRule):
+    """비어있지 않은 처음 N줄을 요약으로 사용"""
+
+    def __init__(self, name: str, max_lines: int = 3, max_chars: int = 500):
+        super().__init__(name)
+        self.max_lines = max_lines
+        self.max_chars = max_chars
+
+    def extract(self, doc):
+        summary_lines = []
+        for line in doc.lines:
+            stripped = line.strip()
+            if stripped:
+                summary_lines.append(stripped)
+                if len(summary_lines) >= self.max_lines:
+                    break
+
+        summary = ' '.join(summary_lines)
+        return summary[:self.max_chars] if summary else doc.text[:self.max_chars]
+
+
+class SectionRule(ExtractionRule):
+    """텍스트를 섹션으로 분할하고 섹션별 필드 추출 (포트폴리오 프로젝트)"""
+
+    def __init__(self, name: str, split_pattern: str, fields: List[Tuple[str, str, int, int]],
+                 required: str, limit: Optional[int] = None):
+        """fields: (필드명, 패턴, 그룹 번호, 플래그)"""
+        super().__init__(name)
+        self.split_pattern = re.compile(split_pattern)
+        self.fields = [(field, re.compile(p, flags), group) for field, p, group, flags in fields]
+        self.required = required
+        self.limit = limit
+
+    def extract(self, doc):
+        sections = []
+        for section in self.split_pattern.split(doc.text):
+            item = {}
+            for field, pattern, group in self.fields:
+                match = pattern.search(section)
+                if match:
+                    item[field] = match.group(group).strip()
+            if self.required in item:
+                sections.append(item)
+                if self.limit is not None and len(sections) >= self.limit:
+                    break
+        return sections
+
+
+class RuleSet:
+    """추출 규칙 묶음 - 문서 하나에 모든 규칙 적용"""
+
+    def __init__(self, rules: List[ExtractionRule]):
+        self.rules = rules
+
+    def __getitem__(self, name: str) -> ExtractionRule:
+        for rule in self.rules:
+            if rule.name == name:
+                return rule
+        raise KeyError(name)
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        doc = AnalyzedText(text)
+        return {rule.name: rule.extract(doc) for rule in self.rules}
+
+    def analyze_timed(self, text: str) -> Tuple[Dict[str, Any], Dict[str, float]]:
+        """분석 + 규칙별 소요 시간(초) - 벤치마크용"""
+        doc = AnalyzedText(text)
+        data, timings = {}, {}
+        for rule in self.rules:
+            started = time.perf_counter()
+            data[rule.name] = rule.extract(doc)
+            timings[rule.name] = time.perf_counter() - started
+        return data, timings
+
+
+# ==================== Rule Definitions ====================
+
+URL_PATTERN = r'https?://[^\s\n]+'
+
+RESUME_RULES = RuleSet([
+    KeywordRule('skills', KIND_SKILL),
+    # "X년 경력", "경력 X년", "X년 경험"
+    FirstMatchRule('experience_years', [
+        r'(\d+)\s*년\s*(?:경력|이상)',
+        r'경력\s*:?\s*(\d+)\s*년',
+        r'(\d+)\s*년\s*경험',
+    ], convert=int),
+    # 토큰 시작 위치에서만 시도 (토큰 중간에서 \S+ 재탐색하는 역추적 제거, 결과 동일)
+    FindAllRule('education', [
+        r'(?<!\S)(\S+(?:대학교|대학|학원))',
+        r'(?<!\S)(\S+\s+(?:University|College))',
+    ]),
+    FindAllRule('projects', [
+        r'(?:프로젝트|Project|프로젝명)\s*:?\s*([^\n]+)',
+        r'(?:담당|역할|주요)\s*(?:프로젝트|project)\s*[:-]?\s*([^\n]+)',
+    ], flags=re.IGNORECASE, strip=True, limit=5),
+    KeywordRule('languages', KIND_LANGUAGE),
+    FindAllRule('certifications', [
+        r'(?:자격증|certificate|license)\s*:?\s*([^\n]+)',
+        r'(?:취득|obtained|passed)\s*:?\s*([^\n]+)',
+    ], flags=re.IGNORECASE, strip=True, limit=5),
+    SummaryRule('summary'),
+])
+
+PORTFOLIO_RULES = RuleSet([
+    SectionRule('projects', r'\n(?=\d+\.|\-\s*[^\s])', [
+        ('title', r'^[^\n]+', 0, 0),
+        ('description', r'(?:설명|description)\s*:?\s*([^\n]+)', 1, re.IGNORECASE),
+        ('url', URL_PATTERN, 0, 0),
+    ], required='title', limit=10),
+    KeywordRule('technologies', KIND_SKILL),
+    FindAllRule('links', [URL_PATTERN], limit=10),
+])
@@ -0,0 +1,147 @@
+"""
+대시보드 통계 서비스 (sqldata/queries.sql 7. 대시보드 쿼리)
+- 전체 통계는 스칼라 서브쿼리 한 번, 시장 분석 + 경력별 분포는 프로필 GROUP BY 한 번 (총 2회 조회)
+- 결과는 프로세스 캐시에 보관: TTL 이 지나거나 관련 테이블이 바뀌면 이전 값을 반환하면서 백그라운드 재계산
+"""
+import os
+from datetime import datetime
+from typing import Any, Dict
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.cache import StaleWhileRevalidateCache
+from app.db import db
+from app.metrics import cache_requests
+from app.models import (
+    Freelancer, FreelancerProfile, Skill, PortfolioItem, Review,
+    InterviewEvaluation, FreelancerDocument
+)
+
+AVAILABILITY_LABELS = ['available', 'busy', 'unavailable']
+
+# (키, 표시명, 상한 경력 - 미만)
+EXPERIENCE_LEVELS = [
+    ('junior', 'Junior (< 2 years)', 2),
+    ('mid', 'Mid-Level (2-5 years)', 5),
+    ('senior', 'Senior (5-10 years)', 10),
+    ('expert', 'Expert (10+ years)', None),
+]
+
+# 변경되면 대시보드 수치가 달라지는 모델
+TRACKED_MODELS = (Freelancer, FreelancerProfile, Skill, PortfolioItem, Review, InterviewEvaluation, FreelancerDocument)
+
+CACHE_KEY = 'dashboard:stats'
+
+
+class DashboardService:
+    """대시보드 통계 조회 (캐시)"""
+
+    CACHE_TTL = float(os.getenv('DASHBOARD_CACHE_TTL', 60))  # 초
+    CACHE_MAX_STALE = float(os.getenv('DASHBOARD_CACHE_MAX_STALE', 3600))  # 이보다 오래된 값은 기다려서 새로 계산
+
+    cache = StaleWhileRevalidateCache(ttl=CACHE_TTL, max_stale=CACHE_MAX_STALE)
+
+    @staticmethod
+    def get_stats() -> Dict[str, Any]:
+        """대시보드 통계 (캐시 상태 포함)"""
+        app = current_app._get_current_object()
+
+        def load():
+            # 백그라운드 스레드에서도 실행되므로 앱 컨텍스트를 직접 열고 세션을 정리
+            with app.app_context():
+                try:
+                    return DashboardService.compute()
+                finally:
+                    db.session.remove()
+
+        stats, status = DashboardService.cache.get(CACHE_KEY, load)
+        cache_requests.labels('dashboard', 'stale' if status['stale'] else 'hit' if status['hit'] else 'miss').inc()
+        return {**stats, 'cache': status}
+
+    @staticmethod
+    def invalidate():
+        """다음 조회부터 이전 값을 반환하며 재계산"""
+        DashboardService.cache.invalidate(CACHE_KEY)
+
+    @staticmethod
+    def compute() -> Dict[str, Any]:
+        """전체 통계 / 시장 분석 / 경력별 분포 계산 (조회 2회)"""
+        def count(model, *criteria):
+            return db.select(db.func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+        overview = db.session.execute(db.select(
+            count(Freelancer).label('total_freelancers'),
+            count(Skill).label('total_skills'),
+            count(PortfolioItem).label('total_portfolio_items'),
+            count(Review).label('total_reviews'),
+            db.select(db.func.avg(Review.rating)).scalar_subquery().label('average_rating'),
+            count(InterviewEvaluation).label('total_evaluations'),
+            count(FreelancerDocument, FreelancerDocument.deleted_at.is_(None)).label('documents_uploaded'),
+        )).one()
+
+        level = db.case(
+            *[(FreelancerProfile.experience < upper, key) for key, _, upper in EXPERIENCE_LEVELS if upper],
+            else_=EXPERIENCE_LEVELS[-1][0]
+        )
+        groups = db.session.execute(
+            db.select(
+                FreelancerProfile.availability, level.label('level'),
+                db.func.count(FreelancerProfile.id), db.func.sum(FreelancerProfile.hourly_rate)
+            ).group_by(FreelancerProfile.availability, level)
+        ).all()
+
+        market = {availability: 0 for availability in AVAILABILITY_LABELS}
+        levels = {key: [0, 0] for key, _, _ in EXPERIENCE_LEVELS}  # [인원, 시급 합계]
+        for availability, key, freelancer_count, rate_sum in groups:
+            if availability in market:
+                market[availability] += freelancer_count
+            levels[key][0] += freelancer_count
+            levels[key][1] += rate_sum or 0
+
+        return {
+            'overview': {
+                'totalFreelancers': overview.total_freelancers,
+                'totalSkills': overview.total_skills,
+                'totalPortfolioItems': overview.total_portfolio_items,
+                'totalReviews': overview.total_reviews,
+                'averageRating': round(float(overview.average_rating), 2) if overview.average_rating is not None else None,
+                'totalEvaluations': overview.total_evaluations,
+                'documentsUploaded': overview.documents_uploaded,
+            },
+            'market': market,
+            'experienceDistribution': [
+                {
+                    'level': key,
+                    'label': label,
+                    'freelancerCount': levels[key][0],
+                    'avgHourlyRate': round(levels[key][1] / levels[key][0]) if levels[key][0] else None,
+                }
+                for key, label, _ in EXPERIENCE_LEVELS
+            ],
+            'generatedAt': datetime.utcnow().isoformat(),
+        }
+
+
+# 쓰기 감지: flush 시 세션에 표시 → 커밋이 끝난 뒤 무효화 (커밋 전 재계산으로 이전 값이 저장되지 않도록)
+def _mark_dashboard_dirty(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info['dashboard_dirty'] = True
+
+
+for _model in TRACKED_MODELS:
+    for _event_name in ('after_insert', 'after_update', 'after_delete'):
+        event.listen(_model, _event_name, _mark_dashboard_dirty)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_dashboard(session):
+    if session.info.pop('dashboard_dirty', False):
+        DashboardService.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _clear_dashboard_dirty(session):
+    session.info.pop('dashboard_dirty', None)
@@ -0,0 +1,169 @@
+"""
+문서 텍스트 추출 샌드박스
+- 추출은 재사용되는 자식 프로세스 풀에서 실행 (웹 워커는 결과만 기다림)
+- 형식별 wall-clock 타임아웃 + RLIMIT_AS 메모리 상한
+- 시간 초과 / 비정상 종료된 자식 프로세스는 강제 종료 후 다음 사용 시 새로 생성
+"""
+import os
+import sys
+import queue
+import atexit
+import threading
+import subprocess
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Optional
+
+from app.services.file_service import FileService
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORKER_COMMAND = 'from app.services.extraction_sandbox import worker_main; worker_main()'
+
+
+def _apply_memory_limit(memory_limit_mb: int):
+    """주소 공간 상한 설정 (초과 시 할당이 MemoryError로 실패)"""
+    try:
+        import resource
+    except ImportError:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def worker_main():
+    """자식 프로세스 진입점 - stdin 으로 파일 경로를 받아 stdout 으로 추출 결과 전송"""
+    conn_in = Connection(os.dup(0), writable=False)
+    conn_out = Connection(os.dup(1), readable=False)
+    # 추출 라이브러리의 print 출력이 프로토콜을 깨지 않도록 stdout 을 stderr 로 돌림
+    os.dup2(2, 1)
+    _apply_memory_limit(int(os.environ['EXTRACTION_MEMORY_LIMIT_MB']))
+
+    while True:
+        try:
+            file_path = conn_in.recv()
+        except EOFError:
+            break  # 부모 프로세스 종료
+        conn_out.send(FileService.extract_text_with_meta(file_path))
+
+
+class _Worker:
+    """추출 자식 프로세스 하나"""
+
+    def __init__(self, memory_limit_mb: int):
+        env = dict(os.environ, EXTRACTION_MEMORY_LIMIT_MB=str(memory_limit_mb))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get('PYTHONPATH')]))
+        self.process = subprocess.Popen(
+            [sys.executable, '-c', WORKER_COMMAND],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env
+        )
+        self._send = Connection(os.dup(self.process.stdin.fileno()), readable=False)
+        self._recv = Connection(os.dup(self.process.stdout.fileno()), writable=False)
+        self.process.stdin.close()
+        self.process.stdout.close()
+        self.tasks = 0
+
+    def extract(self, file_path: str, timeout: float):
+        """추출 요청 후 결과 대기 - 시간 초과 시 TimeoutError, 프로세스 사망 시 EOFError/OSError"""
+        self.tasks += 1
+        self._send.send(file_path)
+        if not self._recv.poll(timeout):
+            raise TimeoutError(file_path)
+        return self._recv.recv()
+
+    def kill(self):
+        """프로세스 강제 종료 및 파이프 정리"""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+        self._send.close()
+        self._recv.close()
+
+
+class ExtractionSandbox:
+    """추출 프로세스 풀 - FileService.extract_text_with_meta 를 격리 실행"""
+
+    ENABLED = os.getenv('EXTRACTION_SANDBOX', 'true').lower() == 'true'
+    WORKERS = int(os.getenv('EXTRACTION_WORKERS', 2))
+    MEMORY_LIMIT_MB = int(os.getenv('EXTRACTION_MEMORY_LIMIT_MB', 1024))
+    MAX_TASKS_PER_WORKER = int(os.getenv('EXTRACTION_WORKER_MAX_TASKS', 200))  # 누수 대비 주기적 교체
+    QUEUE_TIMEOUT = float(os.getenv('EXTRACTION_QUEUE_TIMEOUT', 30))  # 빈 워커 대기 시간 (초)
+
+    # 형식별 wall-clock 타임아웃 (초)
+    TIMEOUTS = {
+        'pdf': float(os.getenv('EXTRACTION_TIMEOUT_PDF', 60)),
+        'docx': float(os.getenv('EXTRACTION_TIMEOUT_DOCX', 20)),
+        'xlsx': float(os.getenv('EXTRACTION_TIMEOUT_XLSX', 30)),
+        'txt': float(os.getenv('EXTRACTION_TIMEOUT_TXT', 10)),
+        'md': float(os.getenv('EXTRACTION_TIMEOUT_TXT', 10)),
+    }
+    DEFAULT_TIMEOUT = 30.0
+
+    _lock = threading.Lock()
+    _idle: Optional[queue.Queue] = None  # 워커 슬롯 (None 이면 다음 사용 시 생성)
+    _pid: Optional[int] = None
+
+    @classmethod
+    def extract(cls, file_path: str) -> tuple[bool, str, Dict[str, Any]]:
+        """샌드박스에서 텍스트 추출 - 반환 형식은 FileService.extract_text_with_meta 와 동일"""
+        if not cls.ENABLED or os.name != 'posix':
+            return FileService.extract_text_with_meta(file_path)
+
+        idle = cls._get_idle()
+        try:
+            worker = idle.get(timeout=cls.QUEUE_TIMEOUT)
+        except queue.Empty:
+            return False, '텍스트 추출 대기 시간 초과 (추출 워커가 모두 사용 중입니다)', {}
+
+        timeout = cls.TIMEOUTS.get(FileService.get_file_format(file_path), cls.DEFAULT_TIMEOUT)
+        try:
+            if worker is None:
+                worker = _Worker(cls.MEMORY_LIMIT_MB)
+            # 자식 프로세스의 작업 디렉터리와 무관하도록 절대 경로로 전달
+            return worker.extract(os.path.abspath(file_path), timeout)
+        except TimeoutError:
+            worker.kill()
+            worker = None
+            return False, f'텍스트 추출 시간 초과 ({timeout:g}초)', {}
+        except (EOFError, OSError):
+            if worker is not None:
+                worker.kill()
+                worker = None
+            return False, '텍스트 추출 프로세스가 비정상 종료되었습니다 (메모리 초과 등)', {}
+        finally:
+            if worker is not None and worker.tasks >= cls.MAX_TASKS_PER_WORKER:
+                worker.kill()
+                worker = None
+            idle.put(worker)
+
+    @classmethod
+    def _get_idle(cls) -> queue.Queue:
+        """현재 프로세스의 워커 슬롯 (fork 된 서버 워커는 부모의 파이프를 공유하지 않도록 새로 생성)"""
+        if cls._pid != os.getpid():
+            with cls._lock:
+                if cls._pid != os.getpid():
+                    # LIFO - 최근에 쓴(이미 떠 있는) 워커를 먼저 재사용
+                    cls._idle = queue.LifoQueue()
+                    for _ in range(cls.WORKERS):
+                        cls._idle.put(None)
+                    cls._pid = os.getpid()
+        return cls._idle
+
+    @classmethod
+    def shutdown(cls):
+        """대기 중인 워커 프로세스 종료"""
+        if cls._idle is None or cls._pid != os.getpid():
+            return
+        drained = 0
+        while True:
+            try:
+                worker = cls._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                worker.kill()
+            drained += 1
+        for _ in range(drained):
+            cls._idle.put(None)
+
+
+atexit.register(ExtractionSandbox.shutdown)
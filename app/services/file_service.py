@@ -3,12 +3,14 @@
 File Processing and Analysis Service
 """
 import os
-import re
+import time
+import hashlib
 import mimetypes
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any
 from datetime import datetime
 from werkzeug.utils import secure_filename
+from app.services.analyzer_rules import RESUME_RULES, PORTFOLIO_RULES
 
 
 class FileService:
@@ -18,6 +20,19 @@ class FileService:
     ALLOWED_EXTENSIONS = {'txt', 'pdf', 'docx', 'xlsx', 'md'}
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+    # 추출기 버전 - 텍스트 추출 로직이 바뀌면 올려서 추출 캐시를 무효화
+    EXTRACTOR_VERSION = 2
+    HASH_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+    # PDF 추출 예산 - 초과 시 앞부분만 추출하고 메타데이터에 잘림 사유 기록
+    PDF_MAX_PAGES = int(os.getenv('PDF_MAX_PAGES', 200))
+    PDF_MAX_CHARS = int(os.getenv('PDF_MAX_CHARS', 2_000_000))
+    PDF_TIME_BUDGET = float(os.getenv('PDF_TIME_BUDGET', 30))  # 초
+
+    # XLSX 추출 상한 - 시트당 행 수 / 전체 셀 수
+    XLSX_MAX_ROWS = int(os.getenv('XLSX_MAX_ROWS', 10000))
+    XLSX_MAX_CELLS = int(os.getenv('XLSX_MAX_CELLS', 500000))
+
     @staticmethod
     def validate_file(file) -> tuple[bool, str]:
         """파일 유효성 검사"""
@@ -62,26 +77,47 @@ class FileService:
         except Exception as e:
             return False, '', str(e)
 
+    @staticmethod
+    def get_file_format(file_path: str) -> str:
+        """파일 확장자(소문자) 반환"""
+        return file_path.rsplit('.', 1)[1].lower() if '.' in file_path else ''
+
+    @staticmethod
+    def compute_file_hash(file_path: str) -> str:
+        """파일 내용 SHA-256 해시 (청크 단위로 읽어 메모리 사용 제한)"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(FileService.HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     @staticmethod
     def extract_text_from_file(file_path: str) -> tuple[bool, str]:
         """파일에서 텍스트 추출"""
+        success, text, _ = FileService.extract_text_with_meta(file_path)
+        return success, text
+
+    @staticmethod
+    def extract_text_with_meta(file_path: str) -> tuple[bool, str, Dict[str, Any]]:
+        """파일에서 텍스트 추출 + 추출 메타데이터 (잘림 여부 등, 없으면 빈 dict)"""
         try:
             ext = file_path.rsplit('.', 1)[1].lower()
 
-            if ext == 'txt':
-                return FileService._extract_text_from_txt(file_path)
-            elif ext == 'md':
-                return FileService._extract_text_from_txt(file_path)
-            elif ext == 'docx':
-                return FileService._extract_text_from_docx(file_path)
-            elif ext == 'pdf':
+            if ext == 'pdf':
                 return FileService._extract_text_from_pdf(file_path)
             elif ext == 'xlsx':
                 return FileService._extract_text_from_xlsx(file_path)
+            elif ext == 'txt':
+                success, text = FileService._extract_text_from_txt(file_path)
+            elif ext == 'md':
+                success, text = FileService._extract_text_from_txt(file_path)
+            elif ext == 'docx':
+                success, text = FileService._extract_text_from_docx(file_path)
             else:
-                return False, f'지원하지 않는 파일 형식: {ext}'
+                return False, f'지원하지 않는 파일 형식: {ext}', {}
+            return success, text, {}
         except Exception as e:
-            return False, f'파일 읽기 오류: {str(e)}'
+            return False, f'파일 읽기 오류: {str(e)}', {}
 
     @staticmethod
     def _extract_text_from_txt(file_path: str) -> tuple[bool, str]:
@@ -107,261 +143,114 @@ class FileService:
             return False, f'DOCX 파일 읽기 오류: {str(e)}'
 
     @staticmethod
-    def _extract_text_from_pdf(file_path: str) -> tuple[bool, str]:
-        """PDF 파일에서 텍스트 추출"""
+    def _extract_text_from_pdf(file_path: str) -> tuple[bool, str, Dict[str, Any]]:
+        """PDF 파일에서 텍스트 추출 (페이지 단위 스트리밍, 예산 초과 시 잘라냄)"""
         try:
             import PyPDF2
-            text = ""
             with open(file_path, 'rb') as f:
                 pdf_reader = PyPDF2.PdfReader(f)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + '\n'
-            return True, text
+                meta = {
+                    'format': 'pdf',
+                    'total_pages': len(pdf_reader.pages),
+                    'pages': 0,
+                    'truncated': None,
+                }
+                text = ''.join(FileService._iter_pdf_pages(pdf_reader, meta))
+            return True, text, meta
         except ImportError:
-            return False, 'PyPDF2 라이브러리가 필요합니다'
+            return False, 'PyPDF2 라이브러리가 필요합니다', {}
         except Exception as e:
-            return False, f'PDF 파일 읽기 오류: {str(e)}'
+            return False, f'PDF 파일 읽기 오류: {str(e)}', {}
+
+    @staticmethod
+    def _iter_pdf_pages(pdf_reader, meta: Dict[str, Any]):
+        """PDF 페이지 텍스트를 한 페이지씩 생성 - 페이지 수 / 글자 수 / 시간 예산을 넘으면 중단"""
+        deadline = time.monotonic() + FileService.PDF_TIME_BUDGET
+        remaining = FileService.PDF_MAX_CHARS
+
+        for index, page in enumerate(pdf_reader.pages):
+            if index >= FileService.PDF_MAX_PAGES:
+                meta['truncated'] = 'max_pages'
+                return
+            # 시간 예산은 페이지 사이에서만 확인 (한 페이지 추출 자체가 멈추는 경우는 막지 못함)
+            if time.monotonic() > deadline:
+                meta['truncated'] = 'time_budget'
+                return
+
+            page_text = (page.extract_text() or '') + '\n'
+            meta['pages'] = index + 1
+            if len(page_text) > remaining:
+                meta['truncated'] = 'max_chars'
+                yield page_text[:remaining]
+                return
+
+            remaining -= len(page_text)
+            yield page_text
 
     @staticmethod
-    def _extract_text_from_xlsx(file_path: str) -> tuple[bool, str]:
-        """XLSX 파일에서 텍스트 추출"""
+    def _extract_text_from_xlsx(file_path: str) -> tuple[bool, str, Dict[str, Any]]:
+        """XLSX 파일에서 텍스트 추출 (읽기 전용 스트리밍 - 셀 객체를 메모리에 올리지 않음)"""
         try:
             from openpyxl import load_workbook
-            wb = load_workbook(file_path)
-            text = ""
-            for sheet in wb.sheetnames:
-                ws = wb[sheet]
-                text += f"\n=== {sheet} ===\n"
-                for row in ws.iter_rows(values_only=True):
-                    text += '\t'.join(str(cell) if cell else '' for cell in row) + '\n'
-            return True, text
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+            meta = {'format': 'xlsx', 'rows': 0, 'truncated': None}
+            try:
+                parts = []
+                remaining_cells = FileService.XLSX_MAX_CELLS
+                for ws in wb.worksheets:
+                    if remaining_cells <= 0:  # 셀 상한에 딱 맞게 끝난 뒤 남은 시트
+                        meta['truncated'] = 'max_cells'
+                        break
+                    parts.append(f"\n=== {ws.title} ===\n")
+                    for row_index, row in enumerate(ws.iter_rows(values_only=True)):
+                        if row_index >= FileService.XLSX_MAX_ROWS:
+                            meta['truncated'] = 'max_rows'
+                            break
+                        if remaining_cells <= 0:  # 빈 행을 붙이기 전에 확인
+                            meta['truncated'] = 'max_cells'
+                            break
+                        if len(row) > remaining_cells:
+                            row = row[:remaining_cells]
+                            meta['truncated'] = 'max_cells'
+                        remaining_cells -= len(row)
+                        meta['rows'] += 1
+                        parts.append('\t'.join(str(cell) if cell else '' for cell in row))
+                        parts.append('\n')
+                        if meta['truncated'] == 'max_cells':
+                            break
+                    if meta['truncated'] == 'max_cells':
+                        break
+            finally:
+                wb.close()  # 읽기 전용 모드는 파일 핸들을 직접 닫아야 함
+            return True, ''.join(parts), meta
         except ImportError:
-            return False, 'openpyxl 라이브러리가 필요합니다'
+            return False, 'openpyxl 라이브러리가 필요합니다', {}
         except Exception as e:
-            return False, f'XLSX 파일 읽기 오류: {str(e)}'
+            return False, f'XLSX 파일 읽기 오류: {str(e)}', {}
+
+    @staticmethod
+    def analyze_text(text: str, document_type: str) -> Dict[str, Any]:
+        """문서 타입에 따른 구조화 데이터 분석"""
+        if document_type == 'resume':
+            return ResumeAnalyzer.analyze(text)
+        elif document_type == 'portfolio':
+            return PortfolioAnalyzer.analyze(text)
+        return {'text': text[:500]}  # 기본: 처음 500자
 
 
 class ResumeAnalyzer:
-    """이력서 분석기"""
+    """이력서 분석기 (규칙 정의: analyzer_rules.RESUME_RULES)"""
 
     @staticmethod
     def analyze(text: str) -> Dict[str, Any]:
         """이력서 텍스트에서 정보 추출"""
-        data = {
-            'skills': ResumeAnalyzer._extract_skills(text),
-            'experience_years': ResumeAnalyzer._extract_experience_years(text),
-            'education': ResumeAnalyzer._extract_education(text),
-            'projects': ResumeAnalyzer._extract_projects(text),
-            'languages': ResumeAnalyzer._extract_languages(text),
-            'certifications': ResumeAnalyzer._extract_certifications(text),
-            'summary': ResumeAnalyzer._extract_summary(text),
-        }
-        return data
-
-    @staticmethod
-    def _extract_skills(text: str) -> List[str]:
-        """스킬 추출"""
-        skills = []
-
-        # 공통 기술 스택
-        tech_keywords = [
-            'python', 'javascript', 'typescript', 'java', 'cpp', 'csharp',
-            'react', 'vue', 'angular', 'nodejs', 'django', 'flask', 'spring',
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-            'git', 'jenkins', 'gitlab', 'github',
-            'html', 'css', 'sass', 'less',
-            'figma', 'photoshop', 'illustrator',
-            'rest', 'graphql', 'websocket',
-            'kafka', 'rabbitmq',
-            'linux', 'windows', 'macos',
-        ]
-
-        text_lower = text.lower()
-        for keyword in tech_keywords:
-            # 단어 경계를 고려한 검색
-            if re.search(rf'\b{keyword}\b', text_lower):
-                skills.append(keyword.capitalize())
-
-        # 중복 제거 및 정렬
-        return sorted(list(set(skills)))
-
-    @staticmethod
-    def _extract_experience_years(text: str) -> Optional[int]:
-        """경력 연수 추출"""
-        # 패턴: "X년", "X년 경력", "경력 X년"
-        patterns = [
-            r'(\d+)\s*년\s*(?:경력|이상)',
-            r'경력\s*:?\s*(\d+)\s*년',
-            r'(\d+)\s*년\s*경험',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return int(match.group(1))
-
-        return None
-
-    @staticmethod
-    def _extract_education(text: str) -> List[str]:
-        """학력 추출"""
-        education = []
-
-        # 대학교 이름 패턴
-        patterns = [
-            r'(\S+(?:대학교|대학|학원))',
-            r'(\S+\s+(?:University|College))',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            education.extend(matches)
-
-        return list(set(education))
-
-    @staticmethod
-    def _extract_projects(text: str) -> List[str]:
-        """프로젝트 추출"""
-        projects = []
-
-        # 프로젝트 시작 키워드
-        patterns = [
-            r'(?:프로젝트|Project|프로젝명)\s*:?\s*([^\n]+)',
-            r'(?:담당|역할|주요)\s*(?:프로젝트|project)\s*[:-]?\s*([^\n]+)',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            projects.extend(matches)
-
-        # 중복 제거 및 빈 항목 제거
-        projects = [p.strip() for p in projects if p.strip()]
-        return list(set(projects))[:5]  # 최대 5개
-
-    @staticmethod
-    def _extract_languages(text: str) -> List[str]:
-        """언어 능력 추출"""
-        languages = []
-
-        lang_keywords = {
-            '한국어': ['한국어', 'korean'],
-            '영어': ['영어', 'english'],
-            '일본어': ['일본어', 'japanese'],
-            '중국어': ['중국어', 'chinese'],
-            '스페인어': ['스페인어', 'spanish'],
-            '독일어': ['독일어', 'german'],
-            '프랑스어': ['프랑스어', 'french'],
-        }
-
-        text_lower = text.lower()
-        for lang, keywords in lang_keywords.items():
-            for keyword in keywords:
-                if re.search(rf'\b{keyword}\b', text_lower):
-                    languages.append(lang)
-                    break
-
-        return list(set(languages))
-
-    @staticmethod
-    def _extract_certifications(text: str) -> List[str]:
-        """자격증 추출"""
-        certifications = []
-
-        # 자격증 관련 키워드
-        patterns = [
-            r'(?:자격증|certificate|license)\s*:?\s*([^\n]+)',
-            r'(?:취득|obtained|passed)\s*:?\s*([^\n]+)',
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            certifications.extend(matches)
-
-        # 중복 제거
-        certifications = [c.strip() for c in certifications if c.strip()]
-        return list(set(certifications))[:5]
-
-    @staticmethod
-    def _extract_summary(text: str) -> str:
-        """요약 추출 (첫 500자)"""
-        # 불릿 포인트나 개행으로 분리된 처음 3줄
-        lines = text.split('\n')
-        summary_lines = []
-        for line in lines:
-            if line.strip() and len(summary_lines) < 3:
-                summary_lines.append(line.strip())
-
-        summary = ' '.join(summary_lines)
-        # 최대 500자까지만
-        return summary[:500] if summary else text[:500]
+        return RESUME_RULES.analyze(text)
 
 
 class PortfolioAnalyzer:
-    """포트폴리오 분석기"""
+    """포트폴리오 분석기 (규칙 정의: analyzer_rules.PORTFOLIO_RULES)"""
 
     @staticmethod
     def analyze(text: str) -> Dict[str, Any]:
         """포트폴리오 텍스트에서 정보 추출"""
-        data = {
-            'projects': PortfolioAnalyzer._extract_portfolio_projects(text),
-            'technologies': PortfolioAnalyzer._extract_technologies(text),
-            'links': PortfolioAnalyzer._extract_links(text),
-        }
-        return data
-
-    @staticmethod
-    def _extract_portfolio_projects(text: str) -> List[Dict[str, str]]:
-        """포트폴리오 프로젝트 추출"""
-        projects = []
-
-        # 프로젝트 섹션 분할
-        sections = re.split(r'\n(?=\d+\.|\-\s*[^\s])', text)
-
-        for section in sections:
-            project = {}
-
-            # 프로젝트명
-            title_match = re.search(r'^[^\n]+', section)
-            if title_match:
-                project['title'] = title_match.group(0).strip()
-
-            # 설명
-            description_match = re.search(r'(?:설명|description)\s*:?\s*([^\n]+)', section, re.IGNORECASE)
-            if description_match:
-                project['description'] = description_match.group(1).strip()
-
-            # URL/링크
-            url_match = re.search(r'https?://[^\s\n]+', section)
-            if url_match:
-                project['url'] = url_match.group(0)
-
-            if 'title' in project:
-                projects.append(project)
-
-        return projects[:10]  # 최대 10개
-
-    @staticmethod
-    def _extract_technologies(text: str) -> List[str]:
-        """기술 스택 추출"""
-        tech_keywords = [
-            'python', 'javascript', 'typescript', 'java', 'cpp', 'csharp',
-            'react', 'vue', 'angular', 'nodejs', 'django', 'flask', 'spring',
-            'mysql', 'postgresql', 'mongodb', 'redis',
-            'docker', 'kubernetes', 'aws', 'azure', 'gcp',
-        ]
-
-        technologies = []
-        text_lower = text.lower()
-
-        for tech in tech_keywords:
-            if re.search(rf'\b{tech}\b', text_lower):
-                technologies.append(tech.capitalize())
-
-        return sorted(list(set(technologies)))
-
-    @staticmethod
-    def _extract_links(text: str) -> List[str]:
-        """링크 추출"""
-        links = re.findall(r'https?://[^\s\n]+', text)
-        return list(set(links))[:10]
+        return PORTFOLIO_RULES.analyze(text)
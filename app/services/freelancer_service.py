@@ -2,58 +2,114 @@
 Freelancer Service
 비즈니스 로직 처리
 """
+import os
+import time
 import uuid
 from datetime import datetime
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload, selectinload
 from app.db import db
-from app.models import Freelancer, FreelancerProfile, Skill, FreelancerDocument
+from app.metrics import cache_requests, document_extraction_duration
+from app.models import (
+    Freelancer, FreelancerProfile, Skill, Review, FreelancerDocument, DocumentExtractionCache, InterviewEvaluation
+)
 from app.models.freelancer import freelancer_skill
 from app.utils import paginate
-from app.services.file_service import FileService, ResumeAnalyzer, PortfolioAnalyzer
+from app.services.file_service import FileService
+from app.services.extraction_sandbox import ExtractionSandbox
+from app.services.search_service import DocumentSearchService
+from app.services.upload_service import ChunkedUploadService
+from app.services.analytics_service import InterviewAnalyticsService
+from app.services.freelancer_snapshot import FreelancerSnapshotService, AVAILABILITY_CODES
+from app.write_queue import serialized_write
 
 
 class FreelancerService:
     """프리랜서 서비스"""
 
+    # 목록 응답에 필요한 관계 (페이지 행만 조회할 때 함께 로드)
+    LIST_LOAD_OPTIONS = (
+        joinedload(Freelancer.profile),  # 1:1 관계
+        selectinload(Freelancer.skills),  # Many-to-Many 관계
+        selectinload(Freelancer.portfolio_items),  # 1:Many 관계
+        selectinload(Freelancer.reviews),  # 1:Many 관계
+        selectinload(Freelancer.interview_evaluations),  # 1:Many 관계
+        selectinload(Freelancer.documents),  # 1:Many 관계
+    )
+
+    # 삭제 시 CASCADE 로 함께 지울 자식 전체 (평가의 점수 / 체크포인트 결과 / 레드플래그 발견 포함)
+    DELETE_LOAD_OPTIONS = (
+        joinedload(Freelancer.profile),
+        selectinload(Freelancer.skills),
+        selectinload(Freelancer.portfolio_items),
+        selectinload(Freelancer.reviews),
+        selectinload(Freelancer.documents),
+        selectinload(Freelancer.interview_evaluations).selectinload(InterviewEvaluation.category_scores),
+        selectinload(Freelancer.interview_evaluations).selectinload(InterviewEvaluation.results),
+        selectinload(Freelancer.interview_evaluations).selectinload(InterviewEvaluation.red_flag_findings),
+    )
+
     @staticmethod
     def get_list(page=1, limit=20, search=None, skills=None, availability=None,
                  min_rating=None, min_experience=None, max_hourly_rate=None,
                  sort_by='name', sort_order='asc'):
-        """프리랜서 목록 조회 with 필터링, 정렬, 페이지네이션 (한 번의 쿼리로 모든 데이터 로드)"""
-        # Eager Loading: 관계 데이터를 미리 로드하여 N+1 쿼리 문제 해결
-        query = Freelancer.query.outerjoin(FreelancerProfile).options(
-            joinedload(Freelancer.profile),  # 1:1 관계
-            selectinload(Freelancer.skills),  # Many-to-Many 관계
-            selectinload(Freelancer.portfolio_items),  # 1:Many 관계
-            selectinload(Freelancer.reviews),  # 1:Many 관계
-            selectinload(Freelancer.interview_evaluations),  # 1:Many 관계
-            selectinload(Freelancer.documents),  # 1:Many 관계
+        """프리랜서 목록 조회 with 필터링, 정렬, 페이지네이션 (필터/정렬은 스냅샷, DB는 페이지 행만 조회)"""
+        if search:
+            # 부분 문자열 검색은 스냅샷에 없는 컬럼(이메일 / 소개) → DB에서 처리
+            return FreelancerService._get_list_from_db(
+                page, limit, search, skills, availability, min_rating,
+                min_experience, max_hourly_rate, sort_by, sort_order
+            )
+
+        snapshot = FreelancerSnapshotService.get()
+        total, ids = snapshot.list_page(
+            skills=skills, availability=availability, min_rating=min_rating,
+            min_experience=min_experience, max_hourly_rate=max_hourly_rate,
+            sort_by=sort_by, sort_order=sort_order, page=page, limit=limit
         )
 
-        # 필터링
-        if search:
-            query = query.filter(
-                db.or_(
-                    Freelancer.name.ilike(f'%{search}%'),
-                    Freelancer.email.ilike(f'%{search}%'),
-                    FreelancerProfile.bio.ilike(f'%{search}%')
-                )
+        freelancers = {}
+        if ids:
+            freelancers = {
+                f.id: f for f in Freelancer.query.options(*FreelancerService.LIST_LOAD_OPTIONS)
+                .filter(Freelancer.id.in_(ids))
+            }
+
+        return {
+            # 스냅샷 갱신 전에 삭제된 행은 제외
+            'data': [freelancers[i].to_dict() for i in ids if i in freelancers],
+            'total': total,
+            'page': page,
+            'limit': limit,
+            'totalPages': (total + limit - 1) // limit,
+        }
+
+    @staticmethod
+    def _get_list_from_db(page, limit, search, skills, availability, min_rating,
+                          min_experience, max_hourly_rate, sort_by, sort_order):
+        """검색어가 있을 때의 DB 목록 조회"""
+        query = Freelancer.query.outerjoin(FreelancerProfile).options(*FreelancerService.LIST_LOAD_OPTIONS)
+
+        query = query.filter(
+            db.or_(
+                Freelancer.name.ilike(f'%{search}%'),
+                Freelancer.email.ilike(f'%{search}%'),
+                FreelancerProfile.bio.ilike(f'%{search}%')
             )
+        )
 
         if skills and len(skills) > 0:
-            query = query.join(Skill).filter(Skill.id.in_(skills)).distinct()
+            query = query.filter(Freelancer.skills.any(Skill.id.in_(skills)))
 
         if availability:
             query = query.filter(FreelancerProfile.availability == availability)
 
         if min_rating is not None:
-            # 리뷰가 있을 때만 평점 필터링
-            query = query.filter(
-                db.or_(
-                    Freelancer.reviews.any(db.func.avg(Freelancer.reviews.c.rating) >= min_rating),
-                    ~Freelancer.reviews.any()  # 리뷰가 없는 경우도 포함
-                )
+            # 평균 평점 미달인 프리랜서 제외 (리뷰가 없는 경우는 포함)
+            low_rated = db.session.query(Review.freelancer_id).group_by(Review.freelancer_id).having(
+                db.func.avg(Review.rating) < min_rating
             )
+            query = query.filter(Freelancer.id.notin_(low_rated))
 
         if min_experience is not None:
             query = query.filter(FreelancerProfile.experience >= min_experience)
@@ -63,7 +119,7 @@ class FreelancerService:
 
         # 정렬
         if sort_by == 'name':
-            sort_column = Freelancer.name
+            sort_column = db.func.lower(Freelancer.name)  # 스냅샷 정렬(fold_name)과 같은 순서 - SQLite 기본 정렬은 대소문자 구분
         elif sort_by == 'experience':
             sort_column = FreelancerProfile.experience
         elif sort_by == 'hourlyRate':
@@ -72,17 +128,11 @@ class FreelancerService:
             sort_column = Freelancer.created_at
 
         if sort_order.lower() == 'desc':
-            query = query.order_by(sort_column.desc())
+            query = query.order_by(sort_column.desc(), Freelancer.id)
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc(), Freelancer.id)
 
-        # 페이지네이션 (이미 모든 데이터가 로드됨)
-        paginated = paginate(query, page, limit)
-
-        # 응답 데이터 변환 (추가 쿼리 없음 - 메모리 캐시 사용)
-        paginated['data'] = [item.to_dict() for item in paginated['data']]
-
-        return paginated
+        return paginate(query, page, limit)
 
     @staticmethod
     def get_by_id(freelancer_id):
@@ -102,6 +152,7 @@ class FreelancerService:
         return freelancer.to_dict()
 
     @staticmethod
+    @serialized_write
     def create(data):
         """프리랜서 생성"""
         # 이메일 중복 확인
@@ -139,22 +190,15 @@ class FreelancerService:
         db.session.flush()  # ID 생성을 위해 flush
 
         # 스킬 연결 (직접 INSERT)
-        for skill_id in skill_ids:
-            skill = Skill.query.get(skill_id)
-            if skill:
-                # INSERT문으로 직접 추가 (association table 구조에 맞춤)
-                db.session.execute(
-                    db.insert(freelancer_skill).values(
-                        freelancer_id=freelancer_id,
-                        skill_id=skill_id
-                    )
-                )
+        FreelancerService._link_skills(freelancer_id, skill_ids)
 
         db.session.commit()
+        FreelancerSnapshotService.invalidate([freelancer_id])
 
         return freelancer.to_dict()
 
     @staticmethod
+    @serialized_write
     def update(freelancer_id, data):
         """프리랜서 정보 수정"""
         freelancer = Freelancer.query.get(freelancer_id)
@@ -178,15 +222,7 @@ class FreelancerService:
                     )
                 )
                 # 새로운 스킬 추가
-                for skill_id in value:
-                    skill = Skill.query.get(skill_id)
-                    if skill:
-                        db.session.execute(
-                            db.insert(freelancer_skill).values(
-                                freelancer_id=freelancer_id,
-                                skill_id=skill_id
-                            )
-                        )
+                FreelancerService._link_skills(freelancer_id, value)
             elif field == 'hourlyRate':
                 setattr(freelancer, 'hourly_rate', value)
             else:
@@ -195,18 +231,140 @@ class FreelancerService:
 
         freelancer.updated_at = datetime.utcnow()
         db.session.commit()
+        FreelancerSnapshotService.invalidate([freelancer_id])
 
         return freelancer.to_dict()
 
     @staticmethod
+    def _link_skills(freelancer_id, skill_ids):
+        """존재하는 스킬만 연결 (스킬 수와 무관하게 조회 1번 + INSERT 1번)"""
+        existing = {
+            skill_id for skill_id, in db.session.query(Skill.id).filter(Skill.id.in_(skill_ids))
+        } if skill_ids else set()
+        rows = [
+            {'freelancer_id': freelancer_id, 'skill_id': skill_id}
+            for skill_id in dict.fromkeys(skill_ids) if skill_id in existing  # 순서 유지 + 중복 제거
+        ]
+        if rows:
+            # INSERT문으로 직접 추가 (association table 구조에 맞춤)
+            db.session.execute(db.insert(freelancer_skill), rows)
+
+    @staticmethod
+    @serialized_write
     def delete(freelancer_id):
         """프리랜서 삭제"""
-        freelancer = Freelancer.query.get(freelancer_id)
+        # ORM CASCADE 는 삭제할 자식을 모두 읽음 → 관계별로 한 번에 미리 로드 (평가마다 조회 X)
+        freelancer = Freelancer.query.options(
+            *FreelancerService.DELETE_LOAD_OPTIONS
+        ).filter_by(id=freelancer_id).first()
         if not freelancer:
             raise ValueError('프리랜서를 찾을 수 없습니다')
 
+        # 평가는 CASCADE 로 함께 삭제 → 면접 분석 집계에서 먼저 제거
+        InterviewAnalyticsService.remove_evaluations(e.id for e in freelancer.interview_evaluations)
+        # 문서도 CASCADE 로 함께 삭제 → 전문 검색 색인에서 먼저 제거
+        DocumentSearchService.remove_freelancer(freelancer_id)
         db.session.delete(freelancer)
         db.session.commit()
+        FreelancerSnapshotService.invalidate([freelancer_id])
+
+    @staticmethod
+    def match(data):
+        """프로젝트 조건에 맞는 프리랜서 상위 N명 (스냅샷에서 점수 계산 후 해당 행만 조회)"""
+        started = time.perf_counter()
+
+        required = FreelancerService._resolve_skills(data.get('requiredSkills') or [])
+        nice = [s for s in FreelancerService._resolve_skills(data.get('niceToHaveSkills') or []) if s not in required]
+
+        availability = data.get('availability', ['available'])
+        if isinstance(availability, str):
+            availability = [availability]
+        invalid = [a for a in availability or [] if a not in AVAILABILITY_CODES]
+        if invalid:
+            raise ValueError(f'잘못된 상태: {", ".join(invalid)}')
+
+        limit = data.get('limit', 20)
+        if not isinstance(limit, int) or limit < 1 or limit > 100:
+            raise ValueError('limit은 1 ~ 100 사이의 정수여야 합니다')
+
+        max_hourly_rate = data.get('hourlyRate')
+        min_experience = data.get('minExperience')
+        for name, value in (('hourlyRate', max_hourly_rate), ('minExperience', min_experience)):
+            if value is not None and (not isinstance(value, (int, float)) or value < 0):
+                raise ValueError(f'{name}는 0 이상의 숫자여야 합니다')
+
+        snapshot = FreelancerSnapshotService.get()
+        result = snapshot.match(
+            required_skills=required,
+            nice_skills=nice,
+            max_hourly_rate=max_hourly_rate,
+            min_experience=min_experience,
+            availability=availability,
+            limit=limit,
+        )
+        scored_ms = (time.perf_counter() - started) * 1000
+
+        # 상위 N명만 DB에서 조회 (스냅샷 이후 삭제된 프리랜서는 제외)
+        ids = [snapshot.ids[index] for index, _, _ in result['items']]
+        freelancers = {
+            f.id: f for f in Freelancer.query.options(
+                joinedload(Freelancer.profile),
+                selectinload(Freelancer.skills),
+            ).filter(Freelancer.id.in_(ids)).all()
+        } if ids else {}
+
+        items = []
+        for index, score, breakdown in result['items']:
+            freelancer = freelancers.get(snapshot.ids[index])
+            if freelancer is None:
+                continue
+            rating = snapshot.rating[index]
+            interview_score = snapshot.interview_score[index]
+            items.append({
+                'score': round(score * 100, 2),
+                'breakdown': {name: round(value, 4) for name, value in breakdown.items()},
+                'matchedNiceToHaveSkills': snapshot.owned_skills(index, nice),
+                'rating': None if rating != rating else round(float(rating), 2),  # NaN = 리뷰 없음
+                'reviewCount': int(snapshot.review_count[index]),
+                'interviewScore': None if interview_score != interview_score else round(float(interview_score), 2),
+                'freelancer': freelancer.to_dict(include_portfolio=False, include_reviews=False),
+            })
+
+        return {
+            'total': result['total'],
+            'items': items,
+            'snapshot': {
+                'size': snapshot.size,
+                'builtAt': snapshot.built_at.isoformat(),
+            },
+            'scoringMs': round(scored_ms, 2),
+        }
+
+    @staticmethod
+    def _resolve_skills(values):
+        """스킬 ID 또는 이름(대소문자 무시) → 스킬 ID 목록"""
+        if not isinstance(values, list):
+            raise ValueError('스킬 목록은 배열이어야 합니다')
+        if not values:
+            return []
+
+        skills = Skill.query.filter(db.or_(
+            Skill.id.in_(values),
+            db.func.lower(Skill.name).in_([str(v).lower() for v in values])
+        )).all()
+        by_key = {}
+        for skill in skills:
+            by_key[skill.id] = skill.id
+            by_key[skill.name.lower()] = skill.id
+
+        resolved = []
+        for value in values:
+            skill_id = by_key.get(value) or by_key.get(str(value).lower())
+            if skill_id is None:
+                raise ValueError(f'스킬을 찾을 수 없습니다: {value}')
+            if skill_id not in resolved:
+                resolved.append(skill_id)
+        return resolved
 
     @staticmethod
     def get_skills():
@@ -215,6 +373,7 @@ class FreelancerService:
         return [skill.to_dict() for skill in skills]
 
     @staticmethod
+    @serialized_write
     def get_or_create_skills(skill_ids):
         """스킬 ID로 스킬 객체 조회 또는 생성"""
         skills = []
@@ -264,10 +423,7 @@ class FreelancerDocumentService:
 
         mime_type = file.content_type or 'application/octet-stream'
 
-        # 문서 객체 생성
-        doc_id = str(uuid.uuid4())
-        document = FreelancerDocument(
-            id=doc_id,
+        return FreelancerDocumentService._create_document(
             freelancer_id=freelancer_id,
             document_type=document_type,
             original_filename=file.filename,
@@ -276,49 +432,146 @@ class FreelancerDocumentService:
             mime_type=mime_type,
         )
 
-        db.session.add(document)
-        db.session.flush()
+    @staticmethod
+    def complete_chunked_upload(upload_id: str, sha256, chunk_root: str, upload_dir_root: str):
+        """분할 업로드 완료 - 청크 병합 및 해시 검증 후 문서 생성 및 분석"""
+        stored = ChunkedUploadService.assemble(upload_id, sha256, chunk_root, upload_dir_root)
+
+        return FreelancerDocumentService._create_document(
+            freelancer_id=stored['freelancerId'],
+            document_type=stored['documentType'],
+            original_filename=stored['originalFilename'],
+            file_path=stored['filePath'],
+            file_size=stored['fileSize'],
+            mime_type=stored['mimeType'],
+            content_hash=stored['contentHash'],  # 병합하면서 계산한 해시 재사용
+        )
 
-        # 텍스트 추출 및 분석
-        FreelancerDocumentService._analyze_document(document)
+    @staticmethod
+    def _create_document(freelancer_id: str, document_type: str, original_filename: str, file_path: str,
+                         file_size: int, mime_type: str, content_hash: str = None):
+        """저장된 파일로 텍스트 추출 및 분석 후 문서 레코드 생성"""
+        fields, new_cache = FreelancerDocumentService._analyze_file(file_path, document_type, content_hash)
+
+        return FreelancerDocumentService._insert_document({
+            'id': str(uuid.uuid4()),
+            'freelancer_id': freelancer_id,
+            'document_type': document_type,
+            'original_filename': original_filename,
+            'file_path': file_path,
+            'file_size': file_size,
+            'mime_type': mime_type,
+        }, fields, new_cache)
 
-        db.session.commit()
-        return document.to_dict()
+    @staticmethod
+    @serialized_write
+    def _insert_document(values: dict, fields: dict, new_cache: dict = None):
+        """문서 레코드 + 분석 결과 저장 (분석 결과까지 채운 뒤 INSERT 한 번)"""
+        document = FreelancerDocument(**values)
+        FreelancerDocumentService._apply_analysis(document, fields, new_cache)
+        db.session.add(document)
+        return FreelancerDocumentService._commit_document(document)
 
     @staticmethod
-    def _analyze_document(document: FreelancerDocument):
-        """문서 분석 및 정보 추출"""
+    def _analyze_file(file_path: str, document_type: str, content_hash: str = None) -> tuple[dict, dict]:
+        """텍스트 추출 및 분석 → (문서에 반영할 값, 새로 저장할 추출 캐시)
+        DB 쓰기 없음 - 파싱하는 동안 쓰기 트랜잭션(SQLite 쓰기 잠금)을 잡지 않도록 저장 전에 실행"""
+        fields = {'content_hash': content_hash}
+        new_cache = None
         try:
-            # 텍스트 추출
-            success, text = FileService.extract_text_from_file(document.file_path)
+            if not content_hash:
+                fields['content_hash'] = FileService.compute_file_hash(file_path)
 
-            if not success:
-                document.is_analyzed = False
-                document.analysis_error = text  # 오류 메시지
-                return
+            # 텍스트 추출 (내용 해시 기준 캐시 사용)
+            success, text, meta, new_cache = FreelancerDocumentService._extract_text(file_path, fields['content_hash'])
 
-            # 텍스트 저장
-            document.extracted_text = text
+            if not success:
+                fields.update(is_analyzed=False, analysis_error=text)  # 오류 메시지
+                return fields, None
 
             # 문서 타입에 따른 분석
-            if document.document_type == 'resume':
-                extracted_data = ResumeAnalyzer.analyze(text)
-            elif document.document_type == 'portfolio':
-                extracted_data = PortfolioAnalyzer.analyze(text)
-            else:
-                extracted_data = {'text': text[:500]}  # 기본: 처음 500자
-
-            document.extracted_data = extracted_data
-            document.is_analyzed = True
+            extracted_data = FileService.analyze_text(text, document_type)
+            if meta.get('truncated'):
+                extracted_data['extraction'] = meta  # 예산 초과로 앞부분만 분석됨
+            fields.update(extracted_text=text, extracted_data=extracted_data, is_analyzed=True, analysis_error=None)
 
         except Exception as e:
-            document.is_analyzed = False
-            document.analysis_error = str(e)
+            fields.update(is_analyzed=False, analysis_error=str(e))
+        return fields, new_cache
+
+    @staticmethod
+    def _apply_analysis(document: FreelancerDocument, fields: dict, new_cache: dict = None):
+        """분석 결과 반영 + 추출 캐시 / 전문 검색 인덱스 저장 (커밋은 호출한 쪽에서)"""
+        if fields.get('is_analyzed'):
+            try:
+                # 전문 검색 인덱스 갱신 (문서 저장과 같은 트랜잭션)
+                # 기존 색인을 지울 때 이전 원문이 필요하므로 extracted_text 를 바꾸기 전에
+                DocumentSearchService.index_document(document.id, document.freelancer_id, fields['extracted_text'])
+            except Exception as e:
+                fields = dict(fields, is_analyzed=False, analysis_error=str(e))
+
+        for field, value in fields.items():
+            setattr(document, field, value)
+
+        if new_cache:
+            FreelancerDocumentService._save_extraction_cache(**new_cache)
+
+    @staticmethod
+    def _extract_text(file_path: str, content_hash: str) -> tuple[bool, str, dict, dict]:
+        """캐시를 거쳐 텍스트 추출 - 같은 내용의 파일은 추출기 버전당 한 번만 파싱
+        → (성공 여부, 텍스트 또는 오류, 메타, 새로 저장할 캐시)"""
+        file_format = FileService.get_file_format(file_path)
+        cached = DocumentExtractionCache.query.filter_by(
+            content_hash=content_hash,
+            file_format=file_format,
+            extractor_version=FileService.EXTRACTOR_VERSION
+        ).first()
+        if cached and FreelancerDocumentService._is_cacheable(cached.extraction_meta):
+            cache_requests.labels('document_extraction', 'hit').inc()
+            return True, cached.extracted_text, cached.extraction_meta or {}, None
+        cache_requests.labels('document_extraction', 'miss').inc()
+
+        # 파싱은 격리된 자식 프로세스에서 (타임아웃 / 메모리 상한)
+        started = time.perf_counter()
+        success, text, meta = ExtractionSandbox.extract(file_path)
+        document_extraction_duration.labels(file_format, 'success' if success else 'error').observe(
+            time.perf_counter() - started)
+        if not success:
+            return False, text, meta, None  # 실패는 캐시하지 않음 (일시적 오류 재시도 허용)
+        if not FreelancerDocumentService._is_cacheable(meta):
+            return True, text, meta, None
+
+        new_cache = {'content_hash': content_hash, 'file_format': file_format, 'text': text, 'meta': meta}
+        return True, text, meta, new_cache
+
+    @staticmethod
+    def _is_cacheable(meta: dict = None) -> bool:
+        """추출 캐시에 둘 수 있는 결과인지 - 예산 초과로 잘린 결과는 제외
+        (시간 예산은 서버 부하에 따라 달라지고, 페이지 / 문자 / 셀 상한은 캐시 키에 없어 상한을 올려도 잘린 텍스트가 계속 쓰임)"""
+        return not (meta or {}).get('truncated')
+
+    @staticmethod
+    def _save_extraction_cache(content_hash: str, file_format: str, text: str, meta: dict = None):
+        """추출 결과 캐시 저장 (호출한 쪽 트랜잭션 안의 SAVEPOINT → 문서 저장과 함께 커밋 / 롤백)"""
+        # SQLite 도 app.db.init_sqlite 가 BEGIN 을 먼저 내보내므로 RELEASE 시점에 따로 커밋되지 않음
+        # 동일 파일이 동시에 처리된 경우 다른 요청이 먼저 저장했을 수 있음
+        try:
+            with db.session.begin_nested():
+                db.session.add(DocumentExtractionCache(
+                    id=str(uuid.uuid4()),
+                    content_hash=content_hash,
+                    file_format=file_format,
+                    extractor_version=FileService.EXTRACTOR_VERSION,
+                    extracted_text=text,
+                    extraction_meta=meta or None,
+                ))
+        except IntegrityError:
+            pass
 
     @staticmethod
     def get_documents(freelancer_id: str, page=1, limit=20, document_type=None):
         """프리랜서 문서 목록 조회"""
-        query = FreelancerDocument.query.filter_by(freelancer_id=freelancer_id)
+        query = FreelancerDocument.query.filter_by(freelancer_id=freelancer_id, deleted_at=None)
 
         if document_type:
             query = query.filter_by(document_type=document_type)
@@ -328,42 +581,79 @@ class FreelancerDocumentService:
         return paginate(query, page, limit)
 
     @staticmethod
-    def get_document(document_id: str):
-        """문서 조회"""
+    def search_documents(query: str, document_type=None, limit=50):
+        """문서 전문 검색 (모든 단어 포함) → 프리랜서별 결과"""
+        return DocumentSearchService.search(query, document_type=document_type, limit=limit)
+
+    @staticmethod
+    def _get_active_document(document_id: str) -> FreelancerDocument:
+        """삭제 표시되지 않은 문서 조회"""
         document = FreelancerDocument.query.get(document_id)
-        if not document:
+        if not document or document.deleted_at is not None:
             raise ValueError('문서를 찾을 수 없습니다')
+        return document
+
+    @staticmethod
+    def get_document(document_id: str):
+        """문서 조회"""
+        document = FreelancerDocumentService._get_active_document(document_id)
         return document.to_dict(include_text=True)
 
     @staticmethod
-    def delete_document(document_id: str):
-        """문서 삭제"""
-        document = FreelancerDocument.query.get(document_id)
-        if not document:
-            raise ValueError('문서를 찾을 수 없습니다')
+    def get_document_file(document_id: str) -> FreelancerDocument:
+        """다운로드용 문서 조회 (파일 존재 확인, 내용 해시가 없으면 계산 후 저장 - ETag 용)"""
+        document = FreelancerDocumentService._get_active_document(document_id)
+        if not os.path.isfile(document.file_path):
+            raise ValueError('문서 파일을 찾을 수 없습니다')
 
-        # 파일 삭제
-        import os
-        try:
-            if os.path.exists(document.file_path):
-                os.remove(document.file_path)
-        except Exception as e:
-            print(f'파일 삭제 실패: {str(e)}')
+        if not document.content_hash:
+            content_hash = FileService.compute_file_hash(document.file_path)
+            document = FreelancerDocumentService._save_content_hash(document_id, content_hash)
 
-        # DB에서 삭제
-        db.session.delete(document)
+        return document
+
+    @staticmethod
+    @serialized_write
+    def _save_content_hash(document_id: str, content_hash: str) -> FreelancerDocument:
+        """내용 해시 저장"""
+        document = FreelancerDocumentService._get_active_document(document_id)
+        document.content_hash = content_hash
+        db.session.commit()
+        return document
+
+    @staticmethod
+    @serialized_write
+    def delete_document(document_id: str):
+        """문서 삭제 (삭제 표시만 - 파일과 레코드는 gc_uploads.py 가 정리)"""
+        document = FreelancerDocumentService._get_active_document(document_id)
+
+        document.deleted_at = datetime.utcnow()
+        DocumentSearchService.remove_document(document.id)
         db.session.commit()
 
         return True
 
     @staticmethod
     def re_analyze_document(document_id: str):
-        """문서 재분석"""
-        document = FreelancerDocument.query.get(document_id)
-        if not document:
-            raise ValueError('문서를 찾을 수 없습니다')
+        """문서 재분석 (추출 캐시를 재사용하고 분석기만 다시 실행)"""
+        document = FreelancerDocumentService._get_active_document(document_id)
+        fields, new_cache = FreelancerDocumentService._analyze_file(
+            document.file_path, document.document_type, document.content_hash
+        )
+        return FreelancerDocumentService._save_analysis(document_id, fields, new_cache)
 
-        FreelancerDocumentService._analyze_document(document)
-        db.session.commit()
+    @staticmethod
+    @serialized_write
+    def _save_analysis(document_id: str, fields: dict, new_cache: dict = None):
+        """재분석 결과 저장"""
+        document = FreelancerDocumentService._get_active_document(document_id)
+        FreelancerDocumentService._apply_analysis(document, fields, new_cache)
+        return FreelancerDocumentService._commit_document(document)
 
-        return document.to_dict()
+    @staticmethod
+    def _commit_document(document: FreelancerDocument) -> dict:
+        """커밋 후 응답 - 커밋 전에 직렬화해서 만료된 문서를 다시 조회하지 않음"""
+        db.session.flush()  # updated_at 등 flush 시 채워지는 값 반영
+        result = document.to_dict()
+        db.session.commit()
+        return result
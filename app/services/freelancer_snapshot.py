@@ -0,0 +1,597 @@
+"""
+프리랜서 열 지향(columnar) 스냅샷 - 목록 필터/정렬과 매칭 점수 계산용
+- 프로필(경력 / 시급 / 상태), 평균 평점, 최근 면접 총점, 정렬 순위를 프리랜서 순서대로 NumPy 배열에 보관
+- 보유 스킬은 (스킬 수 × 프리랜서 수) bool 행렬 - 스킬 하나가 연속된 메모리 한 줄
+- 필터 / 정렬 / 점수 계산은 배열 연산으로 처리하고 필요한 페이지(상위 N명)의 id 만 DB에서 조회
+- 갱신은 updated_at 기준 변경분만 백그라운드에서 다시 읽어 새 스냅샷으로 교체 (읽는 쪽은 잠금 없이 사용)
+"""
+import os
+import copy
+import time
+import string
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from flask import current_app
+
+from app.db import db, use_primary
+from app.models import Freelancer, FreelancerProfile, Skill, Review, InterviewEvaluation
+from app.models.freelancer import freelancer_skill
+from app.write_queue import after_commit
+
+AVAILABILITY_CODES = {'available': 0, 'busy': 1, 'unavailable': 2}
+UNKNOWN_AVAILABILITY = -1
+NO_PROFILE = -1  # 프로필이 없는 프리랜서의 경력/시급 (SQL 의 NULL 처럼 오름차순에서 맨 앞)
+
+ID_BATCH_SIZE = 500  # 변경분 조회 시 IN 절 크기
+
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def fold_name(name: str) -> str:
+    """이름 정렬 키 - ASCII 대문자만 소문자로 (SQLite lower() 와 같은 결과, DB 조회 경로는 func.lower(name) 으로 정렬)"""
+    return name.translate(_ASCII_LOWER)
+
+# 배열 컬럼 → dtype
+COLUMNS = {
+    'has_profile': bool,
+    'created_at': np.int64,  # epoch 마이크로초
+    'experience': np.int64,
+    'hourly_rate': np.int64,
+    'availability': np.int8,
+    'rating': np.float32,  # 리뷰 없으면 NaN
+    'review_count': np.int32,
+    'interview_score': np.float32,  # 면접 기록 없으면 NaN
+}
+
+SORT_KEYS = {
+    'name': 'name_rank',
+    'experience': 'experience',
+    'hourlyRate': 'hourly_rate',
+}
+
+
+def _rank(values, dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """정렬된 고유값과 값 순서대로의 순위 (동점은 같은 순위)"""
+    values = np.asarray(values)
+    if values.size == 0:
+        return np.zeros(0, dtype=dtype), np.zeros(0, dtype=np.int64)
+    unique, inverse = np.unique(values, return_inverse=True)
+    return unique.astype(dtype), inverse.astype(np.int64)
+
+
+def _merge_rank(values: np.ndarray, rank: np.ndarray, positions: np.ndarray, new_values):
+    """positions 의 값만 new_values 로 바꾼 (정렬된 고유값, 순위) - 전체 재정렬 없이 새 값만 끼워 넣음
+    - 기존 순위는 앞에 끼워진 값 개수만큼만 밀림
+    - 더 이상 쓰이지 않는 값도 목록에 남음 (순서 비교용이라 무방, 전체 재생성 때 정리)"""
+    new_values = np.asarray(new_values, dtype=values.dtype)
+    unique = np.unique(new_values)
+    found = np.searchsorted(values, unique)
+    exists = found < len(values)
+    exists[exists] = values[found[exists]] == unique[exists]
+    inserted_at = found[~exists]
+    if inserted_at.size:
+        values = np.insert(values, inserted_at, unique[~exists])
+        rank = rank + np.searchsorted(inserted_at, rank, side='right')
+    else:
+        rank = rank.copy()
+    rank[positions] = np.searchsorted(values, new_values)
+    return values, rank
+
+
+def _grow(values: np.ndarray, count: int) -> np.ndarray:
+    """뒤에 count 칸을 붙인 복사본"""
+    if not count:
+        return values.copy()
+    return np.concatenate([values, np.zeros(count, dtype=values.dtype)])
+
+
+class FreelancerSnapshot:
+    """프리랜서 배열 묶음 (생성 후 읽기 전용 - 갱신은 apply 로 새 스냅샷 생성, 바뀌지 않은 배열은 공유)"""
+
+    # 매칭 점수 가중치 (합계 1.0)
+    WEIGHT_SKILL = 0.4  # 우대 스킬 보유 비율
+    WEIGHT_INTERVIEW = 0.25  # 최근 면접 총점 (0~100)
+    WEIGHT_RATING = 0.2  # 리뷰 평균 평점 (1~5)
+    WEIGHT_EXPERIENCE = 0.1  # 경력 (EXPERIENCE_CAP 년에서 만점)
+    WEIGHT_BUDGET = 0.05  # 예산 대비 시급이 낮을수록 높음
+
+    EXPERIENCE_CAP = 15
+    NEUTRAL = 0.5  # 평점 / 면접 / 시급 정보가 없을 때의 중립값
+
+    def __init__(self, ids: Sequence[str], names: Sequence[str], columns: Dict[str, Any],
+                 skill_ids: Sequence[str], skill_matrix, alive=None):
+        n = len(ids)
+        self.ids = np.asarray(ids, dtype=object)
+        self.index = {freelancer_id: i for i, freelancer_id in enumerate(ids)}
+        self.names = np.asarray(names, dtype=object)
+        for name, dtype in COLUMNS.items():
+            setattr(self, name, np.asarray(columns[name], dtype=dtype))
+        self.alive = np.ones(n, dtype=bool) if alive is None else np.asarray(alive, dtype=bool)  # 삭제 표시
+        self.skill_ids = list(skill_ids)
+        self.skill_index = {skill_id: i for i, skill_id in enumerate(self.skill_ids)}
+        self.skill_matrix = np.ascontiguousarray(skill_matrix, dtype=bool)
+
+        # 정렬 순위 - 이름은 fold_name 기준 (검색어가 있을 때의 DB 조회와 같은 순서)
+        # 고유값 목록은 변경분 반영 때 바뀐 값만 끼워 넣는 데 사용
+        self.name_values, self.name_rank = _rank([fold_name(name) for name in self.names], object)
+        self.created_values, self.created_rank = _rank(self.created_at, np.int64)
+        self.id_values, self.id_rank = _rank(self.ids.astype(str), object)  # 동점 정렬용 (DB 조회의 id 보조 정렬과 같은 순서)
+        self.built_at = datetime.utcnow()
+
+    @property
+    def size(self) -> int:
+        """살아 있는 프리랜서 수"""
+        return int(self.alive.sum())
+
+    @property
+    def tombstones(self) -> int:
+        return len(self.ids) - self.size
+
+    # ==================== 생성 / 변경분 반영 ====================
+
+    @classmethod
+    def load(cls) -> 'FreelancerSnapshot':
+        """DB에서 전체 스냅샷 생성 (테이블별 한 번씩 스캔, 관계 로딩 없음)"""
+        skill_ids = [skill_id for (skill_id,) in db.session.query(Skill.id).order_by(Skill.id)]
+        ids, names, columns, skills = _load_rows(None)
+        return cls(ids, names, columns, skill_ids, _skill_matrix(skill_ids, ids, skills))
+
+    def apply(self, changed_ids: Iterable[str]) -> 'FreelancerSnapshot':
+        """변경된 프리랜서만 다시 읽어 반영한 새 스냅샷 (DB에 없는 id 는 삭제 표시)"""
+        changed_ids = list(dict.fromkeys(changed_ids))
+        return self.merge(changed_ids, *_load_rows(changed_ids))
+
+    def merge(self, changed_ids: Sequence[str], ids: List[str], names: List[str], columns: Dict[str, Any],
+              skills: List[List[str]]) -> 'FreelancerSnapshot':
+        """다시 읽은 행을 반영한 새 스냅샷
+        - 배열은 복사본에서 해당 위치만 고치고 새 프리랜서는 뒤에 추가 (읽는 중인 이전 스냅샷은 그대로)
+        - 순위는 이름 / 등록일이 바뀌었거나 추가된 행만 끼워 넣음"""
+        appended = [freelancer_id for freelancer_id in ids if freelancer_id not in self.index]
+        new_skills = sorted({s for owned in skills for s in owned if s not in self.skill_index})
+        n_old, extra = len(self.ids), len(appended)
+
+        snapshot = copy.copy(self)
+        snapshot.built_at = datetime.utcnow()
+        if appended:
+            snapshot.ids = np.concatenate([self.ids, np.asarray(appended, dtype=object)])
+            snapshot.index = dict(self.index)
+            snapshot.index.update((freelancer_id, n_old + i) for i, freelancer_id in enumerate(appended))
+        if new_skills:
+            snapshot.skill_ids = self.skill_ids + new_skills
+            snapshot.skill_index = {skill_id: i for i, skill_id in enumerate(snapshot.skill_ids)}
+
+        snapshot.names = _grow(self.names, extra)
+        for name in COLUMNS:
+            setattr(snapshot, name, _grow(getattr(self, name), extra))
+        snapshot.alive = _grow(self.alive, extra)
+        if appended or new_skills:
+            snapshot.skill_matrix = np.zeros((len(snapshot.skill_ids), n_old + extra), dtype=bool)
+            snapshot.skill_matrix[:len(self.skill_ids), :n_old] = self.skill_matrix
+        else:
+            snapshot.skill_matrix = self.skill_matrix.copy()
+
+        positions = np.fromiter((snapshot.index[freelancer_id] for freelancer_id in ids), dtype=np.int64,
+                                count=len(ids))
+        snapshot.names[positions] = np.asarray(names, dtype=object)
+        for name in COLUMNS:
+            getattr(snapshot, name)[positions] = columns[name]
+        snapshot.alive[positions] = True
+        snapshot.skill_matrix[:, positions] = False
+        rows = [snapshot.skill_index[s] for owned in skills for s in owned]
+        if rows:
+            cols = [positions[row] for row, owned in enumerate(skills) for _ in owned]
+            snapshot.skill_matrix[rows, cols] = True
+
+        # 변경 목록에 있었는데 DB에 없으면 삭제된 프리랜서
+        found = set(ids)
+        removed = [snapshot.index[freelancer_id] for freelancer_id in changed_ids
+                   if freelancer_id not in found and freelancer_id in snapshot.index]
+        snapshot.alive[removed] = False
+
+        # 값이 바뀐 행만 순위 갱신 (추가된 행은 항상)
+        existing = positions < n_old
+        folded = np.asarray([fold_name(name) for name in names], dtype=object)
+        renamed = ~existing
+        renamed[existing] = self.name_values[self.name_rank[positions[existing]]] != folded[existing]
+        if renamed.any():
+            snapshot.name_values, snapshot.name_rank = _merge_rank(
+                self.name_values, _grow(self.name_rank, extra), positions[renamed], folded[renamed])
+
+        created_at = np.asarray(columns['created_at'], dtype=np.int64)
+        recreated = ~existing
+        recreated[existing] = self.created_at[positions[existing]] != created_at[existing]
+        if recreated.any():
+            snapshot.created_values, snapshot.created_rank = _merge_rank(
+                self.created_values, _grow(self.created_rank, extra), positions[recreated], created_at[recreated])
+
+        if appended:
+            snapshot.id_values, snapshot.id_rank = _merge_rank(
+                self.id_values, _grow(self.id_rank, extra), np.arange(n_old, n_old + extra), appended)
+        return snapshot
+
+    def missing_ids(self) -> List[str]:
+        """스냅샷에는 살아 있는데 DB에서 삭제된 프리랜서 id"""
+        existing = {freelancer_id for (freelancer_id,) in db.session.query(Freelancer.id)}
+        return [freelancer_id for freelancer_id in self.ids[self.alive] if freelancer_id not in existing]
+
+    # ==================== 목록 필터 / 정렬 ====================
+
+    def list_page(self, skills: Optional[Sequence[str]] = None, availability: Optional[str] = None,
+                  min_rating: Optional[float] = None, min_experience: Optional[int] = None,
+                  max_hourly_rate: Optional[int] = None, sort_by: str = 'name', sort_order: str = 'asc',
+                  page: int = 1, limit: int = 20) -> Tuple[int, List[str]]:
+        """필터 → 정렬 → 페이지의 id 목록 (전체 건수, id 목록)"""
+        mask = self.alive.copy()
+
+        if skills:
+            # 선택한 스킬 중 하나라도 보유
+            rows = [self.skill_index[s] for s in skills if s in self.skill_index]
+            mask &= np.logical_or.reduce(self.skill_matrix[rows], axis=0) if rows else False
+        if availability:
+            mask &= self.availability == AVAILABILITY_CODES.get(availability, UNKNOWN_AVAILABILITY - 1)
+        if min_rating is not None:
+            # 리뷰가 없는 프리랜서는 포함
+            mask &= np.isnan(self.rating) | (self.rating >= min_rating)
+        if min_experience is not None:
+            mask &= self.has_profile & (self.experience >= min_experience)
+        if max_hourly_rate is not None:
+            mask &= self.has_profile & (self.hourly_rate <= max_hourly_rate)
+
+        candidates = np.flatnonzero(mask)
+        total = int(candidates.size)
+        start = (page - 1) * limit
+        if start >= total:
+            return total, []
+
+        # 정렬 키 + id 순위로 유일한 정수 키를 만들어 필요한 만큼만 부분 정렬 (페이지 간 순서 일관)
+        key = getattr(self, SORT_KEYS.get(sort_by, 'created_rank'))[candidates] - NO_PROFILE
+        if sort_order.lower() == 'desc':
+            key = key.max() - key
+        composite = key * len(self.ids) + self.id_rank[candidates]
+
+        end = min(start + limit, total)
+        if end < total:
+            top = np.argpartition(composite, end - 1)[:end]
+        else:
+            top = np.arange(total)
+        top = top[np.argsort(composite[top])][start:end]
+        return total, list(self.ids[candidates[top]])
+
+    # ==================== 매칭 ====================
+
+    def match(self, required_skills: Sequence[str] = (), nice_skills: Sequence[str] = (),
+              max_hourly_rate: Optional[int] = None, min_experience: Optional[int] = None,
+              availability: Optional[Sequence[str]] = None, limit: int = 20) -> Dict[str, Any]:
+        """필수 조건으로 후보를 거르고 가중 점수 상위 limit 명 → {'total', 'items': [(index, score, breakdown)]}"""
+        mask = self.alive.copy()
+
+        if availability:
+            codes = [AVAILABILITY_CODES[a] for a in availability if a in AVAILABILITY_CODES]
+            mask &= np.isin(self.availability, codes)
+        if min_experience is not None:
+            mask &= self.experience >= min_experience
+        if max_hourly_rate is not None:
+            mask &= self.has_profile & (self.hourly_rate <= max_hourly_rate)
+
+        for skill_id in required_skills:
+            row = self.skill_index.get(skill_id)
+            if row is None:
+                mask[:] = False  # 아무도 보유하지 않은 스킬
+                break
+            mask &= self.skill_matrix[row]
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0:
+            return {'total': 0, 'items': []}
+
+        components = self._score_components(candidates, nice_skills, max_hourly_rate)
+        scores = (
+            self.WEIGHT_SKILL * components['skill']
+            + self.WEIGHT_INTERVIEW * components['interview']
+            + self.WEIGHT_RATING * components['rating']
+            + self.WEIGHT_EXPERIENCE * components['experience']
+            + self.WEIGHT_BUDGET * components['budget']
+        )
+
+        # 상위 k개만 부분 정렬 (O(n)) 후 그 안에서만 정렬
+        k = min(limit, candidates.size)
+        if k < candidates.size:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(candidates.size)
+        top = top[np.lexsort((candidates[top], -scores[top]))]  # 점수 내림차순, 동점은 스냅샷 순서
+
+        items = []
+        for position in top:
+            items.append((
+                int(candidates[position]),
+                float(scores[position]),
+                {name: float(values[position]) for name, values in components.items()},
+            ))
+        return {'total': int(candidates.size), 'items': items}
+
+    def _score_components(self, candidates, nice_skills: Sequence[str], max_hourly_rate: Optional[int]):
+        """후보별 0~1 정규화 점수 항목"""
+        nice_rows = [self.skill_index[s] for s in nice_skills if s in self.skill_index]
+        if nice_skills:
+            owned = self.skill_matrix[np.ix_(nice_rows, candidates)].sum(axis=0) if nice_rows else 0
+            skill = np.broadcast_to(np.asarray(owned, dtype=np.float32) / len(nice_skills), candidates.shape)
+        else:
+            skill = np.ones(candidates.size, dtype=np.float32)
+
+        interview = np.nan_to_num(self.interview_score[candidates] / 100.0, nan=self.NEUTRAL)
+        rating = np.nan_to_num(self.rating[candidates] / 5.0, nan=self.NEUTRAL)
+        experience = np.clip(self.experience[candidates], 0, self.EXPERIENCE_CAP) / self.EXPERIENCE_CAP
+
+        rates = self.hourly_rate[candidates]
+        if max_hourly_rate:
+            budget = np.where(rates > 0, np.clip(1.0 - rates / max_hourly_rate, 0.0, 1.0), self.NEUTRAL)
+        else:
+            budget = np.full(candidates.size, self.NEUTRAL)
+
+        return {
+            'skill': skill,
+            'interview': interview,
+            'rating': rating,
+            'experience': experience,
+            'budget': budget,
+        }
+
+    def owned_skills(self, index: int, skill_ids: Sequence[str]) -> List[str]:
+        """프리랜서(index)가 보유한 skill_ids 목록"""
+        return [s for s in skill_ids if s in self.skill_index and self.skill_matrix[self.skill_index[s], index]]
+
+
+# ==================== DB 로딩 ====================
+
+def _load_rows(freelancer_ids: Optional[List[str]]):
+    """프리랜서 행 로딩 (None 이면 전체) → (ids, names, columns, [보유 스킬 id 목록])"""
+    if freelancer_ids is None:
+        batches = [None]
+    else:
+        batches = [freelancer_ids[i:i + ID_BATCH_SIZE] for i in range(0, len(freelancer_ids), ID_BATCH_SIZE)]
+
+    rows, skill_pairs, ratings, interviews = [], [], {}, {}
+    for batch in batches:
+        def scoped(query, column):
+            return query if batch is None else query.filter(column.in_(batch))
+
+        rows += scoped(db.session.query(
+            Freelancer.id, Freelancer.name, Freelancer.created_at,
+            FreelancerProfile.id, FreelancerProfile.experience,
+            FreelancerProfile.hourly_rate, FreelancerProfile.availability,
+        ).outerjoin(FreelancerProfile, FreelancerProfile.freelancer_id == Freelancer.id), Freelancer.id).all()
+
+        skill_pairs += scoped(
+            db.session.query(freelancer_skill.c.freelancer_id, freelancer_skill.c.skill_id),
+            freelancer_skill.c.freelancer_id
+        ).all()
+
+        for freelancer_id, avg_rating, count in scoped(db.session.query(
+            Review.freelancer_id, db.func.avg(Review.rating), db.func.count(Review.id)
+        ), Review.freelancer_id).group_by(Review.freelancer_id):
+            ratings[freelancer_id] = (avg_rating, count)
+
+        interviews.update(_latest_interview_scores(batch))
+
+    rows.sort(key=lambda row: row[0])
+    ids = [row[0] for row in rows]
+    position = {freelancer_id: i for i, freelancer_id in enumerate(ids)}
+    n = len(ids)
+
+    columns = {
+        'has_profile': np.fromiter((row[3] is not None for row in rows), dtype=bool, count=n),
+        'created_at': np.fromiter(
+            (int(row[2].timestamp() * 1_000_000) if row[2] else 0 for row in rows), dtype=np.int64, count=n
+        ),
+        'experience': np.fromiter(
+            (NO_PROFILE if row[3] is None else row[4] or 0 for row in rows), dtype=np.int64, count=n
+        ),
+        'hourly_rate': np.fromiter(
+            (NO_PROFILE if row[3] is None else row[5] or 0 for row in rows), dtype=np.int64, count=n
+        ),
+        'availability': np.fromiter(
+            (AVAILABILITY_CODES.get(row[6], UNKNOWN_AVAILABILITY) for row in rows), dtype=np.int8, count=n
+        ),
+        'rating': np.full(n, np.nan, dtype=np.float32),
+        'review_count': np.zeros(n, dtype=np.int32),
+        'interview_score': np.full(n, np.nan, dtype=np.float32),
+    }
+    for freelancer_id, (avg_rating, count) in ratings.items():
+        if freelancer_id in position:
+            columns['rating'][position[freelancer_id]] = avg_rating
+            columns['review_count'][position[freelancer_id]] = count
+    for freelancer_id, total_score in interviews.items():
+        if freelancer_id in position:
+            columns['interview_score'][position[freelancer_id]] = total_score
+
+    skills = [[] for _ in range(n)]
+    for freelancer_id, skill_id in skill_pairs:
+        if freelancer_id in position:
+            skills[position[freelancer_id]].append(skill_id)
+
+    return ids, [row[1] or '' for row in rows], columns, skills
+
+
+def _latest_interview_scores(freelancer_ids: Optional[List[str]]) -> Dict[str, float]:
+    """프리랜서별 가장 최근 면접의 총점"""
+    latest = db.session.query(
+        InterviewEvaluation.freelancer_id,
+        db.func.max(InterviewEvaluation.evaluated_at).label('evaluated_at')
+    ).filter(InterviewEvaluation.total_score.isnot(None))
+    if freelancer_ids is not None:
+        latest = latest.filter(InterviewEvaluation.freelancer_id.in_(freelancer_ids))
+    latest = latest.group_by(InterviewEvaluation.freelancer_id).subquery()
+
+    rows = db.session.query(InterviewEvaluation.freelancer_id, InterviewEvaluation.total_score).join(
+        latest, db.and_(
+            InterviewEvaluation.freelancer_id == latest.c.freelancer_id,
+            InterviewEvaluation.evaluated_at == latest.c.evaluated_at
+        )
+    ).filter(InterviewEvaluation.total_score.isnot(None))
+    return dict(rows.all())
+
+
+def _skill_matrix(skill_ids: List[str], ids: List[str], skills: List[List[str]]) -> np.ndarray:
+    skill_index = {skill_id: i for i, skill_id in enumerate(skill_ids)}
+    matrix = np.zeros((len(skill_ids), len(ids)), dtype=bool)
+    rows = [skill_index.get(s, -1) for owned in skills for s in owned]
+    cols = [i for i, owned in enumerate(skills) for _ in owned]
+    if rows:
+        rows, cols = np.asarray(rows), np.asarray(cols)
+        valid = rows >= 0
+        matrix[rows[valid], cols[valid]] = True
+    return matrix
+
+
+def changed_freelancer_ids(since: datetime) -> Set[str]:
+    """since 이후 수정된 프리랜서 id (프로필 / 리뷰 / 면접 평가 변경 포함)"""
+    changed = set()
+    for column, updated_at in (
+        (Freelancer.id, Freelancer.updated_at),
+        (FreelancerProfile.freelancer_id, FreelancerProfile.updated_at),
+        (Review.freelancer_id, Review.updated_at),
+        (InterviewEvaluation.freelancer_id, InterviewEvaluation.updated_at),
+    ):
+        changed.update(freelancer_id for (freelancer_id,) in db.session.query(column).filter(updated_at > since))
+    return changed
+
+
+class FreelancerSnapshotService:
+    """프로세스별 스냅샷 보관 - 주기적으로 updated_at 변경분 반영, 가끔 전체 재생성
+    최초 생성 이후의 갱신은 백그라운드 스레드에서 실행 (요청은 이전 스냅샷을 계속 사용, 쿼리도 요청 예산에 포함되지 않음)"""
+
+    REFRESH_INTERVAL = float(os.getenv('FREELANCER_SNAPSHOT_REFRESH', 5))  # 변경분 반영 주기 (초)
+    FULL_REBUILD_INTERVAL = float(os.getenv('FREELANCER_SNAPSHOT_TTL', 3600))  # 전체 재생성 주기 (초)
+    PENDING_WAIT = float(os.getenv('FREELANCER_SNAPSHOT_PENDING_WAIT', 2))  # 방금 쓴 변경의 반영을 기다리는 최대 시간 (초)
+    REFRESH_OVERLAP = timedelta(seconds=5)  # 커밋이 늦은 트랜잭션을 놓치지 않도록 겹쳐서 조회
+    MAX_TOMBSTONE_RATIO = 0.1  # 삭제 표시가 이 비율을 넘으면 전체 재생성
+
+    _snapshot: Optional[FreelancerSnapshot] = None
+    _watermark: Optional[datetime] = None  # 마지막으로 변경분을 읽기 시작한 시각
+    _built_at = 0.0
+    _refreshed_at = 0.0
+    _pending: Set[str] = set()  # 이 프로세스에서 변경한 프리랜서 (다음 요청에서 바로 반영)
+    _version = 0  # invalidate 할 때마다 증가
+    _applied = 0  # 스냅샷에 반영된 _version
+    _refreshing = False  # 백그라운드 갱신 스레드 실행 중
+    _lock = threading.Lock()  # 최초 생성
+    _cond = threading.Condition()  # _pending / _version / _applied / _refreshing 보호
+
+    @classmethod
+    def get(cls) -> FreelancerSnapshot:
+        """현재 스냅샷 - 갱신 시점이면 백그라운드 갱신을 시작하고 이전 스냅샷 반환
+        이 프로세스에서 방금 쓴 변경이 남아 있으면 반영될 때까지 기다림 (PENDING_WAIT 까지)"""
+        if cls._snapshot is None:
+            with cls._lock:
+                if cls._snapshot is None:
+                    cls._update(rebuild=True)
+            return cls._snapshot
+
+        target = cls._version
+        now = time.monotonic()
+        stale = now - cls._refreshed_at > cls.REFRESH_INTERVAL or now - cls._built_at > cls.FULL_REBUILD_INTERVAL
+        if cls._applied < target or stale:
+            cls._start_refresh()
+        if cls._applied < target:
+            with cls._cond:
+                cls._cond.wait_for(lambda: cls._applied >= target or not cls._refreshing, cls.PENDING_WAIT)
+        return cls._snapshot
+
+    @classmethod
+    def invalidate(cls, freelancer_ids: Iterable[str] = ()):
+        """프리랜서 / 평가 변경 후 호출 - 다음 요청에서 해당 프리랜서를 다시 읽음
+        쓰기 큐 작업 안에서는 묶음 커밋 후 반영 (커밋 전에 갱신되면 방금 쓴 행 없이 _pending 이 비워짐)"""
+        freelancer_ids = list(freelancer_ids)
+
+        def mark():
+            with cls._cond:
+                cls._pending.update(freelancer_ids)
+                cls._version += 1
+
+        after_commit(mark)
+
+    @classmethod
+    def _start_refresh(cls):
+        """갱신 스레드가 없으면 시작 (프로세스당 하나)"""
+        with cls._cond:
+            if cls._refreshing:
+                return
+            cls._refreshing = True
+        app = current_app._get_current_object()
+        threading.Thread(target=cls._refresh_loop, args=(app,), name='freelancer-snapshot', daemon=True).start()
+
+    @classmethod
+    def _refresh_loop(cls, app):
+        """백그라운드 갱신 - 갱신 중에 들어온 invalidate 가 있으면 이어서 한 번 더"""
+        try:
+            with app.app_context():
+                try:
+                    while True:
+                        cls._update(rebuild=time.monotonic() - cls._built_at > cls.FULL_REBUILD_INTERVAL)
+                        with cls._cond:
+                            if cls._applied >= cls._version:
+                                cls._refreshing = False
+                                cls._cond.notify_all()
+                                return
+                finally:
+                    db.session.remove()
+        except Exception as e:
+            print(f'⚠️  프리랜서 스냅샷 갱신 실패: {str(e)}')
+            with cls._cond:
+                cls._refreshed_at = time.monotonic()  # 다음 주기까지 재시도 보류 (변경분은 _pending 에 남음)
+                cls._refreshing = False
+                cls._cond.notify_all()
+
+    @classmethod
+    def _update(cls, rebuild: bool):
+        """갱신 1회 - 시작 시점까지 들어온 invalidate 를 반영"""
+        with cls._cond:
+            version, pending, cls._pending = cls._version, cls._pending, set()
+        try:
+            # 복제본은 늦을 수 있음 → 변경분 / 방금 쓴 프리랜서를 놓치지 않도록 primary 에서 읽음
+            with use_primary():
+                if rebuild:
+                    cls._rebuild()
+                else:
+                    cls._refresh(pending)
+        except Exception:
+            with cls._cond:
+                cls._pending |= pending
+            raise
+        with cls._cond:
+            cls._applied = max(cls._applied, version)
+            cls._cond.notify_all()
+
+    @classmethod
+    def _rebuild(cls):
+        started = datetime.utcnow()
+        cls._snapshot = FreelancerSnapshot.load()
+        cls._watermark = started
+        cls._built_at = cls._refreshed_at = time.monotonic()
+
+    @classmethod
+    def _refresh(cls, pending: Set[str]):
+        started = datetime.utcnow()
+        snapshot = cls._snapshot
+
+        changed = changed_freelancer_ids(cls._watermark - cls.REFRESH_OVERLAP) | pending
+        if changed:
+            snapshot = snapshot.apply(changed)
+
+        # 삭제는 updated_at 으로 보이지 않음 → 건수가 다를 때만 id 대조
+        if Freelancer.query.count() != snapshot.size:
+            missing = snapshot.missing_ids()
+            if missing:
+                snapshot = snapshot.apply(missing)
+
+        if snapshot.tombstones > len(snapshot.ids) * cls.MAX_TOMBSTONE_RATIO:
+            cls._rebuild()
+            return
+
+        cls._snapshot = snapshot
+        cls._watermark = started
+        cls._refreshed_at = time.monotonic()
@@ -0,0 +1,221 @@
+"""
+업로드 파일 가비지 컬렉터
+- 삭제 표시된 문서: 보존 기간이 지나면 파일 삭제 + 레코드 영구 삭제
+- uploads/freelancer/* 를 freelancer_document.file_path 와 대조해 어디서도 참조하지 않는 파일 정리
+- 만료된 분할 업로드 세션 정리
+- 파일 삭제는 초당 개수 / 바이트 상한으로 속도 제한 (디스크 I/O 를 서비스 요청과 나눠 씀)
+"""
+import os
+import time
+import shutil
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+
+from app.db import db
+from app.models import FreelancerDocument
+from app.services.upload_service import ChunkedUploadService
+
+SAMPLE_LIMIT = 20  # 리포트에 남길 경로 예시 수
+
+
+class _RateLimiter:
+    """초당 작업 수 / 바이트 상한 - 누적량 기준으로 필요한 만큼 sleep"""
+
+    def __init__(self, ops_per_sec: Optional[float], bytes_per_sec: Optional[float]):
+        self.ops_per_sec = ops_per_sec
+        self.bytes_per_sec = bytes_per_sec
+        self.started = time.monotonic()
+        self.ops = 0
+        self.bytes = 0
+
+    def consume(self, size: int):
+        self.ops += 1
+        self.bytes += size
+        required = 0.0
+        if self.ops_per_sec:
+            required = max(required, self.ops / self.ops_per_sec)
+        if self.bytes_per_sec:
+            required = max(required, self.bytes / self.bytes_per_sec)
+        delay = required - (time.monotonic() - self.started)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class UploadGCService:
+    """업로드 디렉토리와 DB 대조 및 정리"""
+
+    @staticmethod
+    def run(upload_root: str, grace_seconds: int = 24 * 60 * 60, batch_size: int = 100,
+            ops_per_sec: Optional[float] = 20, bytes_per_sec: Optional[float] = None,
+            dry_run: bool = False) -> Dict[str, Any]:
+        """GC 1회 실행 → 리포트 (dry_run 이면 아무것도 지우지 않고 대상만 집계)"""
+        report = {
+            'dryRun': dry_run,
+            'purgedRows': 0,
+            'scannedFiles': 0,
+            'referencedFiles': 0,
+            'orphanFiles': 0,
+            'orphanBytes': 0,
+            'deletedFiles': 0,
+            'deletedBytes': 0,
+            'skippedRecentFiles': 0,
+            'missingFiles': 0,
+            'expiredUploadSessions': 0,
+            'errors': [],
+            'orphanSamples': [],
+        }
+        UploadGCService._check_path_base()
+
+        limiter = _RateLimiter(ops_per_sec, bytes_per_sec)
+        cutoff = datetime.utcnow() - timedelta(seconds=grace_seconds)
+
+        UploadGCService._purge_deleted_documents(cutoff, batch_size, limiter, dry_run, report)
+        UploadGCService._collect_orphan_files(
+            os.path.join(upload_root, 'freelancer'), time.time() - grace_seconds,
+            batch_size, limiter, dry_run, report
+        )
+        UploadGCService._collect_expired_uploads(os.path.join(upload_root, 'chunks'), limiter, dry_run, report)
+        return report
+
+    # ==================== 삭제 표시된 문서 ====================
+
+    @staticmethod
+    def _purge_deleted_documents(cutoff: datetime, batch_size: int, limiter: _RateLimiter,
+                                 dry_run: bool, report: Dict[str, Any]):
+        """보존 기간이 지난 삭제 표시 문서 - 다른 문서가 같은 파일을 쓰지 않으면 파일 삭제 후 레코드 삭제"""
+        last_id = ''
+        while True:
+            rows = db.session.query(FreelancerDocument.id, FreelancerDocument.file_path).filter(
+                FreelancerDocument.deleted_at.isnot(None),
+                FreelancerDocument.deleted_at < cutoff,
+                FreelancerDocument.id > last_id
+            ).order_by(FreelancerDocument.id).limit(batch_size).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            shared = {
+                file_path for (file_path,) in db.session.query(FreelancerDocument.file_path).filter(
+                    FreelancerDocument.file_path.in_({row.file_path for row in rows}),
+                    FreelancerDocument.deleted_at.is_(None)
+                )
+            }
+            for row in rows:
+                if row.file_path not in shared:
+                    UploadGCService._remove_file(row.file_path, limiter, dry_run, report)
+
+            report['purgedRows'] += len(rows)
+            if not dry_run:
+                db.session.execute(
+                    db.delete(FreelancerDocument).where(FreelancerDocument.id.in_([row.id for row in rows]))
+                )
+                db.session.commit()
+
+    # ==================== 참조되지 않는 파일 ====================
+
+    @staticmethod
+    def _collect_orphan_files(freelancer_root: str, mtime_cutoff: float, batch_size: int,
+                              limiter: _RateLimiter, dry_run: bool, report: Dict[str, Any]):
+        """프리랜서 디렉토리 단위로 묶어 DB 참조 경로와 대조"""
+        if not os.path.isdir(freelancer_root):
+            return
+
+        directories = sorted(
+            name for name in os.listdir(freelancer_root)
+            if os.path.isdir(os.path.join(freelancer_root, name))
+        )
+        for start in range(0, len(directories), batch_size):
+            batch = directories[start:start + batch_size]
+            # 삭제 표시된 문서도 참조로 취급 (보존 기간 동안은 복구 가능해야 함)
+            referenced = UploadGCService._referenced_paths(batch)
+
+            for freelancer_id in batch:
+                directory = os.path.join(freelancer_root, freelancer_id)
+                for entry in os.scandir(directory):
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    report['scannedFiles'] += 1
+                    path = os.path.abspath(entry.path)
+                    if path in referenced:
+                        report['referencedFiles'] += 1
+                        continue
+
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime > mtime_cutoff:
+                        # 저장 직후 아직 커밋되지 않은 업로드일 수 있음
+                        report['skippedRecentFiles'] += 1
+                        continue
+
+                    report['orphanFiles'] += 1
+                    report['orphanBytes'] += stat.st_size
+                    if len(report['orphanSamples']) < SAMPLE_LIMIT:
+                        report['orphanSamples'].append(entry.path)
+                    UploadGCService._remove_file(entry.path, limiter, dry_run, report, size=stat.st_size)
+
+                if not dry_run:
+                    try:
+                        os.rmdir(directory)  # 비어 있을 때만 삭제됨
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def _referenced_paths(freelancer_ids: List[str]) -> Set[str]:
+        """프리랜서들의 문서 파일 경로 (절대 경로로 정규화)"""
+        rows = db.session.query(FreelancerDocument.file_path).filter(
+            FreelancerDocument.freelancer_id.in_(freelancer_ids)
+        )
+        return {os.path.abspath(file_path) for (file_path,) in rows}
+
+    # ==================== 분할 업로드 세션 ====================
+
+    @staticmethod
+    def _collect_expired_uploads(chunk_root: str, limiter: _RateLimiter, dry_run: bool, report: Dict[str, Any]):
+        """보존 시간이 지난 미완료 분할 업로드 세션 삭제"""
+        for session_dir in ChunkedUploadService.find_expired_sessions(chunk_root):
+            report['expiredUploadSessions'] += 1
+            if dry_run:
+                continue
+            size = sum(entry.stat().st_size for entry in os.scandir(session_dir) if entry.is_file())
+            shutil.rmtree(session_dir, ignore_errors=True)
+            limiter.consume(size)
+
+    # ==================== Helpers ====================
+
+    @staticmethod
+    def _check_path_base(sample_size: int = 50):
+        """DB 의 상대 file_path 가 현재 작업 디렉토리 기준으로 풀리는지 확인 (다르면 모든 파일이 고아로 보임)"""
+        paths = [file_path for (file_path,) in db.session.query(FreelancerDocument.file_path).filter(
+            FreelancerDocument.deleted_at.is_(None)
+        ).limit(sample_size)]
+        if paths and not any(os.path.exists(path) for path in paths):
+            raise ValueError(
+                f'문서 파일 경로를 찾을 수 없습니다 (예: {paths[0]}). '
+                f'서버와 같은 작업 디렉토리에서 실행하세요'
+            )
+
+    @staticmethod
+    def _remove_file(path: str, limiter: _RateLimiter, dry_run: bool, report: Dict[str, Any],
+                     size: Optional[int] = None):
+        """속도 제한을 지키며 파일 삭제 (실패는 리포트에 기록하고 계속 진행)"""
+        try:
+            if size is None:
+                size = os.path.getsize(path)
+        except FileNotFoundError:
+            report['missingFiles'] += 1
+            return
+
+        if dry_run:
+            return
+
+        try:
+            os.remove(path)
+            report['deletedFiles'] += 1
+            report['deletedBytes'] += size
+        except FileNotFoundError:
+            report['missingFiles'] += 1
+            return
+        except OSError as e:
+            report['errors'].append(f'{path}: {str(e)}')
+            return
+
+        limiter.consume(size)
@@ -4,6 +4,7 @@ Interview Evaluation Service - 면접 평가 비즈니스 로직
 """
 import uuid
 from datetime import datetime
+from sqlalchemy.orm import selectinload
 from app.db import db
 from app.models import (
     InterviewEvaluation, InterviewCategory, InterviewQuestion,
@@ -12,6 +13,9 @@ from app.models import (
     Freelancer
 )
 from app.utils import paginate
+from app.services.analytics_service import InterviewAnalyticsService
+from app.services.freelancer_snapshot import FreelancerSnapshotService
+from app.write_queue import serialized_write
 
 
 class InterviewCategoryService:
@@ -89,6 +93,7 @@ class InterviewCategoryService:
     def delete(category_id):
         """카테고리 삭제 (관련 데이터도 CASCADE)"""
         category = InterviewCategoryService.get_by_id(category_id)
+        InterviewAnalyticsService.remove_category(category_id)
         db.session.delete(category)
         db.session.commit()
         return True
@@ -258,6 +263,7 @@ class InterviewRedFlagService:
     def delete(red_flag_id):
         """레드플래그 삭제"""
         red_flag = InterviewRedFlagService.get_by_id(red_flag_id)
+        InterviewAnalyticsService.remove_red_flag(red_flag_id)
         db.session.delete(red_flag)
         db.session.commit()
         return True
@@ -266,11 +272,19 @@ class InterviewRedFlagService:
 class InterviewEvaluationService:
     """면접 평가 서비스 - 핵심 CRUD"""
 
+    # to_dict() 의 점수 / 체크포인트 결과 / 레드플래그 발견 + 각 항목의 카테고리 / 체크포인트 / 레드플래그 이름
+    # (평가 수와 무관하게 관계당 쿼리 1개)
+    DETAIL_LOAD_OPTIONS = (
+        selectinload(InterviewEvaluation.category_scores).joinedload(InterviewCategoryScore.category),
+        selectinload(InterviewEvaluation.results).joinedload(InterviewEvaluationResult.checkpoint),
+        selectinload(InterviewEvaluation.red_flag_findings).joinedload(InterviewRedFlagFinding.red_flag),
+    )
+
     @staticmethod
     def get_list(page=1, limit=20, freelancer_id=None, recommendation=None, min_score=None,
                  sort_by='evaluated_at', sort_order='desc'):
         """평가 목록 조회"""
-        query = InterviewEvaluation.query
+        query = InterviewEvaluation.query.options(*InterviewEvaluationService.DETAIL_LOAD_OPTIONS)
 
         if freelancer_id:
             query = query.filter_by(freelancer_id=freelancer_id)
@@ -291,14 +305,20 @@ class InterviewEvaluationService:
         return paginate(query, page, limit)
 
     @staticmethod
-    def get_by_id(evaluation_id):
-        """평가 조회"""
-        evaluation = InterviewEvaluation.query.get(evaluation_id)
+    def get_by_id(evaluation_id, with_details=False):
+        """평가 조회 (with_details: to_dict() 용 관계까지 미리 로드)"""
+        if with_details:
+            evaluation = InterviewEvaluation.query.options(
+                *InterviewEvaluationService.DETAIL_LOAD_OPTIONS
+            ).filter_by(id=evaluation_id).first()
+        else:
+            evaluation = InterviewEvaluation.query.get(evaluation_id)
         if not evaluation:
             raise ValueError(f'평가를 찾을 수 없습니다: {evaluation_id}')
         return evaluation
 
     @staticmethod
+    @serialized_write
     def create(freelancer_id, interviewer_name=None, project_name=None,
                evaluated_at=None, notes=None):
         """평가 생성"""
@@ -323,6 +343,7 @@ class InterviewEvaluationService:
         return evaluation
 
     @staticmethod
+    @serialized_write
     def update(evaluation_id, **kwargs):
         """평가 수정"""
         evaluation = InterviewEvaluationService.get_by_id(evaluation_id)
@@ -335,17 +356,23 @@ class InterviewEvaluationService:
                 setattr(evaluation, key, value)
 
         db.session.commit()
+        FreelancerSnapshotService.invalidate([evaluation.freelancer_id])
         return evaluation
 
     @staticmethod
+    @serialized_write
     def delete(evaluation_id):
         """평가 삭제"""
         evaluation = InterviewEvaluationService.get_by_id(evaluation_id)
+        freelancer_id = evaluation.freelancer_id
+        InterviewAnalyticsService.remove_evaluations([evaluation_id])
         db.session.delete(evaluation)
         db.session.commit()
+        FreelancerSnapshotService.invalidate([freelancer_id])
         return True
 
     @staticmethod
+    @serialized_write
     def add_category_score(evaluation_id, category_id, score, score_label, checked_count=0):
         """카테고리 점수 추가"""
         # 평가 존재 확인
@@ -368,10 +395,12 @@ class InterviewEvaluationService:
             checked_count=checked_count
         )
         db.session.add(category_score)
+        InterviewAnalyticsService.apply_category_score(category_id, score, checked_count)
         db.session.commit()
         return category_score
 
     @staticmethod
+    @serialized_write
     def update_category_score(evaluation_id, category_id, score, score_label, checked_count=0):
         """카테고리 점수 수정 또는 생성"""
         category_score = InterviewCategoryScore.query.filter_by(
@@ -387,13 +416,18 @@ class InterviewEvaluationService:
         if score not in [1.0, 3.0, 5.0]:
             raise ValueError(f'잘못된 점수: {score}. 1.0, 3.0, 5.0만 가능합니다')
 
+        InterviewAnalyticsService.apply_category_score(
+            category_id, category_score.score, category_score.checked_count, -1
+        )
         category_score.score = score
         category_score.score_label = score_label
         category_score.checked_count = checked_count
+        InterviewAnalyticsService.apply_category_score(category_id, score, checked_count)
         db.session.commit()
         return category_score
 
     @staticmethod
+    @serialized_write
     def add_checkpoint_result(evaluation_id, checkpoint_id, is_checked=False, notes=None):
         """체크포인트 결과 추가"""
         # 평가 존재 확인
@@ -421,6 +455,7 @@ class InterviewEvaluationService:
         return result
 
     @staticmethod
+    @serialized_write
     def update_checkpoint_result(evaluation_id, checkpoint_id, is_checked=None, notes=None):
         """체크포인트 결과 수정"""
         result = InterviewEvaluationResult.query.filter_by(
@@ -442,6 +477,7 @@ class InterviewEvaluationService:
         return result
 
     @staticmethod
+    @serialized_write
     def add_red_flag_finding(evaluation_id, red_flag_id, is_found=False, severity_actual=None, evidence=None):
         """레드플래그 발견 추가"""
         # 평가 존재 확인
@@ -469,10 +505,12 @@ class InterviewEvaluationService:
             evidence=evidence
         )
         db.session.add(finding)
+        InterviewAnalyticsService.apply_red_flag_finding(red_flag_id, is_found, severity_actual)
         db.session.commit()
         return finding
 
     @staticmethod
+    @serialized_write
     def update_red_flag_finding(evaluation_id, red_flag_id, is_found=None,
                                severity_actual=None, evidence=None):
         """레드플래그 발견 수정"""
@@ -486,17 +524,22 @@ class InterviewEvaluationService:
                 evaluation_id, red_flag_id, is_found or False, severity_actual, evidence
             )
 
+        InterviewAnalyticsService.apply_red_flag_finding(
+            red_flag_id, finding.is_found, finding.severity_actual, -1
+        )
         if is_found is not None:
             finding.is_found = is_found
         if severity_actual is not None:
             finding.severity_actual = severity_actual
         if evidence is not None:
             finding.evidence = evidence
+        InterviewAnalyticsService.apply_red_flag_finding(red_flag_id, finding.is_found, finding.severity_actual)
 
         db.session.commit()
         return finding
 
     @staticmethod
+    @serialized_write
     def calculate_total_score(evaluation_id):
         """총점 계산 및 저장"""
         evaluation = InterviewEvaluationService.get_by_id(evaluation_id)
@@ -517,9 +560,11 @@ class InterviewEvaluationService:
             evaluation.total_score = (total_points / category_count / 5.0) * 100
 
         db.session.commit()
+        FreelancerSnapshotService.invalidate([evaluation.freelancer_id])  # 매칭 점수에 최근 면접 총점 사용
         return evaluation.total_score
 
     @staticmethod
+    @serialized_write
     def set_recommendation(evaluation_id, recommendation, notes=None):
         """추천 여부 설정"""
         evaluation = InterviewEvaluationService.get_by_id(evaluation_id)
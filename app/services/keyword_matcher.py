@@ -0,0 +1,253 @@
+"""
+다중 키워드 매칭 서비스
+Aho-Corasick 오토마톤으로 스킬/기술/언어 키워드를 텍스트 한 번 순회로 검색
+"""
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from flask import has_app_context
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models import Skill
+
+
+# 스킬 ID별 동의어 (소문자) - Skill.id / Skill.name 외 추가 표기
+# 'js', 'node' 같은 짧은 표기는 넣지 않음 ('.' 은 단어 문자가 아니라 'Vue.js' 의 'js', 'tree node' 의 'node' 도 매칭됨)
+SKILL_SYNONYMS = {
+    'react': ['react', 'reactjs', 'react.js', '리액트'],
+    'vue': ['vue', 'vuejs', 'vue.js'],
+    'angular': ['angular', 'angularjs'],
+    'typescript': ['typescript', '타입스크립트'],
+    'javascript': ['javascript', '자바스크립트'],
+    'html5': ['html', 'html5'],
+    'css3': ['css', 'css3'],
+    'tailwind': ['tailwind', 'tailwindcss'],
+    'nodejs': ['nodejs', 'node.js'],
+    'python': ['python', '파이썬'],
+    'java': ['java', '자바'],
+    'dotnet': ['.net', 'dotnet', 'asp.net'],
+    'php': ['php'],
+    'golang': ['golang'],
+    'rust': ['rust'],
+    'mysql': ['mysql', 'mariadb'],
+    'postgresql': ['postgresql', 'postgres'],
+    'mongodb': ['mongodb', 'mongo'],
+    'redis': ['redis'],
+    'docker': ['docker', '도커'],
+    'kubernetes': ['kubernetes', 'k8s', '쿠버네티스'],
+    'aws': ['aws', 'amazon web services'],
+    'gcp': ['gcp', 'google cloud'],
+    'azure': ['azure'],
+    'jenkins': ['jenkins', '젠킨스'],
+    'gitlab-ci': ['gitlab', 'gitlab ci', 'gitlab-ci'],
+    'figma': ['figma', '피그마'],
+    'ui-ux': ['ui/ux', 'ux/ui'],
+    'photoshop': ['photoshop', '포토샵'],
+    'illustrator': ['illustrator', '일러스트레이터'],
+}
+
+# 언어 능력 키워드 (표준 언어명 → 표기)
+LANGUAGE_KEYWORDS = {
+    '한국어': ['한국어', 'korean'],
+    '영어': ['영어', 'english'],
+    '일본어': ['일본어', 'japanese'],
+    '중국어': ['중국어', 'chinese'],
+    '스페인어': ['스페인어', 'spanish'],
+    '독일어': ['독일어', 'german'],
+    '프랑스어': ['프랑스어', 'french'],
+}
+
+logger = logging.getLogger('app.skill_matcher')
+
+KIND_SKILL = 'skill'
+KIND_LANGUAGE = 'language'
+
+# 스킬명이 이보다 짧으면 ('Go' 등) 일반 단어와 겹치므로 동의어에 있을 때만 매칭
+MIN_AUTO_ALIAS_LENGTH = 3
+
+
+def _is_word_char(ch: str) -> bool:
+    """정규식 \\w 와 같은 기준의 단어 문자 여부"""
+    return ch.isalnum() or ch == '_'
+
+
+class KeywordMatcher:
+    """Aho-Corasick 다중 키워드 매처 (단어 경계 검사 포함)"""
+
+    def __init__(self, keywords: Dict[str, Tuple[str, str]]):
+        """keywords: 소문자 표기 → (종류, 표준 ID)"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Tuple[str, str], bool, bool]]] = [[]]
+
+        for alias, target in keywords.items():
+            if alias:
+                self._add(alias, target)
+        self._build_failure_links()
+
+    def _add(self, alias: str, target: Tuple[str, str]):
+        node = 0
+        for ch in alias:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+
+        # 경계 검사가 필요한 쪽만 기록 (별칭 끝 문자가 단어 문자일 때만 \b 의미가 있음)
+        check_start = _is_word_char(alias[0])
+        check_end = _is_word_char(alias[-1])
+        self._output[node].append((len(alias), target, check_start, check_end))
+
+    def _build_failure_links(self):
+        queue = deque()
+        for node in self._goto[0].values():
+            queue.append(node)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> Set[Tuple[str, str]]:
+        """텍스트에서 매칭된 (종류, 표준 ID) 집합 반환 - 대소문자 무시, 한 번 순회"""
+        text = text.lower()
+        text_length = len(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        root = goto[0]
+        found = set()
+        node = 0
+
+        for end, ch in enumerate(text):
+            if node == 0:
+                # 대부분의 문자는 어떤 키워드의 시작도 아니므로 루트에서 바로 건너뜀
+                node = root.get(ch, 0)
+                if node == 0:
+                    continue
+            else:
+                while node and ch not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(ch, 0)
+
+            for length, target, check_start, check_end in output[node]:
+                if target in found:
+                    continue
+                start = end - length + 1
+                if check_start and start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if check_end and end + 1 < text_length and _is_word_char(text[end + 1]):
+                    continue
+                found.add(target)
+
+        return found
+
+
+class SkillMatcher:
+    """Skill 테이블 기반 매처 관리 - 스킬 변경 시 다음 사용 시점에 재빌드"""
+
+    REFRESH_INTERVAL = 300  # 다른 프로세스의 스킬 변경 반영 주기 (초)
+    RETRY_INTERVAL = 30  # 스킬 목록 조회 실패 후 다시 조회하기까지 (초)
+
+    _lock = threading.Lock()
+    _matcher: Optional[KeywordMatcher] = None
+    _built_at = 0.0
+    _dirty = True
+    _skills: Optional[List[Tuple[str, str]]] = None  # 명시적으로 주입된 스킬 목록
+
+    @classmethod
+    def get(cls) -> KeywordMatcher:
+        """현재 매처 반환 (필요 시 재빌드)"""
+        matcher = cls._matcher
+        if matcher is not None and not cls._dirty and time.monotonic() - cls._built_at < cls.REFRESH_INTERVAL:
+            return matcher
+
+        with cls._lock:
+            if cls._matcher is None or cls._dirty or time.monotonic() - cls._built_at >= cls.REFRESH_INTERVAL:
+                skills = cls._load_skills()
+                if skills is None:
+                    # DB 조회 실패 → 이전 매처(없으면 동의어 사전 매처)를 쓰고 RETRY_INTERVAL 뒤에 다시 조회
+                    if cls._matcher is None:
+                        cls._matcher = cls.build(cls._fallback_skills())
+                    cls._built_at = time.monotonic() - cls.REFRESH_INTERVAL + cls.RETRY_INTERVAL
+                else:
+                    cls._matcher = cls.build(skills)
+                    cls._built_at = time.monotonic()
+                cls._dirty = False
+            return cls._matcher
+
+    @classmethod
+    def invalidate(cls):
+        """스킬 변경 시 호출 - 다음 사용 시점에 재빌드"""
+        cls._dirty = True
+
+    @classmethod
+    def use_skills(cls, skills: Iterable[Tuple[str, str]]):
+        """DB 없이 동작하는 워커 프로세스용 스킬 목록 주입 [(id, name), ...]"""
+        cls._skills = list(skills)
+        cls.invalidate()
+
+    @classmethod
+    def load_skills(cls) -> List[Tuple[str, str]]:
+        """Skill 테이블에서 (id, name) 목록 조회"""
+        return [(skill_id, name) for skill_id, name in Skill.query.with_entities(Skill.id, Skill.name).all()]
+
+    @classmethod
+    def _load_skills(cls) -> Optional[List[Tuple[str, str]]]:
+        """매처에 쓸 스킬 목록 (DB 조회 실패 시 None)"""
+        if cls._skills is not None:
+            return cls._skills
+        if not has_app_context():
+            return cls._fallback_skills()
+        try:
+            return cls.load_skills()
+        except SQLAlchemyError as e:
+            logger.warning('스킬 목록 조회 실패 - %s초 뒤 다시 조회: %s', cls.RETRY_INTERVAL, e)
+            return None
+
+    @staticmethod
+    def _fallback_skills() -> List[Tuple[str, str]]:
+        """DB를 쓸 수 없을 때 - 동의어 사전의 스킬 ID만 사용"""
+        return [(skill_id, skill_id) for skill_id in SKILL_SYNONYMS]
+
+    @staticmethod
+    def build(skills: Iterable[Tuple[str, str]]) -> KeywordMatcher:
+        """스킬 목록 + 동의어 + 언어 키워드로 매처 생성"""
+        keywords = {}
+        for language, aliases in LANGUAGE_KEYWORDS.items():
+            for alias in aliases:
+                keywords[alias.lower()] = (KIND_LANGUAGE, language)
+
+        for skill_id, name in skills:
+            target = (KIND_SKILL, skill_id)
+            aliases = set(SKILL_SYNONYMS.get(skill_id, []))
+            for candidate in (skill_id, name):
+                if candidate and len(candidate) >= MIN_AUTO_ALIAS_LENGTH:
+                    aliases.add(candidate.lower())
+            for alias in aliases:
+                keywords[alias.lower()] = target
+
+        return KeywordMatcher(keywords)
+
+    @staticmethod
+    def split(matches: Set[Tuple[str, str]], kind: str) -> List[str]:
+        """매칭 결과에서 한 종류의 표준 ID만 정렬하여 반환"""
+        return sorted(value for match_kind, value in matches if match_kind == kind)
+
+
+@event.listens_for(Skill, 'after_insert')
+@event.listens_for(Skill, 'after_update')
+@event.listens_for(Skill, 'after_delete')
+def _invalidate_skill_matcher(mapper, connection, target):
+    SkillMatcher.invalidate()
@@ -0,0 +1,323 @@
+"""
+문서 전문 검색 서비스
+- SQLite: 본문을 저장하지 않는 FTS5 가상 테이블 (document_fts, content='', 접두어 검색)
+  + rowid ↔ 문서 ID 매핑 테이블 (document_fts_map)
+- MySQL: FULLTEXT 인덱스 + ngram 파서 테이블 (document_search, 한국어 부분 일치)
+- 인덱스는 문서 분석이 끝날 때 갱신, 스니펫은 결과 페이지 문서만 압축된 원문(extracted_text)에서 계산
+  (DB 종류와 무관하게 동일한 응답, 검색 쿼리가 본문을 읽지 않음)
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import DBAPIError
+
+from app.db import db, CompressedText
+from app.models import FreelancerDocument
+
+MAX_TERMS = 8
+SNIPPET_CONTEXT = 40  # 스니펫 앞뒤 글자 수
+MAX_SNIPPETS_PER_TERM = 3
+BACKFILL_BATCH_SIZE = 200
+
+# 본문은 freelancer_document.extracted_text (압축) 에만 저장 - 색인에는 토큰만 남김
+# contentless 테이블은 값 없이 rowid 만 돌려주므로 문서 ID 는 매핑 테이블로 연결
+SQLITE_DDL = (
+    "CREATE TABLE IF NOT EXISTS document_fts_map ("
+    "rowid INTEGER PRIMARY KEY, "
+    "document_id VARCHAR(36) NOT NULL UNIQUE, "
+    "freelancer_id VARCHAR(36) NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_document_fts_map_freelancer_id ON document_fts_map (freelancer_id)",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS document_fts USING fts5("
+    "body, content = '', "
+    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')",
+)
+
+MYSQL_DDL = (
+    "CREATE TABLE IF NOT EXISTS document_search ("
+    "document_id VARCHAR(36) PRIMARY KEY, "
+    "freelancer_id VARCHAR(36) NOT NULL, "
+    "body LONGTEXT NOT NULL, "
+    "INDEX idx_freelancer_id (freelancer_id), "
+    "FULLTEXT INDEX ft_body (body) WITH PARSER ngram"
+    ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci",
+)
+
+# SQLite: 색인된 문서의 rowid + 색인 당시 원문 (contentless 테이블의 'delete' 명령에 원문 토큰이 필요)
+INDEXED_SOURCE_SQL = (
+    'SELECT m.rowid, m.document_id, d.extracted_text FROM document_fts_map m '
+    'JOIN freelancer_document d ON d.id = m.document_id WHERE {condition}'
+)
+
+
+class DocumentSearchService:
+    """추출 텍스트 역색인 관리 및 검색"""
+
+    _available: Optional[bool] = None
+
+    @staticmethod
+    def _dialect() -> str:
+        return db.engine.dialect.name
+
+    @staticmethod
+    def ensure_index():
+        """검색 인덱스 테이블 생성 (없을 때만) + 기존 문서 색인"""
+        dialect = DocumentSearchService._dialect()
+        if dialect == 'sqlite':
+            table, ddl = 'document_fts_map', SQLITE_DDL
+        elif dialect == 'mysql':
+            table, ddl = 'document_search', MYSQL_DDL
+        else:
+            DocumentSearchService._available = False
+            return
+
+        inspector = db.inspect(db.engine)
+        if inspector.has_table(table):
+            DocumentSearchService._available = True
+            return
+
+        try:
+            with db.engine.begin() as conn:
+                if dialect == 'sqlite' and inspector.has_table('document_fts'):
+                    # 본문을 함께 저장하던 이전 형식 → 삭제 후 다시 색인
+                    conn.execute(text('DROP TABLE document_fts'))
+                for statement in ddl:
+                    conn.execute(text(statement))
+        except DBAPIError as e:
+            # FTS5 미포함 SQLite 빌드 등 - 검색만 비활성화하고 앱은 계속 동작
+            DocumentSearchService._available = False
+            print(f'⚠️  전문 검색 인덱스 생성 실패: {str(e.orig)}')
+            return
+
+        DocumentSearchService._available = True
+        indexed = DocumentSearchService.rebuild_index()
+        print(f'✅ 전문 검색 인덱스 생성 완료 ({indexed}건 색인)')
+
+    @staticmethod
+    def rebuild_index() -> int:
+        """분석된 전체 문서 재색인 (기존 색인 비우고 배치 단위로)"""
+        if DocumentSearchService._dialect() == 'sqlite':
+            db.session.execute(text("INSERT INTO document_fts (document_fts) VALUES ('delete-all')"))
+            db.session.execute(text('DELETE FROM document_fts_map'))
+        else:
+            db.session.execute(text('DELETE FROM document_search'))
+        db.session.commit()
+
+        query = db.session.query(
+            FreelancerDocument.id,
+            FreelancerDocument.freelancer_id,
+            FreelancerDocument.extracted_text,
+        ).filter(
+            FreelancerDocument.extracted_text.isnot(None),
+            FreelancerDocument.deleted_at.is_(None)
+        ).order_by(FreelancerDocument.id)
+
+        indexed = 0
+        last_id = ''
+        while True:
+            rows = query.filter(FreelancerDocument.id > last_id).limit(BACKFILL_BATCH_SIZE).all()
+            if not rows:
+                break
+            DocumentSearchService.index_documents(rows)
+            db.session.commit()
+            indexed += len(rows)
+            last_id = rows[-1].id
+        return indexed
+
+    @staticmethod
+    def index_document(document_id: str, freelancer_id: str, body: str):
+        """문서 한 건 색인 (호출한 세션의 트랜잭션에 포함)"""
+        DocumentSearchService.index_documents([(document_id, freelancer_id, body)])
+
+    @staticmethod
+    def index_documents(rows: Iterable[Tuple[str, str, str]]):
+        """(document_id, freelancer_id, text) 목록 색인 - 기존 항목은 교체
+        SQLite 는 기존 색인을 지울 때 저장된 원문을 읽으므로 extracted_text 를 바꾸기 전에 호출"""
+        if not DocumentSearchService._available:
+            return
+
+        params = [
+            {'document_id': document_id, 'freelancer_id': freelancer_id, 'body': body or ''}
+            for document_id, freelancer_id, body in rows
+        ]
+        if not params:
+            return
+
+        if DocumentSearchService._dialect() == 'sqlite':
+            document_ids = [p['document_id'] for p in params]
+            # 이미 색인된 문서는 rowid 를 유지하고 이전 토큰만 삭제
+            rowids = DocumentSearchService._delete_tokens('m.document_id IN :document_ids',
+                                                          {'document_ids': document_ids})
+            new = [p for p in params if p['document_id'] not in rowids]
+            if new:
+                db.session.execute(
+                    text('INSERT INTO document_fts_map (document_id, freelancer_id) '
+                         'VALUES (:document_id, :freelancer_id)'),
+                    new
+                )
+                rowids.update(db.session.execute(
+                    text('SELECT document_id, rowid FROM document_fts_map WHERE document_id IN :document_ids')
+                    .bindparams(bindparam('document_ids', expanding=True)),
+                    {'document_ids': [p['document_id'] for p in new]}
+                ).all())
+            db.session.execute(
+                text('INSERT INTO document_fts (rowid, body) VALUES (:rowid, :body)'),
+                [{'rowid': rowids[p['document_id']], 'body': p['body']} for p in params]
+            )
+        else:
+            db.session.execute(
+                text('INSERT INTO document_search (document_id, freelancer_id, body) '
+                     'VALUES (:document_id, :freelancer_id, :body) '
+                     'ON DUPLICATE KEY UPDATE freelancer_id = VALUES(freelancer_id), body = VALUES(body)'),
+                params
+            )
+
+    @staticmethod
+    def remove_document(document_id: str):
+        """문서 색인 삭제"""
+        DocumentSearchService._remove('document_id IN :document_ids', {'document_ids': [document_id]})
+
+    @staticmethod
+    def remove_freelancer(freelancer_id: str):
+        """프리랜서의 모든 문서 색인 삭제 (프리랜서 삭제 전에 호출 - 문서 레코드가 CASCADE 로 사라지기 전)"""
+        DocumentSearchService._remove('freelancer_id = :freelancer_id', {'freelancer_id': freelancer_id})
+
+    @staticmethod
+    def _remove(condition: str, params: dict):
+        if not DocumentSearchService._available:
+            return
+        if DocumentSearchService._dialect() == 'sqlite':
+            rowids = DocumentSearchService._delete_tokens(f'm.{condition}', params)
+            if rowids:
+                db.session.execute(text('DELETE FROM document_fts_map WHERE rowid = :rowid'),
+                                   [{'rowid': rowid} for rowid in rowids.values()])
+        else:
+            statement = text(f'DELETE FROM document_search WHERE {condition}')
+            if 'document_ids' in params:
+                statement = statement.bindparams(bindparam('document_ids', expanding=True))
+            db.session.execute(statement, params)
+
+    @staticmethod
+    def _delete_tokens(condition: str, params: dict) -> Dict[str, int]:
+        """SQLite: 조건에 맞는 색인 문서의 토큰 삭제 (매핑은 유지) → {document_id: rowid}"""
+        statement = text(INDEXED_SOURCE_SQL.format(condition=condition)).columns(
+            rowid=db.Integer, document_id=db.String, extracted_text=CompressedText
+        )
+        if 'document_ids' in params:
+            statement = statement.bindparams(bindparam('document_ids', expanding=True))
+        with db.session.no_autoflush:  # 아직 반영되지 않은 새 원문이 아니라 색인 당시 원문을 읽음
+            indexed = db.session.execute(statement, params).all()
+        if indexed:
+            db.session.execute(
+                text("INSERT INTO document_fts (document_fts, rowid, body) VALUES ('delete', :rowid, :body)"),
+                [{'rowid': row.rowid, 'body': row.extracted_text or ''} for row in indexed]
+            )
+        return {row.document_id: row.rowid for row in indexed}
+
+    @staticmethod
+    def parse_terms(query: str) -> List[str]:
+        """검색어를 공백 기준 단어로 분리 (따옴표 등 검색 문법 문자 제거, 중복 제거)"""
+        terms = []
+        for raw in query.split():
+            term = re.sub(r'["*()+\-~<>@:^]', '', raw).strip()
+            if term and term.lower() not in (t.lower() for t in terms):
+                terms.append(term)
+        return terms[:MAX_TERMS]
+
+    @staticmethod
+    def search(query: str, document_type: Optional[str] = None, limit: int = 50) -> Dict[str, Any]:
+        """모든 단어를 포함하는 문서 검색 → 프리랜서별로 묶어 스니펫 위치와 함께 반환"""
+        if not DocumentSearchService._available:
+            raise ValueError('전문 검색 인덱스를 사용할 수 없습니다')
+
+        terms = DocumentSearchService.parse_terms(query or '')
+        if not terms:
+            raise ValueError('검색어를 입력하세요')
+
+        hits = DocumentSearchService._match(terms, document_type, limit)
+
+        # 결과 페이지 문서의 원문만 읽어서 압축 해제
+        bodies = dict(db.session.query(FreelancerDocument.id, FreelancerDocument.extracted_text).filter(
+            FreelancerDocument.id.in_([hit[0] for hit in hits])
+        ).all()) if hits else {}
+
+        freelancers = {}
+        for document_id, freelancer_id, document_type_, filename, score in hits:
+            entry = freelancers.setdefault(freelancer_id, {
+                'freelancerId': freelancer_id,
+                'score': score,  # 가장 관련도 높은 문서 기준
+                'documents': [],
+            })
+            entry['documents'].append({
+                'documentId': document_id,
+                'documentType': document_type_,
+                'originalFilename': filename,
+                'score': score,
+                'snippets': DocumentSearchService.find_snippets(bodies.get(document_id) or '', terms),
+            })
+
+        return {
+            'query': query,
+            'terms': terms,
+            'total': len(freelancers),
+            'items': list(freelancers.values()),
+        }
+
+    @staticmethod
+    def _match(terms: List[str], document_type: Optional[str], limit: int):
+        """색인 검색 → [(document_id, freelancer_id, document_type, filename, score)] (관련도 순)"""
+        params = {'limit': limit}
+        type_filter = ''
+        if document_type:
+            type_filter = 'AND d.document_type = :document_type'
+            params['document_type'] = document_type
+
+        if DocumentSearchService._dialect() == 'sqlite':
+            # 각 단어를 접두어 검색으로 ("금융*" → 금융, 금융권, 금융을 ...), 공백은 AND
+            params['match'] = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+            sql = f"""
+                SELECT d.id, d.freelancer_id, d.document_type, d.original_filename,
+                       -bm25(document_fts) AS score
+                FROM document_fts
+                JOIN document_fts_map m ON m.rowid = document_fts.rowid
+                JOIN freelancer_document d ON d.id = m.document_id
+                WHERE document_fts MATCH :match AND d.deleted_at IS NULL {type_filter}
+                ORDER BY bm25(document_fts)
+                LIMIT :limit
+            """
+        else:
+            # ngram 파서 - 구문 검색으로 한국어 부분 문자열 일치, + 는 필수 단어
+            params['match'] = ' '.join('+"{}"'.format(term) for term in terms)
+            sql = f"""
+                SELECT d.id, d.freelancer_id, d.document_type, d.original_filename,
+                       MATCH(s.body) AGAINST (:match IN BOOLEAN MODE) AS score
+                FROM document_search s
+                JOIN freelancer_document d ON d.id = s.document_id
+                WHERE MATCH(s.body) AGAINST (:match IN BOOLEAN MODE) AND d.deleted_at IS NULL {type_filter}
+                ORDER BY score DESC
+                LIMIT :limit
+            """
+
+        return db.session.execute(text(sql), params).all()
+
+    @staticmethod
+    def find_snippets(body: str, terms: List[str]) -> List[Dict[str, Any]]:
+        """단어별 등장 위치 (extractedText 기준 문자 오프셋) + 주변 문맥"""
+        snippets = []
+        for term in terms:
+            pattern = re.compile(re.escape(term), re.IGNORECASE)
+            for count, match in enumerate(pattern.finditer(body)):
+                if count >= MAX_SNIPPETS_PER_TERM:
+                    break
+                start, end = match.span()
+                context_start = max(0, start - SNIPPET_CONTEXT)
+                context_end = min(len(body), end + SNIPPET_CONTEXT)
+                snippets.append({
+                    'term': term,
+                    'start': start,
+                    'end': end,
+                    'snippet': body[context_start:context_end],
+                    'snippetStart': context_start,
+                })
+        snippets.sort(key=lambda s: s['start'])
+        return snippets
@@ -0,0 +1,248 @@
+"""
+분할 업로드 서비스 (init → 청크 PUT → complete)
+- 청크는 요청 본문을 스트리밍으로 바로 파트 파일에 기록 (워커 메모리 사용량 일정)
+- 세션 정보는 청크 디렉토리의 session.json 에 저장 (서버 재시작 / 다른 워커에서도 이어받기 가능)
+- complete 시 파트 파일을 순서대로 이어 붙이며 SHA-256 검증
+"""
+import os
+import re
+import json
+import time
+import uuid
+import shutil
+import hashlib
+import mimetypes
+from datetime import datetime
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from werkzeug.utils import secure_filename
+
+from app.models import Freelancer
+from app.services.file_service import FileService
+
+SESSION_FILE = 'session.json'
+UPLOAD_ID_PATTERN = re.compile(r'[0-9a-f]{32}')
+
+
+class ChunkedUploadService:
+    """분할 업로드 세션 관리"""
+
+    CHUNK_SIZE = int(os.getenv('UPLOAD_CHUNK_SIZE', 5 * 1024 * 1024))  # 5MB (MAX_CONTENT_LENGTH 이하)
+    MAX_FILE_SIZE = int(os.getenv('CHUNKED_UPLOAD_MAX_SIZE', 100 * 1024 * 1024))  # 100MB
+    SESSION_TTL = int(os.getenv('CHUNKED_UPLOAD_TTL', 24 * 60 * 60))  # 미완료 세션 보존 시간 (초)
+    STREAM_BLOCK_SIZE = 64 * 1024
+
+    @staticmethod
+    def init_upload(freelancer_id: str, data: Dict[str, Any], chunk_root: str) -> Dict[str, Any]:
+        """업로드 세션 생성"""
+        freelancer = Freelancer.query.get(freelancer_id)
+        if not freelancer:
+            raise ValueError('프리랜서를 찾을 수 없습니다')
+
+        filename = (data.get('filename') or '').strip()
+        document_type = data.get('documentType') or 'other'
+        file_size = data.get('fileSize')
+        sha256 = (data.get('sha256') or '').lower() or None
+
+        # 확장자는 원래 파일명에서 (secure_filename 은 한글 등 비ASCII 문자를 지워 '이력서.pdf' → 'pdf' 가 됨)
+        ext = FileService.get_file_format(filename)
+        if ext not in FileService.ALLOWED_EXTENSIONS:
+            raise ValueError(f'허용된 파일 형식: {", ".join(FileService.ALLOWED_EXTENSIONS)}')
+        safe_filename = secure_filename(filename)
+        if FileService.get_file_format(safe_filename) != ext or not safe_filename.rsplit('.', 1)[0]:
+            safe_filename = f'{uuid.uuid4().hex}.{ext}'  # 저장용 이름만 대체 (원래 이름은 originalFilename 에 보존)
+        if not isinstance(file_size, int) or file_size <= 0:
+            raise ValueError('파일 크기(fileSize)는 1 이상의 정수여야 합니다')
+        if file_size > ChunkedUploadService.MAX_FILE_SIZE:
+            raise ValueError(f'파일 크기는 {ChunkedUploadService.MAX_FILE_SIZE / 1024 / 1024}MB 이하여야 합니다')
+        if sha256 is not None and not re.fullmatch(r'[0-9a-f]{64}', sha256):
+            raise ValueError('sha256 형식이 올바르지 않습니다')
+
+        chunk_size = ChunkedUploadService.CHUNK_SIZE
+        session = {
+            'uploadId': uuid.uuid4().hex,
+            'freelancerId': freelancer_id,
+            'documentType': document_type,
+            'originalFilename': filename,
+            'safeFilename': safe_filename,
+            'mimeType': data.get('mimeType') or mimetypes.guess_type(safe_filename)[0] or 'application/octet-stream',
+            'fileSize': file_size,
+            'chunkSize': chunk_size,
+            'totalChunks': (file_size + chunk_size - 1) // chunk_size,
+            'sha256': sha256,
+            'createdAt': datetime.utcnow().isoformat(),
+        }
+
+        session_dir = os.path.join(chunk_root, session['uploadId'])
+        os.makedirs(session_dir)
+        ChunkedUploadService._write_json(os.path.join(session_dir, SESSION_FILE), session)
+
+        return dict(session, receivedChunks=[])
+
+    @staticmethod
+    def put_chunk(upload_id: str, index: int, stream: BinaryIO, content_length: Optional[int],
+                  chunk_root: str) -> Dict[str, Any]:
+        """청크 저장 - 요청 본문을 블록 단위로 임시 파일에 쓰고 완료 시 교체 (같은 청크 재전송 허용)"""
+        session_dir, session = ChunkedUploadService._load_session(upload_id, chunk_root)
+
+        if index < 0 or index >= session['totalChunks']:
+            raise ValueError(f'청크 번호는 0 ~ {session["totalChunks"] - 1} 범위여야 합니다')
+
+        expected = ChunkedUploadService._expected_chunk_size(session, index)
+        if content_length is None:
+            raise ValueError('Content-Length 헤더가 필요합니다')
+        if content_length != expected:
+            raise ValueError(f'청크 {index}의 크기는 {expected}바이트여야 합니다')
+
+        part_path = ChunkedUploadService._part_path(session_dir, index)
+        tmp_path = f'{part_path}.{uuid.uuid4().hex}.tmp'
+        written = 0
+        try:
+            with open(tmp_path, 'wb') as f:
+                while written < expected:
+                    block = stream.read(min(ChunkedUploadService.STREAM_BLOCK_SIZE, expected - written))
+                    if not block:
+                        break
+                    f.write(block)
+                    written += len(block)
+            if written != expected:
+                raise ValueError(f'청크 {index} 수신이 중단되었습니다 ({written}/{expected}바이트)')
+            os.replace(tmp_path, part_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return {
+            'uploadId': upload_id,
+            'index': index,
+            'size': written,
+            'receivedChunks': ChunkedUploadService._received_chunks(session_dir),  # init / 상태 조회와 같은 형식
+            'totalChunks': session['totalChunks'],
+        }
+
+    @staticmethod
+    def get_status(upload_id: str, chunk_root: str) -> Dict[str, Any]:
+        """업로드 진행 상태 (재개 시 받은 청크 목록 확인용)"""
+        session_dir, session = ChunkedUploadService._load_session(upload_id, chunk_root)
+        received = ChunkedUploadService._received_chunks(session_dir)
+        return dict(
+            session,
+            receivedChunks=received,
+            missingChunks=[i for i in range(session['totalChunks']) if i not in set(received)],
+        )
+
+    @staticmethod
+    def assemble(upload_id: str, sha256: Optional[str], chunk_root: str, upload_dir_root: str) -> Dict[str, Any]:
+        """파트 파일 병합 + 해시 검증 → 저장된 파일 정보 반환 (세션 디렉토리는 삭제)"""
+        session_dir, session = ChunkedUploadService._load_session(upload_id, chunk_root)
+
+        missing = [i for i in range(session['totalChunks'])
+                   if not os.path.exists(ChunkedUploadService._part_path(session_dir, i))]
+        if missing:
+            raise ValueError(f'받지 못한 청크가 있습니다: {missing[:20]}')
+
+        # 동시에 complete 가 두 번 호출되어도 한 요청만 병합하도록 세션 디렉토리를 선점
+        assembling_dir = f'{session_dir}.assembling'
+        try:
+            os.rename(session_dir, assembling_dir)
+        except OSError:
+            raise ValueError('이미 완료 처리 중인 업로드입니다')
+
+        upload_dir = os.path.join(upload_dir_root, session['freelancerId'])
+        os.makedirs(upload_dir, exist_ok=True)
+        # 같은 초에 같은 이름으로 완료된 업로드끼리 덮어쓰지 않도록 업로드 ID 포함
+        timestamp = datetime.utcnow().strftime('%Y%m%d%H%M%S')
+        file_path = os.path.join(upload_dir, f"{timestamp}_{upload_id}_{session['safeFilename']}")
+
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            with open(file_path, 'wb') as out:
+                for index in range(session['totalChunks']):
+                    with open(ChunkedUploadService._part_path(assembling_dir, index), 'rb') as part:
+                        for block in iter(lambda: part.read(FileService.HASH_CHUNK_SIZE), b''):
+                            digest.update(block)
+                            out.write(block)
+                            size += len(block)
+
+            content_hash = digest.hexdigest()
+            expected_hash = (sha256 or '').lower() or session['sha256']
+            if size != session['fileSize'] or (expected_hash and expected_hash != content_hash):
+                raise ValueError('파일 해시가 일치하지 않습니다. 청크를 다시 전송하세요')
+        except Exception:
+            # 병합 파일만 지우고 파트 파일은 보존 → 잘못된 청크만 다시 보내고 재시도 가능
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            os.rename(assembling_dir, session_dir)
+            raise
+
+        shutil.rmtree(assembling_dir, ignore_errors=True)
+
+        return {
+            'freelancerId': session['freelancerId'],
+            'documentType': session['documentType'],
+            'originalFilename': session['originalFilename'],
+            'mimeType': session['mimeType'],
+            'filePath': file_path,
+            'fileSize': size,
+            'contentHash': content_hash,
+        }
+
+    @staticmethod
+    def abort(upload_id: str, chunk_root: str):
+        """업로드 취소 - 받은 청크 삭제"""
+        session_dir, _ = ChunkedUploadService._load_session(upload_id, chunk_root)
+        shutil.rmtree(session_dir, ignore_errors=True)
+
+    @staticmethod
+    def find_expired_sessions(chunk_root: str, now: Optional[float] = None) -> List[str]:
+        """보존 시간이 지난 미완료 세션 디렉토리 목록"""
+        if not os.path.isdir(chunk_root):
+            return []
+        now = now or time.time()
+        expired = []
+        for name in os.listdir(chunk_root):
+            path = os.path.join(chunk_root, name)
+            if not os.path.isdir(path):
+                continue
+            # 마지막 청크 수신 시각 기준 (디렉토리 mtime 은 파트 파일 추가 시 갱신)
+            if now - os.path.getmtime(path) > ChunkedUploadService.SESSION_TTL:
+                expired.append(path)
+        return expired
+
+    # ==================== Helpers ====================
+
+    @staticmethod
+    def _load_session(upload_id: str, chunk_root: str):
+        if not UPLOAD_ID_PATTERN.fullmatch(upload_id or ''):
+            raise ValueError('업로드 세션을 찾을 수 없습니다')
+        session_dir = os.path.join(chunk_root, upload_id)
+        session_path = os.path.join(session_dir, SESSION_FILE)
+        if not os.path.exists(session_path):
+            raise ValueError('업로드 세션을 찾을 수 없습니다')
+        with open(session_path, 'r', encoding='utf-8') as f:
+            return session_dir, json.load(f)
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _part_path(session_dir: str, index: int) -> str:
+        return os.path.join(session_dir, f'part_{index:06d}')
+
+    @staticmethod
+    def _expected_chunk_size(session: Dict[str, Any], index: int) -> int:
+        if index < session['totalChunks'] - 1:
+            return session['chunkSize']
+        return session['fileSize'] - session['chunkSize'] * (session['totalChunks'] - 1)
+
+    @staticmethod
+    def _received_chunks(session_dir: str) -> List[int]:
+        return sorted(
+            int(name[5:]) for name in os.listdir(session_dir)
+            if name.startswith('part_') and name[5:].isdigit()
+        )
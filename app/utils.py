@@ -35,10 +35,10 @@ def serialize_datetime(dt):
 
 
 def paginate(query, page=1, limit=20):
-    """쿼리 결과를 페이지네이션"""
+    """쿼리 결과를 페이지네이션 (항목은 to_dict() 로 직렬화 - 관계는 query 의 options 로 미리 로드)"""
     paginated = query.paginate(page=page, per_page=limit, error_out=False)
     return {
-        'data': [item for item in paginated.items],
+        'data': [item.to_dict() for item in paginated.items],
         'total': paginated.total,
         'page': page,
         'limit': limit,
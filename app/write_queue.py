@@ -0,0 +1,222 @@
+"""
+쓰기 직렬화 큐 (SQLite 단일 writer 용, 선택 기능)
+- SQLite 는 WAL 에서도 동시에 한 트랜잭션만 쓸 수 있음 → 여러 요청 스레드가 동시에 커밋하면 busy 대기가 길어짐
+- WRITE_QUEUE=true 이면 @serialized_write 가 붙은 서비스 메서드를 전용 writer 스레드 하나에서 실행
+- writer 는 대기 중인 작업을 모아 작업마다 SAVEPOINT 로 감싸 실행하고 마지막에 한 번만 COMMIT (group commit)
+  - 서비스 안의 db.session.commit() 은 flush 로, rollback() 은 해당 작업의 SAVEPOINT 롤백으로 바뀜
+  - 한 작업이 실패해도 그 작업만 롤백되고 같은 묶음의 다른 작업은 커밋
+  - 캐시 무효화 등 커밋 이후 동작은 after_commit() 으로 등록 → 묶음 COMMIT 이 끝난 뒤, 호출한 요청이 결과를 받기 전에 실행
+- 읽기는 요청 스레드에서 그대로 병렬 실행
+- 반환된 ORM 객체는 호출한 요청의 세션에 merge 되어 관계 지연 로딩도 그대로 동작
+"""
+import os
+import queue
+import threading
+import functools
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+from app.db import db, mark_primary, SQLITE_BEGIN_OPTION
+
+
+class _Job:
+    __slots__ = ('fn', 'args', 'kwargs', 'future')
+
+    def __init__(self, fn, args, kwargs):
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future()
+
+
+class WriteQueue:
+    """전용 writer 스레드 + group commit"""
+
+    ENABLED = os.getenv('WRITE_QUEUE', 'false').lower() == 'true'
+    MAX_BATCH = int(os.getenv('WRITE_QUEUE_MAX_BATCH', 32))  # 한 번에 커밋할 최대 작업 수
+    WINDOW_MS = float(os.getenv('WRITE_QUEUE_WINDOW_MS', 0))  # 첫 작업 후 추가 작업을 기다리는 시간 (0이면 이미 쌓인 것만)
+    TIMEOUT = float(os.getenv('WRITE_QUEUE_TIMEOUT', 60))  # 요청 스레드가 결과를 기다리는 최대 시간 (초)
+
+    def __init__(self):
+        self.app = None
+        self.enabled = False
+        self._queue: 'queue.Queue[_Job]' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stats = {'jobs': 0, 'batches': 0, 'failedJobs': 0, 'failedCommits': 0, 'maxBatch': 0}
+
+    def init_app(self, app, enabled: Optional[bool] = None):
+        self.app = app
+        self.enabled = self.ENABLED if enabled is None else enabled
+
+    @property
+    def in_writer(self) -> bool:
+        return getattr(self._local, 'active', False)
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Any:
+        """writer 스레드에서 fn 실행 후 결과 반환 (커밋까지 완료된 뒤 반환)"""
+        self._ensure_thread()
+        job = _Job(fn, args, kwargs)
+        self._queue.put(job)
+        try:
+            return job.future.result(timeout=self.TIMEOUT)
+        except TimeoutError:
+            raise RuntimeError('쓰기 대기열 처리 시간이 초과되었습니다')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats['enabled'] = self.enabled
+        stats['queued'] = self._queue.qsize()
+        stats['avgBatch'] = round(stats['jobs'] / stats['batches'], 2) if stats['batches'] else 0.0
+        return stats
+
+    # ==================== writer 스레드 ====================
+
+    def _ensure_thread(self):
+        # gunicorn 은 fork 후 스레드를 물려주지 않으므로 프로세스마다 처음 쓸 때 시작
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive() or self._pid != os.getpid():
+                self._queue = queue.Queue()
+                self._pid = os.getpid()
+                self._thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        self._local.active = True
+        while True:
+            batch = self._next_batch()
+            try:
+                self._execute(batch)
+            except BaseException as e:  # 예상 못한 오류에도 writer 는 계속 동작
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+
+    def _next_batch(self) -> List[_Job]:
+        batch = [self._queue.get()]
+        timeout = self.WINDOW_MS / 1000
+        while len(batch) < self.MAX_BATCH:
+            try:
+                batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _execute(self, batch: List[_Job]):
+        """작업별 SAVEPOINT → 성공한 작업만 모아 COMMIT 한 번"""
+        done, failed = [], 0
+        with self.app.app_context():
+            session = db.session()
+            session.expire_on_commit = False  # 커밋 후에도 반환 객체의 값 유지 (요청 세션에 merge)
+            try:
+                # 바깥 트랜잭션을 먼저 시작 → 작업별 SAVEPOINT 의 RELEASE 가 커밋이 되지 않고 마지막 COMMIT 에 묶임
+                # (SQLite 는 BEGIN IMMEDIATE 로 쓰기 잠금을 미리 잡아 묶음 도중 잠금 승격 실패를 피함)
+                session.connection(execution_options={SQLITE_BEGIN_OPTION: 'IMMEDIATE'})
+                for job in batch:
+                    try:
+                        done.append((job, *self._run_job(session, job)))
+                    except BaseException as e:
+                        failed += 1
+                        job.future.set_exception(e)
+
+                try:
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    with self._lock:
+                        self._stats['failedCommits'] += 1
+                    for job, _, _ in done:
+                        job.future.set_exception(e)
+                    done = []
+            finally:
+                db.session.remove()
+
+            # 커밋된 작업의 후처리 (스냅샷 무효화 등) - 커밋 전에 실행하면 다른 요청이 이전 값으로 갱신할 수 있음
+            for _, _, callbacks in done:
+                for callback in callbacks:
+                    try:
+                        callback()
+                    except Exception as e:
+                        print(f'⚠️  커밋 후처리 실패: {e}')
+
+        with self._lock:
+            self._stats['jobs'] += len(batch)
+            self._stats['batches'] += 1
+            self._stats['failedJobs'] += failed + (len(batch) - failed - len(done))
+            self._stats['maxBatch'] = max(self._stats['maxBatch'], len(batch))
+        for job, result, _ in done:
+            job.future.set_result(result)
+
+    def _run_job(self, session, job: _Job):
+        """작업 하나를 SAVEPOINT 안에서 실행 → (결과, 커밋 후 실행할 콜백)"""
+        state = {'savepoint': session.begin_nested()}
+        callbacks = self._local.callbacks = []
+
+        def commit():
+            session.flush()  # 실제 커밋은 묶음 단위로
+
+        def rollback():
+            WriteQueue._rollback_savepoint(state['savepoint'])
+            state['savepoint'] = session.begin_nested()
+
+        session.commit, session.rollback = commit, rollback
+        try:
+            result = job.fn(*job.args, **job.kwargs)
+            session.flush()
+        except BaseException:
+            WriteQueue._rollback_savepoint(state['savepoint'])
+            raise
+        finally:
+            del session.commit, session.rollback  # 원래 메서드로 복원
+            self._local.callbacks = None
+
+        if state['savepoint'].is_active:
+            state['savepoint'].commit()  # RELEASE SAVEPOINT
+        return result, callbacks
+
+    @staticmethod
+    def _rollback_savepoint(savepoint):
+        try:
+            savepoint.rollback()
+        except Exception:
+            pass  # flush 실패로 이미 닫힌 SAVEPOINT
+
+
+write_queue = WriteQueue()
+
+
+def after_commit(callback: Callable[[], Any]):
+    """커밋이 끝난 뒤 실행 - writer 작업 안이면 묶음 COMMIT 후, 아니면 바로 (서비스의 commit() 뒤에 호출)"""
+    callbacks = getattr(write_queue._local, 'callbacks', None)
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
+def _attach(result):
+    """writer 세션에서 만든 ORM 객체를 현재 요청 세션으로 (추가 조회 없음)"""
+    if isinstance(result, db.Model):
+        return db.session.merge(result, load=False)
+    if isinstance(result, list) and result and all(isinstance(item, db.Model) for item in result):
+        return [db.session.merge(item, load=False) for item in result]
+    return result
+
+
+def serialized_write(fn: Callable) -> Callable:
+    """쓰기 서비스 메서드를 writer 스레드에서 실행 (WRITE_QUEUE 가 꺼져 있으면 그대로 호출)"""
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not write_queue.enabled or write_queue.in_writer:
+            return fn(*args, **kwargs)  # 비활성 / writer 안에서의 중첩 호출
+        result = write_queue.submit(fn, *args, **kwargs)
+        mark_primary()  # 다른 스레드에서 쓴 값 → 이 요청의 이후 조회도 primary
+        return _attach(result)
+
+    return wrapper
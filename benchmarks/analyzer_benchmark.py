@@ -0,0 +1,152 @@
+"""
+문서 분석기 벤치마크
+backdata/ 의 경력기술서 구조(인적사항 · 학력 · 자격증 · 프로젝트 경력표)를 본뜬
+합성 코퍼스를 만들어 ResumeAnalyzer / PortfolioAnalyzer 규칙별 소요 시간을 측정
+
+사용 예:
+    python benchmarks/analyzer_benchmark.py
+    python benchmarks/analyzer_benchmark.py --docs 1000 --repeat 3 --json result.json
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.analyzer_rules import RESUME_RULES, PORTFOLIO_RULES  # noqa: E402
+
+SURNAMES = ['김', '이', '박', '최', '정', '강', '조', '윤', '장', '임', '한', '유']
+GIVEN_NAMES = ['준호', '수영', '민준', '지은', '호준', '명희', '성호', '지수', '대건', '영호', '찬양']
+COMPANIES = ['드림플라잉테크㈜', '신한은행', '미래에셋증권', 'NH농협', 'SKT', 'MG 새마을금고', 'KB국민카드', '삼성SDS', 'LG CNS']
+SCHOOLS = ['서울대학교', '연세대학교', '동양미래대학', '국가평생교육원', '한양대학교', 'Seoul National University']
+CERTS = ['정보처리기사', '정보처리산업기사', 'OCJP', 'SQLD', 'AWS Solutions Architect', '리눅스마스터 2급']
+PROJECT_TOPICS = ['차세대 시스템 구축', '챗봇 고도화', '모바일 뱅킹 재구축', 'TDS 내재화 개발', 'SNS 웹크롤링 개발',
+                  '공통 컴포넌트 개발', '하이브리드 APP 개발', '마이데이터 플랫폼 구축', '금융 포털 리뉴얼']
+ROLES = ['PL', '개발', '프론트엔드 개발', '백엔드 개발', '설계/개발', 'PM']
+TECHS = ['Java', 'Spring', 'Python', 'Django', 'React', 'Vue.js', 'Node.js', 'TypeScript', 'Oracle', 'MySQL',
+         'PostgreSQL', 'Redis', 'Docker', 'Kubernetes', 'AWS', 'Jenkins', 'GitLab', 'JavaScript', 'HTML', 'CSS']
+LANGS = ['한국어 (원어민)', '영어 (비즈니스)', 'English - fluent', '일본어 (JLPT N2)']
+
+
+def make_resume(rng: random.Random) -> str:
+    """경력기술서 형태의 합성 이력서 텍스트"""
+    name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+    years = rng.randint(1, 20)
+    lines = [
+        '개 인 이 력 카 드',
+        f'성 명\t{name}\t성 별\t남',
+        f'소 속\t{rng.choice(COMPANIES)}\t투입일\t즉시',
+        f'경력 {years}년 {rng.randint(0, 11)}개월',
+        '',
+        '1. 학 력',
+    ]
+    for _ in range(rng.randint(1, 3)):
+        year = rng.randint(2000, 2022)
+        lines.append(f'{year}년 03월 - {year + 4}년 02월  {rng.choice(SCHOOLS)} 컴퓨터공학과 졸업')
+
+    lines += ['', '2. 자 격 증']
+    for cert in rng.sample(CERTS, rng.randint(1, 3)):
+        lines.append(f'자격증: {cert}\t취득일 {rng.randint(2010, 2024)}.{rng.randint(1, 12):02d}')
+
+    lines += ['', '3. 어학', rng.choice(LANGS), '', '4. 경 력', '회 사 명\t기    간\t직    위\t담  당  업  무']
+    # 문서 크기 편차를 크게 (짧은 이력서 ~ 수십 페이지 경력기술서)
+    for _ in range(rng.choice([3, 5, 10, 20, 40, 80])):
+        start = rng.randint(2010, 2024)
+        topic = rng.choice(PROJECT_TOPICS)
+        lines += [
+            f'{rng.choice(COMPANIES)}\t{start}.{rng.randint(1, 12):02d} ~ {start + 1}.{rng.randint(1, 12):02d}\t프리랜서\t{topic}',
+            f'프로젝트: {rng.choice(COMPANIES)} {topic}',
+            f'담당 업무: {rng.choice(ROLES)}',
+            f'사용기술: {", ".join(rng.sample(TECHS, rng.randint(2, 6)))}',
+            '주요 내용: ' + ' '.join(rng.choice(PROJECT_TOPICS) for _ in range(rng.randint(3, 12))),
+            '',
+        ]
+    return '\n'.join(lines)
+
+
+def make_portfolio(rng: random.Random) -> str:
+    """번호 매긴 프로젝트 목록 형태의 합성 포트폴리오 텍스트"""
+    lines = ['포트폴리오', '']
+    for idx in range(1, rng.randint(3, 30) + 1):
+        topic = rng.choice(PROJECT_TOPICS)
+        lines += [
+            f'{idx}. {topic}',
+            f'설명: {", ".join(rng.sample(TECHS, rng.randint(2, 5)))} 기반 {topic}',
+            f'- 역할: {rng.choice(ROLES)}',
+            f'https://github.com/example/project-{idx}',
+            '',
+        ]
+    return '\n'.join(lines)
+
+
+def build_corpus(docs: int, seed: int):
+    rng = random.Random(seed)
+    resumes = [make_resume(rng) for _ in range(docs)]
+    portfolios = [make_portfolio(rng) for _ in range(max(1, docs // 4))]
+    return resumes, portfolios
+
+
+def run_rule_set(rule_set, texts, repeat):
+    """규칙별 누적 시간 측정 (repeat 회 반복 중 최소값 사용)"""
+    best = None
+    best_total = None
+    for _ in range(repeat):
+        totals = {rule.name: 0.0 for rule in rule_set.rules}
+        started = time.perf_counter()
+        for text in texts:
+            _, timings = rule_set.analyze_timed(text)
+            for name, seconds in timings.items():
+                totals[name] += seconds
+        elapsed = time.perf_counter() - started
+        if best_total is None or elapsed < best_total:
+            best, best_total = totals, elapsed
+    return best, best_total
+
+
+def report(title, texts, totals, elapsed):
+    chars = sum(len(t) for t in texts)
+    rule_sum = sum(totals.values()) or 1.0
+    print(f'\n📊 {title}: {len(texts)}건, 평균 {chars / len(texts) / 1024:.1f}KB')
+    print(f'   {"extractor":<18}{"total ms":>10}{"µs/doc":>10}{"share":>8}')
+    for name, seconds in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f'   {name:<18}{seconds * 1000:>10.1f}{seconds / len(texts) * 1e6:>10.1f}{seconds / rule_sum * 100:>7.1f}%')
+    print(f'   {"(전체)":<18}{elapsed * 1000:>10.1f}{elapsed / len(texts) * 1e6:>10.1f}'
+          f'   → {len(texts) / elapsed:.0f} docs/s, {chars / 1024 / 1024 / elapsed:.1f} MB/s')
+    return {
+        'documents': len(texts),
+        'avg_kb': chars / len(texts) / 1024,
+        'total_ms': elapsed * 1000,
+        'extractors_ms': {name: seconds * 1000 for name, seconds in totals.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='문서 분석기 규칙별 벤치마크')
+    parser.add_argument('--docs', type=int, default=300, help='이력서 문서 수 (포트폴리오는 1/4)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소값 사용)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    args = parser.parse_args()
+
+    resumes, portfolios = build_corpus(args.docs, args.seed)
+
+    # 매처 빌드 비용은 측정에서 제외
+    RESUME_RULES.analyze('warm up')
+
+    result = {'docs': args.docs, 'seed': args.seed}
+    totals, elapsed = run_rule_set(RESUME_RULES, resumes, args.repeat)
+    result['resume'] = report('ResumeAnalyzer', resumes, totals, elapsed)
+    totals, elapsed = run_rule_set(PORTFOLIO_RULES, portfolios, args.repeat)
+    result['portfolio'] = report('PortfolioAnalyzer', portfolios, totals, elapsed)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+        print(f'\n💾 {args.json} 저장')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""
+API 벤치마크 - 합성 데이터셋(benchmarks/dataset.py)에서 주요 시나리오를 Flask 테스트 클라이언트로 실행
+시나리오별 지연 시간 p50 / p95 / p99 와 요청당 쿼리 수(Server-Timing)를 JSON 으로 저장 → 버전 간 비교
+
+시나리오:
+    list             목록 (이름순, 임의 페이지)
+    search           이름 / 이메일 부분 검색 (DB 경로)
+    skill_filter     스킬 2개 + 가용 상태 필터 (스냅샷 경로)
+    detail           프리랜서 상세
+    evaluation       면접 평가 상세 (점수 / 체크포인트 / 레드플래그 포함)
+    document_search  이력서 전문 검색
+    bulk_write       프리랜서 등록 → 평가 생성 → 카테고리 점수 4개 → 총점 계산 (끝나면 만든 데이터 삭제)
+
+사용 예:
+    python benchmarks/api_benchmark.py --size 10k
+    python benchmarks/api_benchmark.py --size 100k --requests 500 --json after.json --compare before.json
+    python benchmarks/api_benchmark.py --size 1k --scenarios list,detail
+
+주의:
+- 서버 / 네트워크 없이 앱 내부 처리 시간만 측정 (gunicorn 처리량은 server_benchmark.py)
+- 데이터셋은 처음 한 번만 생성하고 재사용 (1m 은 생성에 수십 분, 수 GB)
+"""
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import platform
+import subprocess
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import dataset  # noqa: E402
+
+QUERY_COUNT_PATTERN = re.compile(r'desc="(\d+) queries"')
+SEARCH_TERMS = ['김', '이서', '박민', 'freelancer12', 'bench.example', '지우']
+DOCUMENT_TERMS = ['Python', 'React 결제', 'Kubernetes', '추천 엔진', 'Docker AWS', 'Spring']
+
+
+class Recorder:
+    """시나리오별 (지연 ms, 쿼리 수, 상태 코드) 기록"""
+
+    def __init__(self, client):
+        self.client = client
+        self.samples = []
+
+    def call(self, method, path, body=None):
+        started = time.perf_counter()
+        response = self.client.open(path, method=method, json=body)
+        elapsed = (time.perf_counter() - started) * 1000
+        match = QUERY_COUNT_PATTERN.search(response.headers.get('Server-Timing', ''))
+        self.samples.append((elapsed, int(match.group(1)) if match else None, response.status_code))
+        return response
+
+    def summary(self):
+        timings = np.array([s[0] for s in self.samples])
+        queries = [s[1] for s in self.samples if s[1] is not None]
+        errors = sum(1 for s in self.samples if s[2] >= 400)
+        return {
+            'requests': len(self.samples),
+            'errors': errors,
+            'p50_ms': round(float(np.percentile(timings, 50)), 3),
+            'p95_ms': round(float(np.percentile(timings, 95)), 3),
+            'p99_ms': round(float(np.percentile(timings, 99)), 3),
+            'mean_ms': round(float(timings.mean()), 3),
+            'max_ms': round(float(timings.max()), 3),
+            'queries_mean': round(sum(queries) / len(queries), 2) if queries else None,
+            'queries_max': max(queries) if queries else None,
+        }
+
+
+# ==================== 시나리오 (한 번 호출 = 요청 1개, bulk_write 만 여러 개) ====================
+
+def scenario_list(rec, ctx, rng):
+    pages = max(1, ctx['size'] // 20)
+    rec.call('GET', f'/api/freelancers?page={rng.randint(1, min(pages, 500))}&limit=20&sortBy=name')
+
+
+def scenario_search(rec, ctx, rng):
+    rec.call('GET', f'/api/freelancers?search={rng.choice(SEARCH_TERMS)}&limit=20')
+
+
+def scenario_skill_filter(rec, ctx, rng):
+    skills = rng.sample(ctx['skills'][:15], 2)  # 흔한 스킬 위주
+    rec.call('GET', f'/api/freelancers?skills={skills[0]}&skills={skills[1]}&availability=available'
+                    f'&sortBy=experience&sortOrder=desc&limit=20')
+
+
+def scenario_detail(rec, ctx, rng):
+    rec.call('GET', f'/api/freelancers/{dataset.entity_id("freelancer", rng.randrange(ctx["size"]))}')
+
+
+def scenario_evaluation(rec, ctx, rng):
+    rec.call('GET', f'/api/interviews/evaluations/{dataset.entity_id("evaluation", rng.randrange(ctx["evaluations"]))}')
+
+
+def scenario_document_search(rec, ctx, rng):
+    rec.call('GET', f'/api/freelancers/documents/search?q={rng.choice(DOCUMENT_TERMS)}&limit=20')
+
+
+def scenario_bulk_write(rec, ctx, rng):
+    n = len(ctx['created'])
+    response = rec.call('POST', '/api/freelancers', {
+        'name': f'벤치 {n}', 'email': f'bench-{ctx["token"]}-{n}@bench.example.com', 'phone': '010-0000-0000',
+        'experience': rng.randint(0, 20), 'hourlyRate': rng.randint(30, 150) * 1000, 'availability': 'available',
+        'skillIds': rng.sample(ctx['skills'], 4),
+    })
+    if response.status_code != 201:
+        return
+    freelancer_id = response.get_json()['data']['id']
+    ctx['created'].append(freelancer_id)
+
+    response = rec.call('POST', '/api/interviews/evaluations', {'freelancerId': freelancer_id, 'interviewerName': '벤치'})
+    if response.status_code != 201:
+        return
+    evaluation_id = response.get_json()['data']['id']
+    for category_id in ctx['categories']:
+        score = rng.choice((1, 3, 5))
+        rec.call('POST', f'/api/interviews/evaluations/{evaluation_id}/category-scores',
+                 {'categoryId': category_id, 'score': score, 'scoreLabel': {1: '하(1)', 3: '중(3)', 5: '상(5)'}[score]})
+    rec.call('POST', f'/api/interviews/evaluations/{evaluation_id}/calculate-score')
+
+
+SCENARIOS = {
+    'list': scenario_list,
+    'search': scenario_search,
+    'skill_filter': scenario_skill_filter,
+    'detail': scenario_detail,
+    'evaluation': scenario_evaluation,
+    'document_search': scenario_document_search,
+    'bulk_write': scenario_bulk_write,  # 마지막 - 쓰기로 인한 스냅샷 갱신이 읽기 측정에 섞이지 않도록
+}
+
+
+def environment():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=dataset.ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'startedAt': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def print_comparison(report, baseline):
+    print(f'\n📊 비교 (기준: {baseline.get("environment", {}).get("commit") or "baseline"})')
+    print(f'  {"":<16} {"p50":>20} {"p95":>20} {"p99":>20} {"쿼리":>12}')
+    for name, stats in report['scenarios'].items():
+        base = baseline.get('scenarios', {}).get(name)
+        if not base:
+            continue
+        cells = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            change = (stats[key] - base[key]) / base[key] * 100 if base[key] else 0.0
+            cells.append(f'{base[key]:7.2f}→{stats[key]:7.2f} {change:+4.0f}%')
+        queries = f'{base["queries_mean"]}→{stats["queries_mean"]}'
+        print(f'  {name:<16} {cells[0]:>20} {cells[1]:>20} {cells[2]:>20} {queries:>12}')
+
+
+def run(args):
+    size = dataset.parse_size(args.size)
+    path = args.path or dataset.default_path(size, args.seed)
+    names = args.scenarios.split(',') if args.scenarios else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f'❌ 알 수 없는 시나리오: {", ".join(unknown)} (가능: {", ".join(SCENARIOS)})')
+
+    print(f'📦 데이터셋: 프리랜서 {size:,}명 (seed {args.seed}) → {path}')
+    app, meta = dataset.prepare(path, size, args.seed, force=args.force_dataset)
+    client = app.test_client()
+    ctx = {
+        'size': size,
+        'skills': meta['skills'],
+        'categories': meta['categories'],
+        'evaluations': meta['counts']['evaluation'],
+        'token': uuid.uuid4().hex[:8],
+        'created': [],
+    }
+
+    print(f'🚀 시나리오별 요청 {args.requests}회 (워밍업 {args.warmup}회)\n')
+    report = {
+        'dataset': {key: meta[key] for key in ('version', 'size', 'seed', 'counts')},
+        'environment': environment(),
+        'requests': args.requests,
+        'scenarios': {},
+    }
+    try:
+        for name in names:
+            rng = random.Random(f'{args.seed}-{name}')
+            scenario = SCENARIOS[name]
+            warmup = Recorder(client)
+            for _ in range(args.warmup):  # 스냅샷 / 캐시 / 커넥션 준비
+                scenario(warmup, ctx, rng)
+            recorder = Recorder(client)
+            while len(recorder.samples) < args.requests:
+                scenario(recorder, ctx, rng)
+            stats = recorder.summary()
+            report['scenarios'][name] = stats
+            errors = f' | 오류 {stats["errors"]}' if stats['errors'] else ''
+            print(f'  {name:<16} p50 {stats["p50_ms"]:8.2f}ms | p95 {stats["p95_ms"]:8.2f}ms | '
+                  f'p99 {stats["p99_ms"]:8.2f}ms | 쿼리 {stats["queries_mean"]} (최대 {stats["queries_max"]}){errors}')
+    finally:
+        # bulk_write 로 만든 프리랜서 삭제 (평가는 함께 삭제) → 데이터셋 재사용
+        for freelancer_id in ctx['created']:
+            client.delete(f'/api/freelancers/{freelancer_id}')
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            print_comparison(report, json.load(f))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\n💾 {args.json} 저장')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='합성 데이터셋 기반 API 시나리오 벤치마크 (p50 / p95 / p99, 요청당 쿼리 수)')
+    parser.add_argument('--size', default='10k', help=f'프리랜서 수 ({" / ".join(dataset.SIZES)} 또는 숫자)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--path', help='데이터셋 SQLite 파일 (기본: benchmarks/data/freelancers_<size>_seed<seed>.db)')
+    parser.add_argument('--scenarios', help=f'쉼표로 구분 (기본: 전체 - {",".join(SCENARIOS)})')
+    parser.add_argument('--requests', type=int, default=200, help='시나리오별 측정 요청 수')
+    parser.add_argument('--warmup', type=int, default=10, help='시나리오별 워밍업 호출 수 (측정 제외)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    parser.add_argument('--compare', help='이전 결과 JSON 과 비교 출력')
+    parser.add_argument('--force-dataset', action='store_true', help='데이터셋 다시 생성')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
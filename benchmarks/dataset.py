@@ -0,0 +1,352 @@
+"""
+벤치마크용 합성 데이터셋 (SQLite 파일)
+- 프리랜서 1k / 10k / 100k / 1m 명 + 스킬, 프로필, 리뷰, 포트폴리오, 면접 평가(점수 / 체크포인트 / 레드플래그), 문서
+- 같은 크기 + seed 면 항상 같은 데이터 (id 도 순번에서 계산 → 벤치마크가 DB 조회 없이 대상 id 를 고름)
+- 생성은 Core bulk insert (ORM 객체 생성 없음), 문서는 생성하면서 전문 검색 인덱스에도 넣음
+- 파일 옆 .json 에 크기 / seed / 행 수를 기록하고, 같으면 다시 만들지 않음
+
+사용 예:
+    python benchmarks/dataset.py --size 10k
+    python benchmarks/dataset.py --size 1m --seed 7 --path /data/bench_1m.db --force
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DATASET_VERSION = 1  # 생성 규칙을 바꾸면 올림 → 기존 파일 재생성
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DATA_DIR = os.path.join(ROOT, 'benchmarks', 'data')
+CHUNK = 2_000  # 한 번에 insert / commit 할 프리랜서 수
+BASE_TIME = datetime(2023, 1, 1)
+
+# id 종류 (uuid 앞 32비트) - entity_id(kind, 순번) 로 어느 쪽에서든 같은 id 계산
+KINDS = {
+    'freelancer': 1, 'profile': 2, 'portfolio': 3, 'review': 4, 'document': 5,
+    'evaluation': 6, 'category_score': 7, 'result': 8, 'finding': 9,
+    'category': 10, 'checkpoint': 11, 'red_flag': 12, 'question': 13,
+}
+
+EXTRA_SKILLS = [
+    ('django', 'Django', 'backend'), ('flask', 'Flask', 'backend'), ('fastapi', 'FastAPI', 'backend'),
+    ('spring', 'Spring Boot', 'backend'), ('kotlin', 'Kotlin', 'backend'), ('nestjs', 'NestJS', 'backend'),
+    ('graphql', 'GraphQL', 'backend'), ('kafka', 'Kafka', 'backend'), ('elasticsearch', 'Elasticsearch', 'backend'),
+    ('nextjs', 'Next.js', 'frontend'), ('svelte', 'Svelte', 'frontend'), ('redux', 'Redux', 'frontend'),
+    ('swift', 'Swift', 'mobile'), ('flutter', 'Flutter', 'mobile'), ('react-native', 'React Native', 'mobile'),
+    ('android', 'Android', 'mobile'), ('terraform', 'Terraform', 'devops'), ('ansible', 'Ansible', 'devops'),
+    ('prometheus', 'Prometheus', 'devops'), ('pytorch', 'PyTorch', 'data'), ('tensorflow', 'TensorFlow', 'data'),
+    ('pandas', 'Pandas', 'data'), ('spark', 'Spark', 'data'), ('airflow', 'Airflow', 'data'),
+    ('sketch', 'Sketch', 'design'), ('zeplin', 'Zeplin', 'design'),
+]
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN_NAMES = ['민준', '서연', '도윤', '지우', '하준', '서윤', '시우', '하은', '지호', '수아',
+               '예준', '지민', '현우', '채원', '준서', '다은', '건우', '예린', '우진', '소율']
+COMPANIES = ['네오테크', '블루웨이브', '스마트랩', '코드팩토리', '데이터브릿지', '클라우드나인', '핀테크원', '모바일온']
+PROJECT_TOPICS = ['결제 시스템', '추천 엔진', '사내 ERP', '커머스 백오피스', '실시간 채팅', '물류 관제', '헬스케어 앱', '광고 리포트']
+REVIEW_COMMENTS = ['일정 내에 완료했습니다', '커뮤니케이션이 원활했습니다', '코드 품질이 좋았습니다',
+                   '요구사항 이해가 빨랐습니다', '문서화가 아쉬웠습니다', None]
+
+CATEGORIES = [
+    ('기술 역량 & 문제해결', 20), ('포트폴리오 검증', 20), ('커뮤니케이션', 15), ('업무 방식 & 협업', 15),
+]
+CHECKPOINTS_PER_CATEGORY = 4
+RED_FLAGS_PER_CATEGORY = 3
+SEVERITIES = ['low', 'medium', 'high', 'critical']
+
+
+def entity_id(kind: str, index: int) -> str:
+    """종류 + 순번 → 고정 uuid 문자열"""
+    return str(uuid.UUID(int=(KINDS[kind] << 96) | index))
+
+
+def parse_size(value: str) -> int:
+    return SIZES[value.lower()] if value.lower() in SIZES else int(value)
+
+
+def size_label(size: int) -> str:
+    return next((label for label, n in SIZES.items() if n == size), str(size))
+
+
+def default_path(size: int, seed: int) -> str:
+    return os.path.join(DATA_DIR, f'freelancers_{size_label(size)}_seed{seed}.db')
+
+
+def skill_catalog():
+    """(id, name, category) - init_skills.py 의 기본 스킬 + 추가 스킬"""
+    from init_skills import INITIAL_SKILLS
+    return [(s['id'], s['name'], s['category']) for s in INITIAL_SKILLS] + EXTRA_SKILLS
+
+
+def configure(path: str):
+    """데이터셋 파일을 쓰도록 환경변수 설정 (config / app import 전에 호출)"""
+    os.environ['DB_TYPE'] = 'sqlite'
+    os.environ['DB_NAME'] = os.path.abspath(path)[:-len('.db')] if path.endswith('.db') else os.path.abspath(path)
+    os.environ.setdefault('FLASK_ENV', 'production')
+    os.environ.setdefault('REQUEST_LOG', 'false')
+    os.environ.setdefault('SLOW_QUERY_MS', '0')
+    os.environ.setdefault('DB_REPLICA_URLS', '')
+
+
+def load_meta(path: str):
+    try:
+        with open(path + '.json', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def prepare(path: str, size: int, seed: int, force: bool = False):
+    """(app, meta) - 파일이 없거나 크기 / seed / 버전이 다르면 새로 생성"""
+    if not path.endswith('.db'):
+        raise SystemExit(f'❌ 데이터셋 경로는 .db 로 끝나야 합니다: {path}')
+    configure(path)
+    meta = load_meta(path)
+    stale = force or not os.path.exists(path) or not meta or (
+        meta.get('version'), meta.get('size'), meta.get('seed')) != (DATASET_VERSION, size, seed)
+    if stale:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        for suffix in ('', '-wal', '-shm', '.json'):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+
+    from app import create_app
+    app = create_app()
+    if stale:
+        meta = populate(app, size, seed)
+        with open(path + '.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+    return app, meta
+
+
+# ==================== 생성 ====================
+
+def populate(app, size: int, seed: int):
+    """빈 DB 에 데이터셋 생성 → 메타 정보"""
+    from app.db import db
+    from app.models import Skill, InterviewCategory, InterviewCheckpoint, InterviewRedFlag, InterviewQuestion
+    from app.services.search_service import DocumentSearchService
+    from app.services.analytics_service import InterviewAnalyticsService
+
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    skills = skill_catalog()
+    # 스킬 인기도는 지프 분포 (앞쪽 스킬이 훨씬 흔함) - 순서는 seed 로 섞음
+    order = list(range(len(skills)))
+    rng.shuffle(order)
+    popularity = [1.0 / (rank + 1) for rank in range(len(skills))]
+    ranked_skills = [skills[i] for i in order]
+
+    with app.app_context():
+        insert = lambda model, rows: rows and db.session.execute(getattr(model, '__table__', model).insert(), rows)  # noqa: E731
+
+        insert(Skill, [{'id': sid, 'name': name, 'category': category} for sid, name, category in skills])
+        checkpoints, red_flags = [], []
+        for c, (name, weight) in enumerate(CATEGORIES):
+            category_id = entity_id('category', c)
+            insert(InterviewCategory, [{'id': category_id, 'name': name, 'weight': weight, 'max_score': 5.0,
+                                        'order': c + 1, 'created_at': BASE_TIME}])
+            insert(InterviewQuestion, [
+                {'id': entity_id('question', c * 10 + i), 'category_id': category_id,
+                 'question_text': f'{name} 질문 {i + 1}', 'order': i + 1, 'created_at': BASE_TIME}
+                for i in range(3)
+            ])
+            for i in range(CHECKPOINTS_PER_CATEGORY):
+                checkpoints.append((category_id, entity_id('checkpoint', c * 10 + i)))
+            for i in range(RED_FLAGS_PER_CATEGORY):
+                red_flags.append((category_id, entity_id('red_flag', c * 10 + i)))
+        insert(InterviewCheckpoint, [
+            {'id': cid, 'category_id': category_id, 'checkpoint_text': f'체크포인트 {i}', 'order': i,
+             'created_at': BASE_TIME} for i, (category_id, cid) in enumerate(checkpoints)
+        ])
+        insert(InterviewRedFlag, [
+            {'id': rid, 'category_id': category_id, 'flag_text': f'레드플래그 {i}', 'severity': SEVERITIES[i % 4],
+             'order': i, 'created_at': BASE_TIME} for i, (category_id, rid) in enumerate(red_flags)
+        ])
+        db.session.commit()
+
+        counters = {'evaluation': 0, 'review': 0, 'portfolio': 0, 'document': 0, 'category_score': 0,
+                    'result': 0, 'finding': 0, 'skill_link': 0}
+        for start in range(0, size, CHUNK):
+            rows = _chunk_rows(rng, range(start, min(start + CHUNK, size)), ranked_skills, popularity,
+                               checkpoints, red_flags, counters)
+            for model, chunk_rows in rows['tables']:
+                insert(model, chunk_rows)
+            DocumentSearchService.index_documents(rows['search'])
+            db.session.commit()
+            done = min(start + CHUNK, size)
+            if done % (CHUNK * 25) == 0 or done == size:
+                elapsed = time.perf_counter() - started
+                print(f'  … {done:>9,}/{size:,}명 ({elapsed:.0f}초, 예상 남은 시간 {elapsed / done * (size - done):.0f}초)')
+
+        InterviewAnalyticsService.rebuild()
+
+    counters.pop('skill_link')
+    return {
+        'version': DATASET_VERSION,
+        'size': size,
+        'seed': seed,
+        'skills': [sid for sid, _, _ in ranked_skills],  # 인기 순
+        'categories': [entity_id('category', c) for c in range(len(CATEGORIES))],
+        'counts': {'freelancer': size, **counters},
+        'generatedSeconds': round(time.perf_counter() - started, 1),
+    }
+
+
+def _chunk_rows(rng, indexes, ranked_skills, popularity, checkpoints, red_flags, counters):
+    """프리랜서 CHUNK 명분의 테이블별 행 + 검색 인덱스 행"""
+    from app.models import (
+        Freelancer, FreelancerProfile, PortfolioItem, Review, FreelancerDocument, InterviewEvaluation,
+        InterviewCategoryScore, InterviewEvaluationResult, InterviewRedFlagFinding, freelancer_skill
+    )
+
+    tables = {model: [] for model in (
+        Freelancer, FreelancerProfile, freelancer_skill, PortfolioItem, Review, FreelancerDocument,
+        InterviewEvaluation, InterviewCategoryScore, InterviewEvaluationResult, InterviewRedFlagFinding
+    )}
+    search = []
+    skill_ids = [sid for sid, _, _ in ranked_skills]
+    skill_names = {sid: name for sid, name, _ in ranked_skills}
+    categories = sorted({category_id for category_id, _ in checkpoints})
+
+    for i in indexes:
+        fid = entity_id('freelancer', i)
+        created = BASE_TIME + timedelta(seconds=rng.randrange(3 * 365 * 24 * 3600))
+        name = rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+        tables[Freelancer].append({'id': fid, 'name': name, 'email': f'freelancer{i}@bench.example.com',
+                                   'phone': f'010-{i // 10000 % 10000:04d}-{i % 10000:04d}',
+                                   'created_at': created, 'updated_at': created})
+
+        experience = min(int(rng.expovariate(1 / 5)), 25)
+        availability = rng.choices(('available', 'busy', 'unavailable'), (6, 3, 1))[0]
+        tables[FreelancerProfile].append({
+            'id': entity_id('profile', i), 'freelancer_id': fid, 'experience': experience,
+            'hourly_rate': (30 + experience * 4 + rng.randrange(0, 30)) * 1000, 'availability': availability,
+            'bio': f'{experience}년차 개발자', 'created_at': created, 'updated_at': created,
+        })
+
+        owned = set()
+        while len(owned) < rng.randint(3, 10):
+            owned.add(rng.choices(skill_ids, popularity)[0])
+        owned = sorted(owned)
+        tables[freelancer_skill].extend({'freelancer_id': fid, 'skill_id': sid} for sid in owned)
+        counters['skill_link'] += len(owned)
+
+        for _ in range(rng.choices(range(5), (30, 30, 20, 12, 8))[0]):
+            n = counters['portfolio'] = counters['portfolio'] + 1
+            tables[PortfolioItem].append({
+                'id': entity_id('portfolio', n), 'freelancer_id': fid,
+                'title': f'{rng.choice(COMPANIES)} {rng.choice(PROJECT_TOPICS)}',
+                'technologies': [skill_names[sid] for sid in rng.sample(owned, min(3, len(owned)))],
+                'duration_months': rng.randint(1, 24), 'role': rng.choice(['백엔드', '프론트엔드', '풀스택', 'PM']),
+                'company': rng.choice(COMPANIES), 'created_at': created, 'updated_at': created,
+            })
+
+        for _ in range(min(int(rng.expovariate(1 / 2.5)), 20)):
+            n = counters['review'] = counters['review'] + 1
+            tables[Review].append({
+                'id': entity_id('review', n), 'freelancer_id': fid,
+                'rating': round(min(5.0, max(1.0, rng.gauss(4.2, 0.7))) * 2) / 2,
+                'comment': rng.choice(REVIEW_COMMENTS), 'project_name': rng.choice(PROJECT_TOPICS),
+                'reviewer_name': rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+                'created_at': created, 'updated_at': created,
+            })
+
+        if rng.random() < 0.15:  # 면접 평가는 일부만 (1~2회)
+            for _ in range(rng.randint(1, 2)):
+                _evaluation_rows(rng, tables, fid, created, categories, checkpoints, red_flags, counters)
+
+        if rng.random() < 0.25:  # 이력서 문서
+            n = counters['document'] = counters['document'] + 1
+            did = entity_id('document', n)
+            text = _resume_text(rng, name, experience, [skill_names[sid] for sid in owned])
+            tables[FreelancerDocument].append({
+                'id': did, 'freelancer_id': fid, 'document_type': 'resume',
+                'original_filename': f'resume_{i}.txt', 'file_path': f'uploads/freelancer/{fid}/resume_{i}.txt',
+                'file_size': len(text.encode('utf-8')), 'mime_type': 'text/plain',
+                'content_hash': uuid.UUID(int=rng.getrandbits(128)).hex * 2,
+                'extracted_text': text,
+                'extracted_data': {'skills': [skill_names[sid] for sid in owned], 'experience_years': experience},
+                'is_analyzed': True, 'created_at': created, 'updated_at': created,
+            })
+            search.append((did, fid, text))
+
+    return {'tables': list(tables.items()), 'search': search}
+
+
+def _evaluation_rows(rng, tables, fid, created, categories, checkpoints, red_flags, counters):
+    from app.models import (
+        InterviewEvaluation, InterviewCategoryScore, InterviewEvaluationResult, InterviewRedFlagFinding
+    )
+
+    n = counters['evaluation'] = counters['evaluation'] + 1
+    eid = entity_id('evaluation', n - 1)  # 0 부터 - 벤치마크가 [0, evaluation 수) 에서 고름
+    evaluated = created + timedelta(days=rng.randrange(1, 365))
+    scores = {category_id: rng.choice((1.0, 3.0, 3.0, 5.0, 5.0)) for category_id in categories}
+    tables[InterviewEvaluation].append({
+        'id': eid, 'freelancer_id': fid, 'interviewer_name': rng.choice(SURNAMES) + '면접관',
+        'project_name': rng.choice(PROJECT_TOPICS), 'total_score': sum(scores.values()) / len(scores) / 5.0 * 100,
+        'recommendation': rng.choice(('recommend', 'not_recommend', 'pending')),
+        'evaluated_at': evaluated, 'created_at': evaluated, 'updated_at': evaluated,
+    })
+    labels = {1.0: '하(1)', 3.0: '중(3)', 5.0: '상(5)'}
+    for category_id, score in scores.items():
+        k = counters['category_score'] = counters['category_score'] + 1
+        tables[InterviewCategoryScore].append({
+            'id': entity_id('category_score', k), 'evaluation_id': eid, 'category_id': category_id,
+            'score': score, 'score_label': labels[score], 'checked_count': int(score // 2) + 1,
+            'created_at': evaluated, 'updated_at': evaluated,
+        })
+    for _, checkpoint_id in checkpoints:
+        k = counters['result'] = counters['result'] + 1
+        tables[InterviewEvaluationResult].append({
+            'id': entity_id('result', k), 'evaluation_id': eid, 'checkpoint_id': checkpoint_id,
+            'is_checked': rng.random() < 0.6, 'created_at': evaluated, 'updated_at': evaluated,
+        })
+    for _, red_flag_id in red_flags:
+        k = counters['finding'] = counters['finding'] + 1
+        found = rng.random() < 0.1
+        tables[InterviewRedFlagFinding].append({
+            'id': entity_id('finding', k), 'evaluation_id': eid, 'red_flag_id': red_flag_id, 'is_found': found,
+            'severity_actual': rng.choice(SEVERITIES) if found else None,
+            'created_at': evaluated, 'updated_at': evaluated,
+        })
+
+
+def _resume_text(rng, name, experience, skills):
+    projects = '\n'.join(
+        f'- {rng.choice(COMPANIES)} {rng.choice(PROJECT_TOPICS)} ({rng.randint(3, 18)}개월, {", ".join(rng.sample(skills, min(2, len(skills))))})'
+        for _ in range(rng.randint(2, 5))
+    )
+    return (f'{name} 이력서\n경력: {experience}년\n기술 스택: {", ".join(skills)}\n\n'
+            f'주요 프로젝트\n{projects}\n\n자기소개\n{rng.choice(PROJECT_TOPICS)} 도메인에서 '
+            f'{rng.choice(skills)} 기반 서비스를 설계하고 운영했습니다.\n')
+
+
+def run(args):
+    size = parse_size(args.size)
+    path = args.path or default_path(size, args.seed)
+    print(f'📦 벤치마크 데이터셋: 프리랜서 {size:,}명 (seed {args.seed}) → {path}')
+    _, meta = prepare(path, size, args.seed, force=args.force)
+    print(f'\n✅ 행 수: {", ".join(f"{k} {v:,}" for k, v in meta["counts"].items())}')
+    print(f'   생성 시간 {meta["generatedSeconds"]}초, 파일 {os.path.getsize(path) / 1024 / 1024:.1f}MB')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='벤치마크용 합성 데이터셋 생성 (SQLite)')
+    parser.add_argument('--size', default='10k', help=f'프리랜서 수 ({" / ".join(SIZES)} 또는 숫자)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--path', help='SQLite 파일 경로 (기본: benchmarks/data/freelancers_<size>_seed<seed>.db)')
+    parser.add_argument('--force', action='store_true', help='이미 있어도 다시 생성')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
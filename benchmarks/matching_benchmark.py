@@ -0,0 +1,148 @@
+"""
+프리랜서 스냅샷 벤치마크
+DB 없이 합성 스냅샷(프리랜서 N명 × 스킬 S개)을 만들어 FreelancerSnapshot.match / list_page 소요 시간을 측정
+
+사용 예:
+    python benchmarks/matching_benchmark.py
+    python benchmarks/matching_benchmark.py --freelancers 100000 --skills 300 --repeat 200 --json result.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.freelancer_snapshot import COLUMNS, FreelancerSnapshot  # noqa: E402
+
+
+def make_snapshot(n: int, n_skills: int, seed: int) -> FreelancerSnapshot:
+    """실제 분포를 흉내 낸 합성 스냅샷 (스킬 인기도는 지프 분포, 1인당 스킬 3~12개)"""
+    rng = np.random.default_rng(seed)
+    ids = [f'{i:08d}-0000-0000-0000-000000000000' for i in range(n)]
+    names = [f'freelancer-{rng.integers(0, n):08d}' for _ in range(n)]
+
+    rating = rng.uniform(1.0, 5.0, n).astype(np.float32)
+    review_count = rng.integers(0, 30, n)
+    rating[review_count == 0] = np.nan
+    interview_score = rng.uniform(20, 100, n).astype(np.float32)
+    interview_score[rng.random(n) < 0.7] = np.nan  # 면접 기록은 일부만
+
+    columns = {
+        'has_profile': np.ones(n, dtype=bool),
+        'created_at': rng.integers(1_600_000_000, 1_700_000_000, n) * 1_000_000,
+        'experience': rng.integers(0, 25, n),
+        'hourly_rate': rng.integers(20, 150, n) * 1000,
+        'availability': rng.choice([0, 1, 2], n, p=[0.6, 0.3, 0.1]),
+        'rating': rating,
+        'review_count': review_count,
+        'interview_score': interview_score,
+    }
+
+    popularity = 1.0 / np.arange(1, n_skills + 1)
+    popularity /= popularity.sum()
+    skill_matrix = np.zeros((n_skills, n), dtype=bool)
+    per_person = rng.integers(3, 13, n)
+    for i in range(n):
+        skill_matrix[rng.choice(n_skills, per_person[i], replace=False, p=popularity), i] = True
+
+    skill_ids = [f'skill-{j}' for j in range(n_skills)]
+    return FreelancerSnapshot(ids, names, columns, skill_ids, skill_matrix)
+
+
+QUERIES = {
+    'no_filter': dict(),
+    'popular_required': dict(required_skills=['skill-0'], nice_skills=['skill-1', 'skill-2', 'skill-5'],
+                             max_hourly_rate=100000, min_experience=3, availability=['available']),
+    'rare_required': dict(required_skills=['skill-0', 'skill-40'], nice_skills=['skill-3'],
+                          availability=['available', 'busy']),
+    'many_nice': dict(nice_skills=[f'skill-{j}' for j in range(0, 60, 3)], max_hourly_rate=80000),
+}
+
+
+LIST_QUERIES = {
+    'list_name': dict(),
+    'list_filtered': dict(skills=['skill-3', 'skill-7'], availability='available', min_rating=3.5,
+                          max_hourly_rate=90000, sort_by='experience', sort_order='desc'),
+    'list_deep_page': dict(sort_by='hourlyRate', page=2000),
+}
+
+
+def measure(fn, repeat):
+    """반복 실행 시간 (ms) 통계와 마지막 결과"""
+    result = fn()  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - t) * 1000)
+    timings = np.array(timings)
+    return result, {
+        'p50_ms': round(float(np.percentile(timings, 50)), 3),
+        'p95_ms': round(float(np.percentile(timings, 95)), 3),
+        'max_ms': round(float(timings.max()), 3),
+    }
+
+
+def print_stats(name, count, stats):
+    print(f'  {name:<18} 후보 {count:>7}명 | p50 {stats["p50_ms"]:7.2f}ms '
+          f'| p95 {stats["p95_ms"]:7.2f}ms | max {stats["max_ms"]:7.2f}ms')
+
+
+def run(args):
+    started = time.perf_counter()
+    snapshot = make_snapshot(args.freelancers, args.skills, args.seed)
+    print(f'📦 합성 스냅샷: 프리랜서 {snapshot.size}명, 스킬 {args.skills}개 ({time.perf_counter() - started:.1f}초)')
+    print(f'   스킬 행렬 {snapshot.skill_matrix.nbytes / 1024 / 1024:.1f}MB\n')
+
+    report = {'freelancers': snapshot.size, 'skills': args.skills, 'limit': args.limit, 'queries': {}}
+    for name, query in QUERIES.items():
+        result, stats = measure(lambda: snapshot.match(limit=args.limit, **query), args.repeat)
+        report['queries'][name] = {'candidates': result['total'], **stats}
+        print_stats(name, result['total'], stats)
+
+    for name, query in LIST_QUERIES.items():
+        (total, _), stats = measure(lambda: snapshot.list_page(limit=args.limit, **query), args.repeat)
+        report['queries'][name] = {'candidates': total, **stats}
+        print_stats(name, total, stats)
+
+    # 변경분 반영 (DB 조회 제외) - 기존 50명 수정(10명 이름 변경) + 신규 5명
+    changed = [str(freelancer_id) for freelancer_id in snapshot.ids[:50]]
+    ids = changed + [f'{args.freelancers + i:08d}-0000-0000-0000-000000000000' for i in range(5)]
+    names = [f'renamed-{i}' if i % 5 == 0 else str(name) for i, name in enumerate(snapshot.names[:55])]
+    columns = {name: getattr(snapshot, name)[:55].copy() for name in COLUMNS}
+    skills = [['skill-0', 'skill-3']] * len(ids)
+    _, stats = measure(lambda: snapshot.merge(changed, ids, names, columns, skills), args.repeat)
+    report['snapshot_merge'] = stats
+    print(f'\n  {"변경분 반영 (55명)":<18} | p50 {stats["p50_ms"]:7.2f}ms | p95 {stats["p95_ms"]:7.2f}ms '
+          f'| max {stats["max_ms"]:7.2f}ms')
+
+    started = time.perf_counter()
+    FreelancerSnapshot(snapshot.ids, snapshot.names, {name: getattr(snapshot, name) for name in COLUMNS},
+                       snapshot.skill_ids, snapshot.skill_matrix, snapshot.alive)
+    rebuild_ms = round((time.perf_counter() - started) * 1000, 1)
+    report['snapshot_build_ms'] = rebuild_ms
+    print(f'  전체 스냅샷 구성 (메모리 작업, 백그라운드 재생성 시) {rebuild_ms}ms')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\n💾 {args.json} 저장')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='FreelancerSnapshot.match / list_page 벤치마크')
+    parser.add_argument('--freelancers', type=int, default=100000, help='프리랜서 수')
+    parser.add_argument('--skills', type=int, default=300, help='스킬 수')
+    parser.add_argument('--limit', type=int, default=20, help='상위 N명')
+    parser.add_argument('--repeat', type=int, default=100, help='쿼리별 반복 횟수')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
@@ -0,0 +1,163 @@
+"""
+서버 처리량 벤치마크 - Flask 개발 서버(app.py) vs gunicorn(gunicorn.conf.py)
+각 서버를 서브프로세스로 띄우고 keep-alive 연결 N개로 같은 엔드포인트를 일정 시간 호출해
+초당 처리량 / 지연 시간(p50, p95, p99) / 오류 수를 비교
+
+사용 예:
+    python benchmarks/server_benchmark.py
+    python benchmarks/server_benchmark.py --path "/api/freelancers?limit=20" --concurrency 16 --duration 20
+    python benchmarks/server_benchmark.py --servers gunicorn --workers 4 --json result.json
+
+주의:
+- 부하 생성기도 같은 머신의 Python 스레드이므로 절대값보다 두 서버의 상대 비교로 볼 것
+- DB / 데이터는 현재 환경변수(.env) 설정을 그대로 사용
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import http.client
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    'dev': lambda args: [sys.executable, 'app.py'],
+    'gunicorn': lambda args: [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+}
+
+
+def start_server(name, args, port):
+    """서버 프로세스 시작 후 포트가 열릴 때까지 대기"""
+    env = dict(os.environ)
+    env.update({
+        'API_HOST': '127.0.0.1',
+        'API_PORT': str(port),
+        'FLASK_ENV': 'production',
+        'GUNICORN_ACCESS_LOG': '/dev/null',
+    })
+    if args.workers:
+        env['GUNICORN_WORKERS'] = str(args.workers)
+
+    log = open(os.path.join(args.log_dir, f'server_{name}.log'), 'w')
+    process = subprocess.Popen(SERVERS[name](args), cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT,
+                               start_new_session=True)
+
+    deadline = time.monotonic() + args.startup_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'{name} 서버가 종료되었습니다 (로그: {log.name})')
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    stop_server(process)
+    raise RuntimeError(f'{name} 서버가 {args.startup_timeout}초 안에 시작되지 않았습니다')
+
+
+def stop_server(process):
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=30)
+    except (ProcessLookupError, subprocess.TimeoutExpired):
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def load(port, path, concurrency, duration):
+    """keep-alive 연결 concurrency 개로 duration 초 동안 호출 → (지연 목록 ms, 오류 수)"""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = []
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    raise http.client.HTTPException(response.status)
+                local.append((time.perf_counter() - started) * 1000)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        conn.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, errors[0]
+
+
+def run(args):
+    os.makedirs(args.log_dir, exist_ok=True)
+    print(f'🏁 서버 벤치마크: GET {args.path} | 동시 연결 {args.concurrency} | {args.duration}초\n')
+
+    report = {'path': args.path, 'concurrency': args.concurrency, 'duration': args.duration, 'servers': {}}
+    for offset, name in enumerate(args.servers):
+        port = args.port + offset
+        process = start_server(name, args, port)
+        try:
+            load(port, args.path, args.concurrency, args.warmup)  # 워밍업 (스냅샷 / 캐시 생성)
+            latencies, errors = load(port, args.path, args.concurrency, args.duration)
+        finally:
+            stop_server(process)
+
+        timings = np.array(latencies) if latencies else np.zeros(1)
+        stats = {
+            'requests': len(latencies),
+            'errors': errors,
+            'rps': round(len(latencies) / args.duration, 1),
+            'p50_ms': round(float(np.percentile(timings, 50)), 2),
+            'p95_ms': round(float(np.percentile(timings, 95)), 2),
+            'p99_ms': round(float(np.percentile(timings, 99)), 2),
+        }
+        report['servers'][name] = stats
+        print(f'  {name:<9} {stats["rps"]:>8.1f} req/s | p50 {stats["p50_ms"]:7.2f}ms | p95 {stats["p95_ms"]:7.2f}ms '
+              f'| p99 {stats["p99_ms"]:7.2f}ms | 오류 {errors}')
+
+    if 'dev' in report['servers'] and 'gunicorn' in report['servers'] and report['servers']['dev']['rps']:
+        ratio = report['servers']['gunicorn']['rps'] / report['servers']['dev']['rps']
+        report['speedup'] = round(ratio, 2)
+        print(f'\n  gunicorn / 개발 서버 처리량: {ratio:.2f}배')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\n💾 {args.json} 저장')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Flask 개발 서버 vs gunicorn 처리량 비교')
+    parser.add_argument('--path', default='/api/freelancers/skills', help='호출할 경로 (GET)')
+    parser.add_argument('--servers', nargs='+', choices=list(SERVERS), default=list(SERVERS))
+    parser.add_argument('--concurrency', type=int, default=8, help='동시 연결 수')
+    parser.add_argument('--duration', type=float, default=10, help='서버별 측정 시간 (초)')
+    parser.add_argument('--warmup', type=float, default=2, help='워밍업 시간 (초)')
+    parser.add_argument('--workers', type=int, help='gunicorn 워커 수 (기본: gunicorn.conf.py)')
+    parser.add_argument('--port', type=int, default=8100, help='첫 서버 포트 (이후 +1)')
+    parser.add_argument('--startup-timeout', type=float, default=60)
+    parser.add_argument('--log-dir', default=tempfile.gettempdir(), help='서버 로그 위치')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
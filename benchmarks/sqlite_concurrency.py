@@ -0,0 +1,173 @@
+"""
+SQLite 동시 읽기 / 쓰기 벤치마크 - PRAGMA 프로필(app.db.SQLITE_PRAGMAS) 적용 전후 비교
+임시 DB 파일에 프리랜서 / 프로필 / 리뷰를 채운 뒤 읽기 스레드(목록 + 평점 집계)와
+쓰기 스레드(리뷰 추가 + 프로필 수정 커밋)를 동시에 돌려 처리량 / 지연 / 잠금 오류를 측정
+
+사용 예:
+    python benchmarks/sqlite_concurrency.py
+    python benchmarks/sqlite_concurrency.py --readers 8 --writers 4 --duration 10 --json result.json
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import tempfile
+import threading
+
+import numpy as np
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db import db, apply_sqlite_pragmas, SQLITE_PRAGMAS  # noqa: E402
+from app import models  # noqa: E402,F401 - 테이블 메타데이터 등록
+
+READ_SQL = text(
+    'SELECT f.id, f.name, p.experience, p.hourly_rate FROM freelancer f '
+    'JOIN freelancer_profile p ON p.freelancer_id = f.id '
+    'ORDER BY p.hourly_rate LIMIT 20 OFFSET :offset'
+)
+RATING_SQL = text('SELECT AVG(rating), COUNT(*) FROM review WHERE freelancer_id = :fid')
+INSERT_REVIEW_SQL = text(
+    'INSERT INTO review (id, freelancer_id, rating, comment, created_at, updated_at) '
+    "VALUES (:id, :fid, :rating, :comment, datetime('now'), datetime('now'))"
+)
+UPDATE_PROFILE_SQL = text(
+    "UPDATE freelancer_profile SET hourly_rate = :rate, updated_at = datetime('now') WHERE freelancer_id = :fid"
+)
+
+
+def make_engine(path, tuned, pool_size):
+    engine = create_engine(f'sqlite:///{path}', pool_size=pool_size, max_overflow=0)
+    if tuned:
+        event.listen(engine, 'connect', apply_sqlite_pragmas)
+    return engine
+
+
+def seed(engine, n):
+    """프리랜서 n명 + 프로필 + 리뷰 (1인당 0~4개)"""
+    db.metadata.create_all(engine, tables=[
+        db.metadata.tables['freelancer'], db.metadata.tables['freelancer_profile'], db.metadata.tables['review']
+    ])
+    rng = random.Random(0)
+    ids = [str(uuid.uuid4()) for _ in range(n)]
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO freelancer (id, name, email, phone, created_at, updated_at) "
+            "VALUES (:id, :name, :email, '010', datetime('now'), datetime('now'))"
+        ), [{'id': fid, 'name': f'freelancer-{i}', 'email': f'{i}@example.com'} for i, fid in enumerate(ids)])
+        conn.execute(text(
+            "INSERT INTO freelancer_profile (id, freelancer_id, experience, hourly_rate, availability, created_at, updated_at) "
+            "VALUES (:id, :fid, :exp, :rate, 'available', datetime('now'), datetime('now'))"
+        ), [{'id': str(uuid.uuid4()), 'fid': fid, 'exp': rng.randint(0, 20), 'rate': rng.randint(20, 150) * 1000}
+            for fid in ids])
+        conn.execute(INSERT_REVIEW_SQL, [
+            {'id': str(uuid.uuid4()), 'fid': fid, 'rating': rng.choice([1.0, 3.0, 5.0]), 'comment': 'seed'}
+            for fid in ids for _ in range(rng.randint(0, 4))
+        ])
+    return ids
+
+
+def run_workload(engine, ids, readers, writers, duration):
+    """읽기 / 쓰기 스레드를 duration 초 동안 실행 → 종류별 (지연 목록 ms, 오류 수)"""
+    results = {'read': ([], [0]), 'write': ([], [0])}
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def reader(seed_value):
+        rng = random.Random(seed_value)
+        local, errors = [], 0
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            try:
+                with engine.connect() as conn:
+                    conn.execute(READ_SQL, {'offset': rng.randint(0, max(len(ids) - 20, 0))}).all()
+                    conn.execute(RATING_SQL, {'fid': rng.choice(ids)}).one()
+                local.append((time.perf_counter() - started) * 1000)
+            except OperationalError:
+                errors += 1  # database is locked
+        with lock:
+            results['read'][0].extend(local)
+            results['read'][1][0] += errors
+
+    def writer(seed_value):
+        rng = random.Random(seed_value)
+        local, errors = [], 0
+        while time.monotonic() < stop_at:
+            fid = rng.choice(ids)
+            started = time.perf_counter()
+            try:
+                with engine.begin() as conn:
+                    conn.execute(INSERT_REVIEW_SQL, {'id': str(uuid.uuid4()), 'fid': fid,
+                                                     'rating': rng.choice([1.0, 3.0, 5.0]), 'comment': 'bench'})
+                    conn.execute(UPDATE_PROFILE_SQL, {'fid': fid, 'rate': rng.randint(20, 150) * 1000})
+                local.append((time.perf_counter() - started) * 1000)
+            except OperationalError:
+                errors += 1
+        with lock:
+            results['write'][0].extend(local)
+            results['write'][1][0] += errors
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads += [threading.Thread(target=writer, args=(1000 + i,)) for i in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def summarize(latencies, errors, duration):
+    timings = np.array(latencies) if latencies else np.zeros(1)
+    return {
+        'ops': len(latencies),
+        'ops_per_sec': round(len(latencies) / duration, 1),
+        'p50_ms': round(float(np.percentile(timings, 50)), 2),
+        'p95_ms': round(float(np.percentile(timings, 95)), 2),
+        'max_ms': round(float(timings.max()), 2),
+        'locked_errors': errors,
+    }
+
+
+def run(args):
+    print(f'🗄️  SQLite 동시성 벤치마크: 프리랜서 {args.freelancers}명 | 읽기 {args.readers} / 쓰기 {args.writers} 스레드 '
+          f'| {args.duration}초')
+    print(f'   프로필: {", ".join(f"{k}={v}" for k, v in SQLITE_PRAGMAS.items())}\n')
+
+    report = {'freelancers': args.freelancers, 'readers': args.readers, 'writers': args.writers,
+              'duration': args.duration, 'profiles': {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, tuned in (('default', False), ('tuned', True)):
+            path = os.path.join(tmp, f'{name}.db')
+            engine = make_engine(path, tuned, args.readers + args.writers)
+            ids = seed(engine, args.freelancers)
+            results = run_workload(engine, ids, args.readers, args.writers, args.duration)
+            engine.dispose()
+
+            report['profiles'][name] = {kind: summarize(lat, err[0], args.duration) for kind, (lat, err) in results.items()}
+            for kind, stats in report['profiles'][name].items():
+                print(f'  {name:<8} {kind:<6} {stats["ops_per_sec"]:>8.1f} ops/s | p50 {stats["p50_ms"]:7.2f}ms '
+                      f'| p95 {stats["p95_ms"]:8.2f}ms | max {stats["max_ms"]:8.2f}ms | locked {stats["locked_errors"]}')
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'\n💾 {args.json} 저장')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='SQLite PRAGMA 프로필 적용 전후 동시 읽기/쓰기 비교')
+    parser.add_argument('--freelancers', type=int, default=5000, help='시드 프리랜서 수')
+    parser.add_argument('--readers', type=int, default=8, help='읽기 스레드 수')
+    parser.add_argument('--writers', type=int, default=2, help='쓰기 스레드 수')
+    parser.add_argument('--duration', type=float, default=10, help='프로필별 측정 시간 (초)')
+    parser.add_argument('--json', help='결과를 JSON 파일로 저장')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
@@ -0,0 +1,349 @@
+"""
+라우트별 쿼리 예산 검사 (N+1 회귀 검출)
+- 테스트 설정(메모리 SQLite, QUERY_BUDGET_STRICT)으로 앱을 띄우고 관계마다 자식이 여러 개인 데이터셋을 채운 뒤
+  freelancer_routes / interview_routes 의 모든 라우트를 한 번씩 호출
+- 각 라우트의 @query_budget 과 실제 쿼리 수(Server-Timing)를 비교 → 초과 / 예산 미선언 / 호출 누락 / 예상 밖 상태 코드면 실패
+- 예산은 데이터 양과 무관한 상수이므로 --children 을 늘려도 통과해야 함 (늘렸을 때만 실패하면 N+1)
+
+사용 예:
+    python check_query_budgets.py
+    python check_query_budgets.py --freelancers 50 --children 8 --verbose
+"""
+import io
+import os
+import re
+import sys
+import uuid
+import random
+import hashlib
+import argparse
+import tempfile
+from datetime import datetime
+
+os.environ['FLASK_ENV'] = 'testing'  # config 로드 전에 설정 (메모리 DB, 엄격한 쿼리 예산)
+os.environ.setdefault('REQUEST_LOG', 'false')
+os.environ.setdefault('SLOW_QUERY_MS', '0')
+
+CHECKED_BLUEPRINTS = ('freelancer', 'interview')
+QUERY_COUNT_PATTERN = re.compile(r'desc="(\d+) queries"')
+
+SAMPLE_RESUME = (
+    '홍길동 이력서\n경력: 백엔드 개발 7년\n기술: Python, Django, Flask, PostgreSQL, Docker, Kubernetes\n'
+    '프로젝트: 결제 시스템 구축, 추천 서비스 API 개발\n'
+).encode('utf-8') * 20
+# 분할 업로드는 다른 내용 → 추출 캐시 미스 경로(추출 + 캐시 저장 + 색인)를 검사
+# 파일명은 한글 (secure_filename 이 이름을 모두 지워도 확장자 검사 / 저장이 되는지)
+SAMPLE_CHUNKED = SAMPLE_RESUME + '추가 경력: 데이터 파이프라인 구축 (Airflow, Spark)\n'.encode('utf-8')
+
+
+def seed(db, freelancers, children):
+    """관계마다 자식이 children 개인 데이터셋 → 라우트 호출에 쓸 id 모음"""
+    from app.models import (
+        Skill, Freelancer, FreelancerProfile, PortfolioItem, Review,
+        InterviewCategory, InterviewQuestion, InterviewCheckpoint, InterviewRedFlag,
+        InterviewEvaluation, InterviewCategoryScore, InterviewEvaluationResult, InterviewRedFlagFinding
+    )
+
+    rng = random.Random(0)
+    new_id = lambda: str(uuid.uuid4())  # noqa: E731
+
+    skills = [Skill(id=f'skill-{i}', name=f'Skill {i}', category='backend') for i in range(children * 2)]
+    categories = [InterviewCategory(id=new_id(), name=f'카테고리 {i}', order=i) for i in range(children)]
+    db.session.add_all(skills + categories)
+
+    checkpoints, red_flags = [], []
+    for category in categories:
+        for i in range(children):
+            db.session.add(InterviewQuestion(id=new_id(), category_id=category.id, question_text=f'질문 {i}', order=i))
+            checkpoints.append(InterviewCheckpoint(id=new_id(), category_id=category.id,
+                                                   checkpoint_text=f'체크포인트 {i}', order=i))
+            red_flags.append(InterviewRedFlag(id=new_id(), category_id=category.id, flag_text=f'레드플래그 {i}', order=i))
+    db.session.add_all(checkpoints + red_flags)
+
+    freelancer_ids, evaluation_ids = [], []
+    for n in range(freelancers):
+        freelancer = Freelancer(id=new_id(), name=f'프리랜서 {n}', email=f'freelancer{n}@example.com', phone='010-0000-0000')
+        freelancer.profile = FreelancerProfile(id=new_id(), experience=rng.randint(0, 15),
+                                               hourly_rate=rng.randint(30, 120) * 1000, availability='available')
+        freelancer.skills = rng.sample(skills, children)
+        freelancer.portfolio_items = [
+            PortfolioItem(id=new_id(), title=f'포트폴리오 {i}', technologies=['Python']) for i in range(children)
+        ]
+        freelancer.reviews = [Review(id=new_id(), rating=rng.choice([3.0, 4.0, 5.0])) for _ in range(children)]
+        db.session.add(freelancer)
+        freelancer_ids.append(freelancer.id)
+
+        for _ in range(2):
+            evaluation = InterviewEvaluation(id=new_id(), freelancer_id=freelancer.id, interviewer_name='면접관',
+                                             evaluated_at=datetime.utcnow())
+            evaluation.category_scores = [
+                InterviewCategoryScore(id=new_id(), category_id=category.id, score=3.0, score_label='중(3)')
+                for category in categories
+            ]
+            evaluation.results = [
+                InterviewEvaluationResult(id=new_id(), checkpoint_id=checkpoint.id, is_checked=True)
+                for checkpoint in checkpoints[:children]
+            ]
+            evaluation.red_flag_findings = [
+                InterviewRedFlagFinding(id=new_id(), red_flag_id=red_flag.id, is_found=False)
+                for red_flag in red_flags[:children]
+            ]
+            db.session.add(evaluation)
+            evaluation_ids.append(evaluation.id)
+
+    db.session.commit()
+
+    from app.services.analytics_service import InterviewAnalyticsService
+    InterviewAnalyticsService.rebuild()
+
+    return {
+        'freelancer': freelancer_ids[0],
+        'freelancer_other': freelancer_ids[1],
+        'skills': [skill.id for skill in skills[:children]],
+        'category': categories[0].id,
+        'category_spare': categories[-1].id,
+        'checkpoint': checkpoints[0].id,
+        'checkpoint_spare': checkpoints[-1].id,
+        'red_flag': red_flags[0].id,
+        'red_flag_spare': red_flags[-1].id,
+        'evaluation': evaluation_ids[0],
+    }
+
+
+def bump_extractor_version(app):
+    """추출기 버전 올리기 - 기존 추출 캐시가 모두 미스가 됨"""
+    from app.services.file_service import FileService
+    FileService.EXTRACTOR_VERSION += 1
+
+
+def touch_freelancers(app):
+    """모든 프리랜서 수정 + 스냅샷 무효화 - 다음 목록 요청이 변경분 반영(프리랜서 수만큼 조회)을 기다림
+    반영 쿼리는 백그라운드 갱신에서 실행되므로 목록 요청의 쿼리 수는 프리랜서 수와 무관해야 함"""
+    from app.db import db
+    from app.models import Freelancer
+    from app.services.freelancer_snapshot import FreelancerSnapshotService
+
+    with app.app_context():
+        freelancer_ids = [freelancer_id for (freelancer_id,) in db.session.query(Freelancer.id)]
+        db.session.query(Freelancer).update({Freelancer.name: Freelancer.name + ' (수정)',
+                                             Freelancer.updated_at: datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+        FreelancerSnapshotService.invalidate(freelancer_ids)
+        db.session.remove()
+
+
+def build_cases(ids):
+    """(엔드포인트, 메서드, 경로, 요청 옵션, 예상 상태) - 뒤 요청이 앞 요청이 만든 id 를 쓰도록 순서대로 실행
+    경로의 {name} 은 ids (시드 + 실행 중 생성된 id) 로 채움, 함수는 다음 요청 전에 실행할 준비 단계 (app 인자)"""
+    sha256 = hashlib.sha256(SAMPLE_CHUNKED).hexdigest()
+    resume = lambda name: {'data': {'file': (io.BytesIO(SAMPLE_RESUME), name), 'documentType': 'resume'},  # noqa: E731
+                           'content_type': 'multipart/form-data'}
+    new_freelancer = {'name': '새 프리랜서', 'email': 'new@example.com', 'phone': '010-1111-2222', 'experience': 3,
+                      'hourlyRate': 50000, 'availability': 'available', 'skillIds': ids['skills']}
+
+    return [
+        # ---------- 프리랜서 ----------
+        ('freelancer.list_freelancers', 'GET', '/api/freelancers?limit=20', {}, 200),
+        ('freelancer.list_freelancers', 'GET', '/api/freelancers?limit=20&search=프리랜서', {}, 200),
+        touch_freelancers,  # 스냅샷 변경분 반영 직후
+        ('freelancer.list_freelancers', 'GET', '/api/freelancers?limit=20&sortBy=name', {}, 200),
+        ('freelancer.get_freelancer', 'GET', '/api/freelancers/{freelancer}', {}, 200),
+        ('freelancer.create_freelancer', 'POST', '/api/freelancers', {'json': new_freelancer}, 201),
+        ('freelancer.update_freelancer', 'PUT', '/api/freelancers/{created_freelancer}',
+         {'json': {'name': '수정된 프리랜서', 'skillIds': ids['skills'][::-1]}}, 200),
+        ('freelancer.match_freelancers', 'POST', '/api/freelancers/match',
+         {'json': {'requiredSkills': ids['skills'][:1], 'niceToHaveSkills': ids['skills'][1:], 'limit': 10}}, 200),
+        ('freelancer.get_skills', 'GET', '/api/freelancers/skills', {}, 200),
+        ('freelancer.health', 'GET', '/api/freelancers/health', {}, 200),
+
+        # ---------- 문서 ----------
+        ('freelancer.upload_document', 'POST', '/api/freelancers/{freelancer}/documents', resume('resume.txt'), 201),
+        ('freelancer.init_chunked_upload', 'POST', '/api/freelancers/{freelancer}/documents/uploads',
+         {'json': {'filename': '이력서.txt', 'fileSize': len(SAMPLE_CHUNKED), 'documentType': 'resume',
+                   'sha256': sha256}}, 201),
+        ('freelancer.put_upload_chunk', 'PUT', '/api/freelancers/documents/uploads/{upload}/chunks/0',
+         {'data': SAMPLE_CHUNKED}, 200),
+        ('freelancer.get_upload_status', 'GET', '/api/freelancers/documents/uploads/{upload}', {}, 200),
+        ('freelancer.complete_chunked_upload', 'POST', '/api/freelancers/documents/uploads/{upload}/complete',
+         {'json': {'sha256': sha256}}, 201),
+        ('freelancer.init_chunked_upload', 'POST', '/api/freelancers/{freelancer}/documents/uploads',
+         {'json': {'filename': 'aborted.txt', 'fileSize': 10, 'documentType': 'other'}}, 201),
+        ('freelancer.abort_chunked_upload', 'DELETE', '/api/freelancers/documents/uploads/{upload}', {}, 200),
+        ('freelancer.get_documents', 'GET', '/api/freelancers/{freelancer}/documents', {}, 200),
+        ('freelancer.search_documents', 'GET', '/api/freelancers/documents/search?q=Python', {}, 200),
+        ('freelancer.get_document', 'GET', '/api/freelancers/documents/{document}', {}, 200),
+        ('freelancer.get_document_content', 'GET', '/api/freelancers/documents/{document}/content', {}, 200),
+        ('freelancer.re_analyze_document', 'POST', '/api/freelancers/documents/{document}/re-analyze', {}, 200),
+        bump_extractor_version,  # 추출기 버전이 바뀐 직후 → 캐시 미스로 다시 추출
+        ('freelancer.re_analyze_document', 'POST', '/api/freelancers/documents/{document}/re-analyze', {}, 200),
+        ('freelancer.delete_document', 'DELETE', '/api/freelancers/documents/{document}', {}, 204),
+
+        # ---------- 면접 마스터 데이터 ----------
+        ('interview.get_categories', 'GET', '/api/interviews/categories', {}, 200),
+        ('interview.get_category', 'GET', '/api/interviews/categories/{category}', {}, 200),
+        ('interview.create_category', 'POST', '/api/interviews/categories', {'json': {'name': '새 카테고리'}}, 201),
+        ('interview.update_category', 'PUT', '/api/interviews/categories/{created_category}',
+         {'json': {'description': '설명'}}, 200),
+        ('interview.get_questions', 'GET', '/api/interviews/categories/{category}/questions', {}, 200),
+        ('interview.create_question', 'POST', '/api/interviews/questions',
+         {'json': {'categoryId': '{created_category}', 'questionText': '새 질문'}}, 201),
+        ('interview.update_question', 'PUT', '/api/interviews/questions/{created_question}',
+         {'json': {'questionText': '수정된 질문'}}, 200),
+        ('interview.delete_question', 'DELETE', '/api/interviews/questions/{created_question}', {}, 204),
+        ('interview.get_checkpoints', 'GET', '/api/interviews/categories/{category}/checkpoints', {}, 200),
+        ('interview.create_checkpoint', 'POST', '/api/interviews/checkpoints',
+         {'json': {'categoryId': '{created_category}', 'checkpointText': '새 체크포인트'}}, 201),
+        ('interview.update_checkpoint', 'PUT', '/api/interviews/checkpoints/{created_checkpoint}',
+         {'json': {'checkpointText': '수정된 체크포인트'}}, 200),
+        ('interview.delete_checkpoint', 'DELETE', '/api/interviews/checkpoints/{created_checkpoint}', {}, 204),
+        ('interview.get_red_flags', 'GET', '/api/interviews/categories/{category}/red-flags', {}, 200),
+        ('interview.create_red_flag', 'POST', '/api/interviews/red-flags',
+         {'json': {'categoryId': '{created_category}', 'flagText': '새 레드플래그'}}, 201),
+        ('interview.update_red_flag', 'PUT', '/api/interviews/red-flags/{created_red_flag}',
+         {'json': {'severity': 'high'}}, 200),
+        ('interview.delete_red_flag', 'DELETE', '/api/interviews/red-flags/{created_red_flag}', {}, 204),
+        ('interview.delete_category', 'DELETE', '/api/interviews/categories/{created_category}', {}, 204),
+
+        # ---------- 면접 평가 ----------
+        ('interview.get_evaluations', 'GET', '/api/interviews/evaluations?limit=20', {}, 200),
+        ('interview.get_evaluation', 'GET', '/api/interviews/evaluations/{evaluation}', {}, 200),
+        ('interview.create_evaluation', 'POST', '/api/interviews/evaluations',
+         {'json': {'freelancerId': '{freelancer_other}', 'interviewerName': '면접관'}}, 201),
+        ('interview.update_evaluation', 'PUT', '/api/interviews/evaluations/{created_evaluation}',
+         {'json': {'projectName': '프로젝트'}}, 200),
+        ('interview.add_category_score', 'POST', '/api/interviews/evaluations/{created_evaluation}/category-scores',
+         {'json': {'categoryId': '{category}', 'score': 5, 'scoreLabel': '상(5)', 'checkedCount': 2}}, 201),
+        ('interview.update_category_score', 'PUT',
+         '/api/interviews/evaluations/{created_evaluation}/category-scores/{category}',
+         {'json': {'score': 3, 'scoreLabel': '중(3)', 'checkedCount': 1}}, 200),
+        ('interview.add_checkpoint_result', 'POST',
+         '/api/interviews/evaluations/{created_evaluation}/checkpoint-results',
+         {'json': {'checkpointId': '{checkpoint}', 'isChecked': True}}, 201),
+        ('interview.update_checkpoint_result', 'PUT',
+         '/api/interviews/evaluations/{created_evaluation}/checkpoint-results/{checkpoint}',
+         {'json': {'isChecked': False, 'notes': '메모'}}, 200),
+        ('interview.add_red_flag_finding', 'POST',
+         '/api/interviews/evaluations/{created_evaluation}/red-flag-findings',
+         {'json': {'redFlagId': '{red_flag}', 'isFound': True, 'severityActual': 'high'}}, 201),
+        ('interview.update_red_flag_finding', 'PUT',
+         '/api/interviews/evaluations/{created_evaluation}/red-flag-findings/{red_flag}',
+         {'json': {'isFound': False}}, 200),
+        ('interview.calculate_total_score', 'POST',
+         '/api/interviews/evaluations/{created_evaluation}/calculate-score', {}, 200),
+        ('interview.set_recommendation', 'POST', '/api/interviews/evaluations/{created_evaluation}/set-recommendation',
+         {'json': {'recommendation': 'recommend'}}, 200),
+        ('interview.get_category_score_analytics', 'GET', '/api/interviews/analytics/category-scores', {}, 200),
+        ('interview.get_red_flag_analytics', 'GET', '/api/interviews/analytics/red-flags', {}, 200),
+        ('interview.rebuild_analytics', 'POST', '/api/interviews/analytics/rebuild', {}, 200),
+        ('interview.delete_evaluation', 'DELETE', '/api/interviews/evaluations/{created_evaluation}', {}, 204),
+
+        # 평가 / 점수 / 문서가 있는 프리랜서 (CASCADE 삭제 + 집계 차감)
+        ('freelancer.delete_freelancer', 'DELETE', '/api/freelancers/{freelancer_other}', {}, 200),
+    ]
+
+
+# 생성 응답에서 다음 요청이 쓸 id (엔드포인트 → ids 키, 응답 data 의 키)
+CREATED_IDS = {
+    'freelancer.create_freelancer': ('created_freelancer', 'id'),
+    'freelancer.upload_document': ('document', 'id'),
+    'freelancer.init_chunked_upload': ('upload', 'uploadId'),
+    'interview.create_category': ('created_category', 'id'),
+    'interview.create_question': ('created_question', 'id'),
+    'interview.create_checkpoint': ('created_checkpoint', 'id'),
+    'interview.create_red_flag': ('created_red_flag', 'id'),
+    'interview.create_evaluation': ('created_evaluation', 'id'),
+}
+
+
+def fill(value, ids):
+    """요청 옵션 안의 '{name}' 을 id 로 치환"""
+    if isinstance(value, str):
+        return value.format(**ids) if '{' in value else value
+    if isinstance(value, dict):
+        return {k: fill(v, ids) for k, v in value.items()}
+    if isinstance(value, list):
+        return [fill(v, ids) for v in value]
+    return value
+
+
+def run(args):
+    from app import create_app
+    from app.db import db
+    from app.instrumentation import QueryBudgetExceeded
+
+    upload_root = tempfile.mkdtemp(prefix='query-budget-')
+    os.environ['UPLOAD_FOLDER'] = upload_root
+    app = create_app()
+    app.config['UPLOAD_FOLDER'] = upload_root
+    client = app.test_client()
+
+    with app.app_context():
+        ids = seed(db, args.freelancers, args.children)
+        db.session.remove()
+
+    print(f'🧮 쿼리 예산 검사: 프리랜서 {args.freelancers}명, 관계당 자식 {args.children}개\n')
+    failures, called, unbudgeted = [], set(), set()
+    for case in build_cases(ids):
+        if callable(case):
+            case(app)
+            continue
+        endpoint, method, path, options, expected = case
+        view = app.view_functions[endpoint]
+        budget = getattr(view, 'query_budget', None)
+        called.add(endpoint)
+
+        try:
+            response = client.open(fill(path, ids), method=method, **fill(options, ids))
+        except QueryBudgetExceeded as e:
+            failures.append(str(e))
+            print(f'  ❌ {method:<6} {endpoint:<45} {e.used:>3} / {e.budget:<3} 예산 초과')
+            if args.verbose:
+                print('     ' + str(e).replace('\n', '\n     '))
+            continue
+
+        match = QUERY_COUNT_PATTERN.search(response.headers.get('Server-Timing', ''))
+        used = int(match.group(1)) if match else None
+        problems = []
+        if response.status_code != expected:
+            problems.append(f'상태 {response.status_code} (예상 {expected}): {(response.get_json(silent=True) or {}).get("message")}')
+        if budget is None and endpoint not in unbudgeted:
+            unbudgeted.add(endpoint)
+            problems.append('@query_budget 미선언')
+
+        if endpoint in CREATED_IDS and response.status_code == expected:
+            key, field = CREATED_IDS[endpoint]
+            ids[key] = response.get_json()['data'][field]
+
+        mark = '❌' if problems else '✅'
+        print(f'  {mark} {method:<6} {endpoint:<45} {used if used is not None else "?":>3} / '
+              f'{budget if budget is not None else "-":<3} {"; ".join(problems)}')
+        failures.extend(f'{endpoint}: {problem}' for problem in problems)
+
+    missing = sorted(
+        endpoint for endpoint in app.view_functions
+        if endpoint.split('.')[0] in CHECKED_BLUEPRINTS and endpoint not in called
+    )
+    for endpoint in missing:
+        failures.append(f'{endpoint}: 검사 대상 요청 없음 (build_cases 에 추가하세요)')
+
+    print('\n' + '=' * 60)
+    if failures:
+        print(f'❌ 실패 {len(failures)}건')
+        for failure in failures:
+            print(f'   - {failure}')
+    else:
+        print('✨ 모든 라우트가 쿼리 예산 이내')
+    print('=' * 60)
+    return 1 if failures else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='라우트별 @query_budget 검사 (N+1 회귀 검출)')
+    parser.add_argument('--freelancers', type=int, default=20, help='시드 프리랜서 수')
+    parser.add_argument('--children', type=int, default=3, help='관계당 자식 수 (스킬 / 리뷰 / 점수 등)')
+    parser.add_argument('--verbose', action='store_true', help='예산 초과 시 반복된 문장 출력')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(run(parse_args()))
@@ -0,0 +1,144 @@
+"""
+쓰기 큐 group commit 검사 (SQLite)
+- 임시 파일 SQLite DB 로 앱을 띄우고 WriteQueue 에 여러 작업을 한 묶음으로 넣음
+- 각 작업 안에서 별도 sqlite3 연결로 같은 묶음의 앞선 작업 행이 보이는지 확인 → COMMIT 전에 보이면 실패
+  (SAVEPOINT 가 바깥 트랜잭션 없이 열리면 RELEASE 시점에 작업마다 따로 커밋됨)
+- 묶음 안에서 실패한 작업은 그 작업의 행만 롤백되고 나머지는 한 번의 COMMIT 으로 반영되는지 확인
+- SAVEPOINT 만 쓰는 일반 세션 경로(추출 캐시 저장 등)도 바깥 롤백에 함께 롤백되는지 확인
+
+사용 예:
+    python check_write_queue.py
+    python check_write_queue.py --jobs 8
+"""
+import os
+import sys
+import uuid
+import sqlite3
+import argparse
+import tempfile
+import threading
+
+os.environ.setdefault('REQUEST_LOG', 'false')
+
+
+class JobFailed(Exception):
+    """묶음 안에서 일부러 실패시키는 작업"""
+
+
+def count_visible(path, names):
+    """다른 연결에서 보이는(커밋된) 스킬 행 수"""
+    conn = sqlite3.connect(path, timeout=5)
+    try:
+        marks = ','.join('?' * len(names))
+        return conn.execute(f'SELECT COUNT(*) FROM skill WHERE name IN ({marks})', names).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def check_group_commit(app, path, jobs):
+    """jobs 개 작업 중 마지막 작업은 실패 → 나머지는 묶음 COMMIT 전까지 다른 연결에서 보이지 않아야 함"""
+    from app.db import db
+    from app.models import Skill
+    from app.write_queue import WriteQueue
+
+    queue = WriteQueue()
+    queue.init_app(app, enabled=True)
+    queue.WINDOW_MS = 500  # 모든 작업이 한 묶음에 들어가도록
+
+    names = [f'group-commit-{i}-{uuid.uuid4().hex[:8]}' for i in range(jobs)]
+    seen_before_commit = []
+    results = {}
+
+    def job(index):
+        db.session.add(Skill(id=str(uuid.uuid4()), name=names[index], category='check'))
+        db.session.commit()  # writer 안에서는 flush
+        seen_before_commit.append(count_visible(path, names))
+        if index == jobs - 1:
+            raise JobFailed(names[index])
+        return index
+
+    def submit(index):
+        try:
+            results[index] = queue.submit(job, index)
+        except JobFailed as e:
+            results[index] = e
+
+    threads = [threading.Thread(target=submit, args=(i,)) for i in range(jobs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    failures = []
+    stats = queue.stats()
+    if stats['batches'] != 1:
+        failures.append(f'작업이 한 묶음으로 처리되지 않음 (묶음 {stats["batches"]}개)')
+    if any(seen_before_commit):
+        failures.append(f'COMMIT 전에 다른 연결에서 행이 보임: {seen_before_commit}')
+    if not isinstance(results.get(jobs - 1), JobFailed):
+        failures.append(f'실패한 작업의 결과가 예외가 아님: {results.get(jobs - 1)!r}')
+    if [results.get(i) for i in range(jobs - 1)] != list(range(jobs - 1)):
+        failures.append(f'성공한 작업 결과 불일치: {results}')
+    visible = count_visible(path, names)
+    if visible != jobs - 1:
+        failures.append(f'COMMIT 후 보이는 행 {visible}개 (예상 {jobs - 1}개)')
+    if count_visible(path, names[-1:]):
+        failures.append('실패한 작업의 행이 커밋됨')
+    return failures
+
+
+def check_nested_rollback(app, path):
+    """바깥 트랜잭션 안의 SAVEPOINT → RELEASE 후에도 바깥 ROLLBACK 이면 사라져야 함"""
+    from app.db import db
+    from app.models import Skill
+
+    name = f'savepoint-{uuid.uuid4().hex[:8]}'
+    failures = []
+    with app.app_context():
+        try:
+            with db.session.begin_nested():
+                db.session.add(Skill(id=str(uuid.uuid4()), name=name, category='check'))
+            if count_visible(path, [name]):
+                failures.append('RELEASE SAVEPOINT 시점에 행이 커밋됨')
+            db.session.rollback()
+            if count_visible(path, [name]):
+                failures.append('바깥 ROLLBACK 후에도 SAVEPOINT 안의 행이 남음')
+        finally:
+            db.session.remove()
+    return failures
+
+
+def run(args):
+    from flask import Flask
+    from app.db import init_db
+
+    path = os.path.join(tempfile.mkdtemp(prefix='write-queue-'), 'check.db')
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{path}'
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    init_db(app)
+
+    print(f'🧮 쓰기 큐 group commit 검사: 작업 {args.jobs}개 (마지막 작업은 실패)\n')
+    failures = []
+    for name, check in (('group commit', lambda: check_group_commit(app, path, args.jobs)),
+                        ('SAVEPOINT 롤백', lambda: check_nested_rollback(app, path))):
+        problems = check()
+        print(f'  {"❌" if problems else "✅"} {name:<16} {"; ".join(problems)}')
+        failures.extend(problems)
+
+    print('\n' + '=' * 60)
+    if failures:
+        print(f'❌ 실패 {len(failures)}건')
+        return 1
+    print('✅ 모든 검사 통과')
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='SQLite 쓰기 큐 group commit 검사')
+    parser.add_argument('--jobs', type=int, default=4, help='한 묶음에 넣을 작업 수 (2 이상)')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    sys.exit(run(parse_args()))
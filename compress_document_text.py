@@ -0,0 +1,121 @@
+"""
+문서 텍스트 압축 마이그레이션 스크립트
+- freelancer_document.extracted_text, document_extraction_cache.extracted_text 의
+  압축 도입 전 평문 값을 압축 형식으로 다시 저장
+- 압축 헤더가 있는 행은 건너뜀 (여러 번 실행해도 안전, 중단 후 재실행하면 남은 행만 처리)
+- MySQL 은 먼저 sqldata/migrations.sql 의 LONGBLOB 변경을 적용한 뒤 실행
+
+사용 예:
+    python compress_document_text.py --dry-run     # 대상 행 수 / 예상 절감량만 출력
+    python compress_document_text.py --batch-size 500
+"""
+import time
+import argparse
+
+from sqlalchemy import bindparam, text
+
+# (테이블, 압축 컬럼 목록)
+TARGETS = [
+    ('freelancer_document', ['extracted_text']),
+    ('document_extraction_cache', ['extracted_text']),
+]
+
+
+def raw_size(value) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    return len(value)
+
+
+def compress_table(table_name, columns, batch_size, dry_run):
+    """테이블 하나를 id 순 배치로 훑으며 평문 값을 압축 형식으로 교체 → (변환 행 수, 변환 전 바이트, 변환 후 바이트)"""
+    from app.db import db, is_compressed
+
+    table = db.metadata.tables[table_name]
+    dialect = db.engine.dialect
+    select_sql = text(
+        f'SELECT id, {", ".join(columns)} FROM {table_name} '
+        f'WHERE id > :last_id ORDER BY id LIMIT :limit'
+    )
+
+    scanned = converted = before = after = 0
+    last_id = ''
+    while True:
+        rows = db.session.execute(select_sql, {'last_id': last_id, 'limit': batch_size}).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        scanned += len(rows)
+
+        params = []
+        for row in rows:
+            raws = dict(zip(columns, row[1:]))
+            legacy = [c for c, raw in raws.items() if raw is not None and not is_compressed(raw)]
+            if not legacy:
+                continue
+
+            param = {'_id': row[0]}
+            for column in columns:
+                column_type = table.c[column].type
+                value = column_type.process_result_value(raws[column], dialect)
+                param[column] = value
+                if column in legacy:
+                    before += raw_size(raws[column])
+                    after += raw_size(column_type.process_bind_param(value, dialect))
+            params.append(param)
+
+        converted += len(params)
+        if params and not dry_run:
+            statement = db.update(table).where(table.c.id == bindparam('_id')).values({
+                column: bindparam(column, type_=table.c[column].type) for column in columns
+            })
+            db.session.execute(statement, params)
+            db.session.commit()
+        else:
+            db.session.rollback()
+
+        print(f'  {table_name}: {scanned}행 확인, {converted}행 변환')
+
+    return converted, before, after
+
+
+def run(args):
+    from app import create_app
+    from app.db import db
+
+    app = create_app()
+    with app.app_context():
+        db.engine.echo = False
+        started = time.perf_counter()
+        mode = ' (dry-run: 저장하지 않음)' if args.dry_run else ''
+        print(f'🗜️  추출 텍스트 압축 시작{mode}\n')
+
+        total_rows = total_before = total_after = 0
+        for table_name, columns in TARGETS:
+            rows, before, after = compress_table(table_name, columns, args.batch_size, args.dry_run)
+            total_rows += rows
+            total_before += before
+            total_after += after
+
+        wall = time.perf_counter() - started
+        print('\n' + '=' * 60)
+        print(f'✨ 압축 완료: {total_rows}행 / {wall:.1f}초{mode}')
+        if total_before:
+            print(f'   {total_before / 1024 / 1024:.2f}MB → {total_after / 1024 / 1024:.2f}MB '
+                  f'({total_after / total_before * 100:.1f}%)')
+        if db.engine.dialect.name == 'sqlite' and total_rows and not args.dry_run:
+            print('   💡 파일 크기를 줄이려면 VACUUM 을 실행하세요')
+        print('=' * 60)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='문서 추출 텍스트 압축 마이그레이션')
+    parser.add_argument('--batch-size', type=int, default=200, help='배치당 행 수 (UPDATE/커밋 단위)')
+    parser.add_argument('--dry-run', action='store_true', help='저장하지 않고 대상과 절감량만 집계')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
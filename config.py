@@ -23,7 +23,34 @@ class Config:
         SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_name}.db'
 
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    SQLALCHEMY_ECHO = True  # SQL 로그 출력
+
+    # 커넥션 풀 (gunicorn 워커마다 별도 풀 → 워커 수 × (pool_size + max_overflow) 가 DB 최대 연결 수 이내여야 함)
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': int(os.getenv('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),  # 풀이 가득 찼을 때 대기 시간 (초)
+        # MySQL wait_timeout(기본 8시간)보다 짧게 - 서버가 끊은 연결을 재사용하지 않도록
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 1800)),
+        # 대여 시 연결 확인 (끊긴 연결이면 새로 연결) - SQLite 는 불필요
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', 'true' if db_type == 'mysql' else 'false').lower() == 'true',
+    }
+
+    # 읽기 복제본 (쉼표로 구분한 DB URL) - 설정하면 GET 요청의 조회를 복제본으로 분산
+    # 예: DB_REPLICA_URLS=mysql+pymysql://user:pw@replica1:3306/db,mysql+pymysql://user:pw@replica2:3306/db
+    DB_REPLICA_URLS = [url.strip() for url in os.getenv('DB_REPLICA_URLS', '').split(',') if url.strip()]
+    SQLALCHEMY_BINDS = {f'replica_{i}': url for i, url in enumerate(DB_REPLICA_URLS)}
+    # 쓰기 요청 후 이 시간(초) 동안 같은 클라이언트의 조회는 primary 로 (복제 지연보다 길게)
+    DB_REPLICA_STICKY_SECONDS = float(os.getenv('DB_REPLICA_STICKY_SECONDS', 5))
+
+    # 쿼리 로그 / 계측 (app/instrumentation.py)
+    SQLALCHEMY_ECHO = os.getenv('SQLALCHEMY_ECHO', 'false').lower() == 'true'  # 모든 SQL 출력 (디버깅용, 느림)
+    QUERY_STATS = os.getenv('QUERY_STATS', 'true').lower() == 'true'  # 요청별 쿼리 수 / DB 시간 → Server-Timing 헤더
+    REQUEST_LOG = os.getenv('REQUEST_LOG', 'true').lower() == 'true'  # 요청별 JSON 로그 한 줄 (app.requests)
+    SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', 200))  # 이보다 느린 문장은 app.slow_query 로 기록 (0이면 끔)
+    SLOW_QUERY_LOG_PARAMS = os.getenv('SLOW_QUERY_LOG_PARAMS', 'true').lower() == 'true'  # 느린 쿼리 파라미터 포함 여부
+    # @query_budget 초과 시 요청 실패 (기본은 경고 로그만) - 테스트 / check_query_budgets.py 용
+    QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', 'false').lower() == 'true'
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'  # /metrics (Prometheus, app/metrics.py)
 
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
@@ -38,6 +65,11 @@ class Config:
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB
     ALLOWED_EXTENSIONS = {'txt', 'pdf', 'docx', 'xlsx', 'md'}
 
+    # File Download
+    # nginx 등 앞단 서버가 X-Sendfile / X-Accel-Redirect 로 파일을 직접 전송하는 경우 true
+    USE_X_SENDFILE = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
+    DOCUMENT_CACHE_MAX_AGE = int(os.getenv('DOCUMENT_CACHE_MAX_AGE', 365 * 24 * 60 * 60))  # 내용이 바뀌지 않으므로 길게
+
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -55,6 +87,7 @@ class TestingConfig(Config):
     """Testing configuration"""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    QUERY_BUDGET_STRICT = True
 
 
 # Configuration 선택
@@ -0,0 +1,81 @@
+"""
+업로드 파일 정리 스크립트 (cron 등으로 주기 실행)
+- 삭제 표시 후 보존 기간이 지난 문서: 파일 삭제 + 레코드 영구 삭제
+- uploads/freelancer/* 중 어떤 문서도 참조하지 않는 파일 삭제
+- 만료된 분할 업로드 세션 삭제
+- 삭제 속도 제한 (초당 파일 수 / MB)
+
+사용 예:
+    python gc_uploads.py --dry-run              # 대상만 집계
+    python gc_uploads.py --grace-hours 72 --rate 10 --mb-per-sec 20
+    # crontab: 매일 새벽 4시
+    # 0 4 * * * cd /srv/supermanager && venv/bin/python gc_uploads.py --json /var/log/gc_uploads.json
+"""
+import sys
+import json
+import argparse
+
+from app.services.gc_service import UploadGCService
+
+
+def print_report(report):
+    mode = ' (dry-run: 삭제하지 않음)' if report['dryRun'] else ''
+    print('\n' + '=' * 60)
+    print(f'🧹 업로드 GC 결과{mode}')
+    print(f'   삭제 표시 문서 영구 삭제: {report["purgedRows"]}건')
+    print(f'   검사한 파일: {report["scannedFiles"]}개 (참조 {report["referencedFiles"]}개, '
+          f'최근 파일 보류 {report["skippedRecentFiles"]}개)')
+    print(f'   고아 파일: {report["orphanFiles"]}개, {report["orphanBytes"] / 1024 / 1024:.2f}MB')
+    print(f'   삭제한 파일: {report["deletedFiles"]}개, {report["deletedBytes"] / 1024 / 1024:.2f}MB')
+    print(f'   만료된 분할 업로드: {report["expiredUploadSessions"]}개')
+    if report['missingFiles']:
+        print(f'   ⚠️  이미 없는 파일: {report["missingFiles"]}개')
+    for path in report['orphanSamples']:
+        print(f'   - {path}')
+    for error in report['errors']:
+        print(f'   ❌ {error}')
+    print('=' * 60)
+
+
+def run(args):
+    from app import create_app
+    from app.db import db
+
+    app = create_app()
+    with app.app_context():
+        db.engine.echo = False
+        try:
+            report = UploadGCService.run(
+                upload_root=app.config['UPLOAD_FOLDER'],
+                grace_seconds=int(args.grace_hours * 3600),
+                batch_size=args.batch_size,
+                ops_per_sec=args.rate or None,
+                bytes_per_sec=args.mb_per_sec * 1024 * 1024 if args.mb_per_sec else None,
+                dry_run=args.dry_run,
+            )
+        except ValueError as e:
+            print(f'❌ {str(e)}')
+            sys.exit(1)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f'💾 {args.json} 저장')
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='업로드 디렉토리 고아 파일 정리')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 집계')
+    parser.add_argument('--grace-hours', type=float, default=24,
+                        help='삭제 표시 후 보존 기간 / 최근 파일 보호 기간 (시간)')
+    parser.add_argument('--batch-size', type=int, default=100, help='DB 대조 배치 크기 (문서 / 프리랜서 디렉토리)')
+    parser.add_argument('--rate', type=float, default=20, help='초당 최대 삭제 파일 수 (0 = 제한 없음)')
+    parser.add_argument('--mb-per-sec', type=float, default=0, help='초당 최대 삭제 용량 MB (0 = 제한 없음)')
+    parser.add_argument('--json', help='리포트를 JSON 파일로 저장')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
@@ -0,0 +1,84 @@
+"""
+Gunicorn 설정 (prefork 운영 서버)
+- 워커 수: CPU 수 기준 (GUNICORN_WORKERS 로 지정 가능)
+- preload_app: 마스터에서 앱(모델 / 매처 / 설정)을 한 번 로드한 뒤 fork → 워커 기동이 빠르고 메모리 공유
+- post_fork: 마스터에서 열린 DB 연결을 워커가 물려받지 않도록 엔진 풀을 비움
+- /metrics: 워커별 지표를 PROMETHEUS_MULTIPROC_DIR 파일에 기록해 합산 (시작 시 정리, 종료 워커 정리)
+
+사용 예:
+    gunicorn -c gunicorn.conf.py wsgi:app
+    kill -HUP <master pid>     # 설정 다시 읽고 워커 교체 (처리 중인 요청은 끝까지 처리)
+    kill -USR2 <master pid>    # 새 마스터로 코드까지 교체 (preload 사용 시 코드 반영은 USR2 또는 재시작)
+"""
+import os
+import glob
+import tempfile
+import multiprocessing
+
+# ==================== 바인딩 ====================
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', 8000)}"
+backlog = int(os.getenv('GUNICORN_BACKLOG', 2048))
+
+# ==================== 워커 ====================
+# 요청 처리 중 DB / 파일 I/O 대기가 많으므로 CPU 수 × 2 + 1 (gunicorn 권장값)
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.getenv('GUNICORN_THREADS', 4))  # gthread 워커당 스레드 수
+
+# 메모리 누수 / 단편화 대비 - 일정 요청 수마다 워커 교체 (동시에 재시작하지 않도록 지터)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 2000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 200))
+
+# ==================== 타임아웃 / Keep-Alive ====================
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 60))  # 문서 분석 등 긴 요청 고려
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))  # 재시작 시 처리 중 요청 대기
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))  # 앞단 프록시(nginx 등)와 연결 재사용 (초)
+
+# ==================== 앱 로딩 ====================
+preload_app = os.getenv('GUNICORN_PRELOAD', 'true').lower() == 'true'
+
+# ==================== 로그 ====================
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = os.getenv('GUNICORN_ERROR_LOG', '-')
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+proc_name = 'supermanager'
+
+# ==================== 지표 (Prometheus) ====================
+# 워커 여러 개의 지표를 합산하려면 앱(prometheus_client) import 전에 설정돼야 함 - 같은 머신의 다른 인스턴스와 겹치지 않도록 포트별
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(
+    tempfile.gettempdir(), f"supermanager-metrics-{os.getenv('API_PORT', 8000)}"))
+os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+
+def on_starting(server):
+    """마스터 시작 시 1회 - 이전 실행이 남긴 워커 지표 파일 정리 (HUP 재시작에서는 호출되지 않음)"""
+    for path in glob.glob(os.path.join(os.environ['PROMETHEUS_MULTIPROC_DIR'], '*.db')):
+        os.remove(path)
+
+
+def when_ready(server):
+    server.log.info(f'🚀 SuperManager API: {bind} (워커 {workers}개 × 스레드 {threads}, preload={preload_app})')
+
+
+def post_fork(server, worker):
+    """fork 직후 워커에서 실행 - 마스터의 DB 연결 풀을 버리고 새로 연결"""
+    from wsgi import app
+    from app.db import db
+    from app.metrics import set_pool_capacity
+
+    with app.app_context():
+        # close=False: 마스터가 쓰던 소켓을 닫지 않고 참조만 버림 (다른 프로세스의 연결을 끊지 않도록)
+        for engine in db.engines.values():  # primary + 읽기 복제본
+            engine.dispose(close=False)
+        set_pool_capacity()
+    server.log.info(f'워커 시작 (pid {worker.pid})')
+
+
+def worker_exit(server, worker):
+    server.log.info(f'워커 종료 (pid {worker.pid})')
+
+
+def child_exit(server, worker):
+    """마스터에서 실행 - 종료된 워커의 게이지(사용 중 연결 등)를 합산에서 제외"""
+    from app.metrics import mark_worker_dead
+    mark_worker_dead(worker.pid)
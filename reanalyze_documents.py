@@ -0,0 +1,324 @@
+"""
+문서 일괄 재분석 스크립트
+- 문서 타입 / 분석 상태 / 업로드 날짜로 대상 선택
+- 텍스트 추출 및 분석을 프로세스 풀로 병렬 처리
+  (추출은 워커마다 샌드박스 자식 프로세스에서 - 형식별 타임아웃 / 메모리 상한, 초과한 파일은 실패로 기록)
+- 배치 단위 일괄 UPDATE + 체크포인트 (중단 후 재시작 시 이어서 처리)
+- 처리량 리포트 (docs/s, MB/s)
+
+사용 예:
+    python reanalyze_documents.py --type resume --status unanalyzed --workers 8
+    python reanalyze_documents.py --since 2025-01-01 --until 2025-06-30
+    python reanalyze_documents.py --reset   # 체크포인트 무시하고 처음부터
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from app.services.file_service import FileService
+from app.services.keyword_matcher import SkillMatcher
+from app.services.extraction_sandbox import ExtractionSandbox
+
+DEFAULT_CHECKPOINT = '.reanalyze_checkpoint.json'
+STATUS_CHOICES = ['all', 'analyzed', 'unanalyzed', 'failed']
+
+
+# ==================== Worker (자식 프로세스) ====================
+
+def init_worker(skills):
+    """풀 워커 초기화 - 스킬 사전 설정, 워커는 한 번에 한 건만 처리하므로 추출 프로세스도 하나"""
+    SkillMatcher.use_skills(skills)
+    ExtractionSandbox.WORKERS = 1
+
+
+def process_document(task):
+    """문서 한 건 추출 + 분석 (DB 접근 없음)"""
+    doc_id, file_path, document_type, content_hash, cached = task
+    started = time.perf_counter()
+    result = {
+        'id': doc_id,
+        'content_hash': content_hash,
+        'text': None,
+        'meta': None,
+        'data': None,
+        'error': None,
+        'fresh_text': False,
+    }
+
+    try:
+        if cached is not None:
+            text, meta = cached
+        else:
+            if not result['content_hash']:
+                result['content_hash'] = FileService.compute_file_hash(file_path)
+            # 샌드박스에서 추출 - 멈추거나 메모리를 과하게 쓰는 파일이 풀 워커(와 배치 전체)를 붙잡지 않도록
+            success, text, meta = ExtractionSandbox.extract(file_path)
+            if not success:
+                result['error'] = text
+                return result
+            result['fresh_text'] = True
+
+        result['text'] = text
+        result['meta'] = meta
+        result['data'] = FileService.analyze_text(text, document_type)
+        if meta.get('truncated'):
+            result['data']['extraction'] = meta
+    except Exception as e:
+        result['error'] = str(e)
+    finally:
+        result['elapsed'] = time.perf_counter() - started
+
+    return result
+
+
+# ==================== Checkpoint ====================
+
+def load_checkpoint(path, filters, reset):
+    """체크포인트 로드 (필터가 다르면 재사용 불가)"""
+    empty = {
+        'filters': filters,
+        'last_created_at': None,
+        'last_id': None,
+        'processed': 0,
+        'failed': 0,
+        'bytes': 0,
+        'elapsed': 0.0,
+    }
+    if reset or not os.path.exists(path):
+        return empty
+
+    with open(path, 'r', encoding='utf-8') as f:
+        checkpoint = json.load(f)
+
+    if checkpoint.get('filters') != filters:
+        print(f'❌ 체크포인트({path})의 필터가 현재 옵션과 다릅니다. --reset 으로 새로 시작하세요')
+        print(f'   체크포인트: {checkpoint.get("filters")}')
+        print(f'   현재 옵션: {filters}')
+        sys.exit(1)
+
+    return checkpoint
+
+
+def save_checkpoint(path, checkpoint):
+    """체크포인트 저장 (임시 파일 후 교체 - 중간에 죽어도 파일이 깨지지 않음)"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# ==================== Main ====================
+
+def build_query(args, checkpoint):
+    """재분석 대상 쿼리 (created_at, id 기준 keyset 페이지네이션)"""
+    from app.db import db
+    from app.models import FreelancerDocument
+
+    query = db.session.query(
+        FreelancerDocument.id,
+        FreelancerDocument.freelancer_id,
+        FreelancerDocument.document_type,
+        FreelancerDocument.file_path,
+        FreelancerDocument.file_size,
+        FreelancerDocument.content_hash,
+        FreelancerDocument.created_at,
+    )
+
+    query = query.filter(FreelancerDocument.deleted_at.is_(None))
+
+    if args.type:
+        query = query.filter(FreelancerDocument.document_type.in_(args.type))
+
+    if args.status == 'analyzed':
+        query = query.filter(FreelancerDocument.is_analyzed.is_(True))
+    elif args.status == 'unanalyzed':
+        query = query.filter(FreelancerDocument.is_analyzed.is_(False))
+    elif args.status == 'failed':
+        query = query.filter(FreelancerDocument.analysis_error.isnot(None))
+
+    if args.since:
+        query = query.filter(FreelancerDocument.created_at >= args.since)
+    if args.until:
+        query = query.filter(FreelancerDocument.created_at < args.until)
+
+    if checkpoint['last_id'] is not None:
+        last_created_at = datetime.fromisoformat(checkpoint['last_created_at'])
+        query = query.filter(
+            db.or_(
+                FreelancerDocument.created_at > last_created_at,
+                db.and_(
+                    FreelancerDocument.created_at == last_created_at,
+                    FreelancerDocument.id > checkpoint['last_id']
+                )
+            )
+        )
+
+    return query.order_by(FreelancerDocument.created_at, FreelancerDocument.id)
+
+
+def load_cached_texts(rows, force_extract):
+    """배치 내 문서의 추출 캐시 일괄 조회 → {(hash, format): (text, meta)} (잘린 결과는 다시 추출)"""
+    from app.models import DocumentExtractionCache
+    from app.services import FreelancerDocumentService
+
+    if force_extract:
+        return {}
+
+    hashes = {row.content_hash for row in rows if row.content_hash}
+    if not hashes:
+        return {}
+
+    entries = DocumentExtractionCache.query.filter(
+        DocumentExtractionCache.content_hash.in_(hashes),
+        DocumentExtractionCache.extractor_version == FileService.EXTRACTOR_VERSION
+    ).all()
+    return {(e.content_hash, e.file_format): (e.extracted_text, e.extraction_meta or {}) for e in entries
+            if FreelancerDocumentService._is_cacheable(e.extraction_meta)}
+
+
+def write_results(rows, results):
+    """배치 결과 일괄 UPDATE + 새로 추출된 텍스트 캐시 저장"""
+    from app.db import db
+    from app.models import FreelancerDocument
+    from app.services import FreelancerDocumentService
+    from app.services.search_service import DocumentSearchService
+
+    formats = {row.id: FileService.get_file_format(row.file_path) for row in rows}
+    freelancer_ids = {row.id: row.freelancer_id for row in rows}
+    mappings = []
+    search_rows = []
+    cached_keys = set()
+
+    for result in results:
+        if result['error'] is not None:
+            mappings.append({
+                'id': result['id'],
+                'is_analyzed': False,
+                'analysis_error': result['error'],
+            })
+            continue
+
+        mappings.append({
+            'id': result['id'],
+            'content_hash': result['content_hash'],
+            'extracted_text': result['text'],
+            'extracted_data': result['data'],
+            'is_analyzed': True,
+            'analysis_error': None,
+        })
+        search_rows.append((result['id'], freelancer_ids[result['id']], result['text']))
+
+        key = (result['content_hash'], formats[result['id']])
+        if result['fresh_text'] and key not in cached_keys and FreelancerDocumentService._is_cacheable(result['meta']):
+            FreelancerDocumentService._save_extraction_cache(key[0], key[1], result['text'], result['meta'])
+            cached_keys.add(key)
+
+    # 색인을 먼저 - 기존 색인 삭제에 이전 원문(extracted_text)이 필요
+    DocumentSearchService.index_documents(search_rows)
+    if mappings:
+        db.session.execute(db.update(FreelancerDocument), mappings)
+    db.session.commit()
+
+
+def run(args):
+    """일괄 재분석 실행"""
+    from app import create_app
+    from app.db import db
+
+    filters = {
+        'type': sorted(args.type) if args.type else None,
+        'status': args.status,
+        'since': args.since.isoformat() if args.since else None,
+        'until': args.until.isoformat() if args.until else None,
+    }
+    checkpoint = load_checkpoint(args.checkpoint, filters, args.reset)
+
+    app = create_app()
+
+    with app.app_context():
+        db.engine.echo = False
+
+        total = build_query(args, checkpoint).order_by(None).count()
+        print(f'📋 재분석 대상: {total}건 (이미 처리: {checkpoint["processed"]}건)')
+        print(f'⚙️  워커 {args.workers}개, 배치 {args.batch_size}건\n')
+
+        started = time.perf_counter()
+        run_processed = 0
+        run_bytes = 0
+
+        # 워커는 DB에 접근하지 않으므로 스킬 사전을 미리 전달
+        skills = SkillMatcher.load_skills()
+
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                                 initargs=(skills,)) as executor:
+            while True:
+                rows = build_query(args, checkpoint).limit(args.batch_size).all()
+                if not rows:
+                    break
+
+                cached = load_cached_texts(rows, args.force_extract)
+                tasks = [
+                    (
+                        row.id, row.file_path, row.document_type, row.content_hash,
+                        cached.get((row.content_hash, FileService.get_file_format(row.file_path)))
+                    )
+                    for row in rows
+                ]
+                chunksize = max(1, len(tasks) // (args.workers * 4))
+                results = list(executor.map(process_document, tasks, chunksize=chunksize))
+
+                write_results(rows, results)
+
+                # 체크포인트는 커밋 이후에만 전진 (재시작 시 최대 한 배치만 재처리)
+                batch_bytes = sum(row.file_size or 0 for row in rows)
+                checkpoint['last_created_at'] = rows[-1].created_at.isoformat()
+                checkpoint['last_id'] = rows[-1].id
+                checkpoint['processed'] += len(rows)
+                checkpoint['failed'] += sum(1 for r in results if r['error'] is not None)
+                checkpoint['bytes'] += batch_bytes
+                checkpoint['elapsed'] = checkpoint.get('elapsed', 0.0) + sum(r['elapsed'] for r in results)
+                save_checkpoint(args.checkpoint, checkpoint)
+
+                run_processed += len(rows)
+                run_bytes += batch_bytes
+                wall = time.perf_counter() - started
+                print(
+                    f'  ✅ {run_processed}/{total} '
+                    f'| {run_processed / wall:.1f} docs/s '
+                    f'| {run_bytes / 1024 / 1024 / wall:.2f} MB/s '
+                    f'| 실패 누적 {checkpoint["failed"]}건'
+                )
+
+        wall = time.perf_counter() - started
+        print('\n' + '=' * 60)
+        print(f'✨ 재분석 완료: {run_processed}건 / {wall:.1f}초')
+        if wall > 0 and run_processed:
+            print(f'   처리량: {run_processed / wall:.1f} docs/s, {run_bytes / 1024 / 1024 / wall:.2f} MB/s')
+        print(f'   누적 처리: {checkpoint["processed"]}건 (실패 {checkpoint["failed"]}건)')
+        print('=' * 60)
+
+
+def parse_date(value):
+    return datetime.fromisoformat(value)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='FreelancerDocument 일괄 재분석')
+    parser.add_argument('--type', action='append', help='문서 타입 (resume, portfolio, ...) - 여러 번 지정 가능')
+    parser.add_argument('--status', choices=STATUS_CHOICES, default='all', help='분석 상태 필터')
+    parser.add_argument('--since', type=parse_date, help='업로드 시작일 (포함, ISO 형식)')
+    parser.add_argument('--until', type=parse_date, help='업로드 종료일 (미포함, ISO 형식)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='추출 프로세스 수')
+    parser.add_argument('--batch-size', type=int, default=200, help='배치당 문서 수 (UPDATE/체크포인트 단위)')
+    parser.add_argument('--checkpoint', default=DEFAULT_CHECKPOINT, help='체크포인트 파일 경로')
+    parser.add_argument('--reset', action='store_true', help='체크포인트 무시하고 처음부터 처리')
+    parser.add_argument('--force-extract', action='store_true', help='추출 캐시를 무시하고 파일을 다시 파싱')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    run(parse_args())
@@ -43,27 +43,69 @@ else
 fi
 echo ""
 
-# 2. 데이터베이스 초기화
-echo -e "${YELLOW}2️⃣  데이터베이스 초기화 중...${NC}"
-python3 setup.py
-if [ $? -eq 0 ]; then
-    echo -e "   ${GREEN}✅ 초기화 완료${NC}"
+# 실행 옵션
+#   --setup : 데이터베이스 초기화(setup.py) 강제 실행
+#   --dev   : Flask 개발 서버로 실행 (기본: gunicorn)
+RUN_SETUP=false
+DEV_SERVER=false
+for arg in "$@"; do
+    case $arg in
+        --setup) RUN_SETUP=true ;;
+        --dev) DEV_SERVER=true ;;
+    esac
+done
+
+# .env 의 DB_TYPE / DB_NAME / API_PORT 사용
+if [ -f ".env" ]; then
+    set -a
+    . ./.env
+    set +a
+fi
+
+# SQLite 파일이 아직 없으면 최초 실행으로 보고 초기화
+if [ "${DB_TYPE:-sqlite}" != "mysql" ] && [ ! -f "${DB_NAME:-supermanager}.db" ]; then
+    RUN_SETUP=true
+fi
+
+# 2. 데이터베이스 초기화 (최초 실행 또는 --setup 일 때만)
+if [ "$RUN_SETUP" = true ]; then
+    echo -e "${YELLOW}2️⃣  데이터베이스 초기화 중...${NC}"
+    python3 setup.py
+    if [ $? -eq 0 ]; then
+        echo -e "   ${GREEN}✅ 초기화 완료${NC}"
+    else
+        echo -e "   ${RED}❌ 초기화 실패${NC}"
+        exit 1
+    fi
 else
-    echo -e "   ${RED}❌ 초기화 실패${NC}"
-    exit 1
+    echo -e "${YELLOW}2️⃣  데이터베이스 초기화 건너뜀 (필요하면 --setup)${NC}"
 fi
 echo ""
 
-# 3. Flask 서버 시작
-echo -e "${YELLOW}3️⃣  Flask 서버 시작 중...${NC}"
+# 3. 서버 시작
+PORT=${API_PORT:-8000}
+if [ "$DEV_SERVER" = false ] && ! python3 -c "import gunicorn" &> /dev/null; then
+    echo -e "   ${YELLOW}⚠️  gunicorn이 없어 개발 서버로 실행합니다 (pip install -r requirements.txt)${NC}"
+    DEV_SERVER=true
+fi
+
+if [ "$DEV_SERVER" = true ]; then
+    echo -e "${YELLOW}3️⃣  Flask 개발 서버 시작 중...${NC}"
+else
+    echo -e "${YELLOW}3️⃣  gunicorn 서버 시작 중...${NC}"
+fi
 echo ""
 echo -e "${GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
 echo -e "${GREEN}✨ 서버가 시작되었습니다!${NC}"
 echo ""
-echo -e "   ${BLUE}🌐 API 주소: http://192.168.0.109:8000/api${NC}"
-echo -e "   ${BLUE}📊 DB 주소: 192.168.0.109:3306${NC}"
+echo -e "   ${BLUE}🌐 API 주소: http://localhost:${PORT}/api${NC}"
 echo ""
 echo -e "${GREEN}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━${NC}"
 echo ""
 
-python3 app.py
+if [ "$DEV_SERVER" = true ]; then
+    exec python3 app.py
+else
+    # 재시작: kill -HUP <master pid> / 종료: kill -TERM <master pid>
+    exec python3 -m gunicorn -c gunicorn.conf.py wsgi:app
+fi
@@ -0,0 +1,108 @@
+-- ==========================================
+-- Incremental Schema Migrations
+-- 기존 데이터베이스에 적용하는 변경 사항 (신규 설치는 schema.sql 사용)
+-- 위에서부터 순서대로 한 번씩 실행
+-- ==========================================
+
+USE supermanager;
+
+-- ==================== 문서 텍스트 추출 캐시 ====================
+-- 파일 내용 해시 + 추출기 버전 기준으로 추출 결과를 재사용
+
+ALTER TABLE freelancer_document
+    ADD COLUMN content_hash VARCHAR(64) NULL COMMENT '파일 내용 SHA-256' AFTER mime_type,
+    ADD INDEX idx_content_hash (content_hash);
+
+CREATE TABLE IF NOT EXISTS document_extraction_cache (
+    id VARCHAR(36) PRIMARY KEY COMMENT '캐시 고유ID',
+    content_hash VARCHAR(64) NOT NULL COMMENT '파일 내용 SHA-256',
+    file_format VARCHAR(10) NOT NULL COMMENT '파일 형식 (txt, md, docx, pdf, xlsx)',
+    extractor_version INT NOT NULL COMMENT '추출기 버전',
+    extracted_text LONGTEXT NOT NULL COMMENT '추출된 텍스트',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
+
+    UNIQUE KEY uq_extraction_cache_key (content_hash, file_format, extractor_version)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='문서 텍스트 추출 캐시';
+
+-- ==================== PDF 추출 예산 ====================
+-- 페이지 수 / 글자 수 / 시간 예산 초과로 잘린 추출 결과의 메타데이터
+
+ALTER TABLE document_extraction_cache
+    ADD COLUMN extraction_meta JSON NULL COMMENT '추출 메타데이터 (PDF 페이지 수, 잘림 사유 등)' AFTER extracted_text;
+
+-- ==================== 문서 전문 검색 ====================
+-- 추출 텍스트 역색인 (ngram 파서 - 한국어 부분 일치). 기존 문서는 앱 시작 시 자동 색인됨
+-- (테이블이 이미 있으면 자동 색인을 건너뛰므로, 여기서 만든 경우 아래 INSERT로 채움)
+
+CREATE TABLE IF NOT EXISTS document_search (
+    document_id VARCHAR(36) PRIMARY KEY COMMENT '문서 ID',
+    freelancer_id VARCHAR(36) NOT NULL COMMENT '프리랜서 ID',
+    body LONGTEXT NOT NULL COMMENT '추출된 텍스트 (검색용 원문)',
+
+    INDEX idx_freelancer_id (freelancer_id),
+    FULLTEXT INDEX ft_body (body) WITH PARSER ngram
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='문서 전문 검색 인덱스';
+
+INSERT INTO document_search (document_id, freelancer_id, body)
+SELECT id, freelancer_id, extracted_text FROM freelancer_document
+WHERE extracted_text IS NOT NULL
+ON DUPLICATE KEY UPDATE body = VALUES(body);
+
+-- ==================== 문서 삭제 표시 / 업로드 파일 정리 ====================
+-- 문서 삭제는 deleted_at 만 기록하고, 파일과 레코드는 gc_uploads.py 가 보존 기간 후 정리
+
+ALTER TABLE freelancer_document
+    ADD COLUMN deleted_at DATETIME NULL COMMENT '삭제 표시 시간 (파일 정리 전까지 보존)' AFTER updated_at,
+    ADD INDEX idx_deleted_at (deleted_at);
+
+-- ==================== 추출 텍스트 압축 저장 ====================
+-- 압축 헤더가 붙은 바이너리로 저장 (헤더 없는 기존 값은 평문으로 읽힘)
+-- 컬럼 변경 후 python compress_document_text.py 로 기존 행을 압축
+-- extracted_data 는 JSON 컬럼 유지 (queries.sql 6.3 의 JSON_EXTRACT 조회)
+
+ALTER TABLE freelancer_document
+    MODIFY COLUMN extracted_text LONGBLOB NULL COMMENT '추출된 텍스트 (압축 저장)';
+
+ALTER TABLE document_extraction_cache
+    MODIFY COLUMN extracted_text LONGBLOB NOT NULL COMMENT '추출된 텍스트 (압축 저장)';
+
+-- ==================== 면접 분석 집계 테이블 ====================
+-- 카테고리 점수 분포 / 레드플래그 발견 빈도 (평가 저장 시 증분 갱신)
+-- 기존 평가는 앱 시작 시 자동 집계됨 (또는 POST /api/interviews/analytics/rebuild)
+
+-- InterviewCategoryScoreStat (카테고리별 점수 분포 집계 - 평가 저장 시 증분 갱신)
+CREATE TABLE IF NOT EXISTS interview_category_score_stat (
+    category_id VARCHAR(36) PRIMARY KEY COMMENT '카테고리ID',
+    score_count INT NOT NULL DEFAULT 0 COMMENT '점수가 매겨진 평가 수',
+    score_sum FLOAT NOT NULL DEFAULT 0 COMMENT '점수 합계',
+    score_1_count INT NOT NULL DEFAULT 0 COMMENT '하(1) 건수',
+    score_3_count INT NOT NULL DEFAULT 0 COMMENT '중(3) 건수',
+    score_5_count INT NOT NULL DEFAULT 0 COMMENT '상(5) 건수',
+    checked_sum INT NOT NULL DEFAULT 0 COMMENT '체크된 항목 수 합계',
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
+
+    FOREIGN KEY (category_id) REFERENCES interview_category(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='카테고리별 점수 분포 집계';
+
+-- InterviewRedFlagStat (레드플래그별 발견 빈도 집계 - 평가 저장 시 증분 갱신)
+CREATE TABLE IF NOT EXISTS interview_red_flag_stat (
+    red_flag_id VARCHAR(36) PRIMARY KEY COMMENT '레드플래그ID',
+    finding_count INT NOT NULL DEFAULT 0 COMMENT '확인한 평가 수 (발견 여부 무관)',
+    found_count INT NOT NULL DEFAULT 0 COMMENT '실제 발견된 평가 수',
+    severity_low_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 low 건수',
+    severity_medium_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 medium 건수',
+    severity_high_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 high 건수',
+    severity_critical_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 critical 건수',
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
+
+    FOREIGN KEY (red_flag_id) REFERENCES interview_red_flag(id) ON DELETE CASCADE,
+    INDEX idx_found_count (found_count)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='레드플래그별 발견 빈도 집계';
+
+-- ==================== 프리랜서 스냅샷 변경분 조회 인덱스 ====================
+-- 목록 / 매칭 스냅샷이 updated_at 이후 변경된 프리랜서만 다시 읽음
+
+ALTER TABLE freelancer ADD INDEX idx_updated_at (updated_at);
+ALTER TABLE freelancer_profile ADD INDEX idx_updated_at (updated_at);
+ALTER TABLE review ADD INDEX idx_updated_at (updated_at);
+ALTER TABLE interview_evaluation ADD INDEX idx_updated_at (updated_at);
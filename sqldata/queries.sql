@@ -231,6 +231,19 @@ JOIN freelancer f ON ie.freelancer_id = f.id
 JOIN interview_category ic ON ics.category_id = ic.id
 ORDER BY f.name, ic.`order`;
 
+-- 5.4-1 카테고리별 점수 분포 (집계 테이블 - GET /api/interviews/analytics/category-scores)
+SELECT
+  ic.name as category_name,
+  s.score_count,
+  s.score_sum / s.score_count as average_score,
+  s.score_1_count,
+  s.score_3_count,
+  s.score_5_count
+FROM interview_category_score_stat s
+JOIN interview_category ic ON s.category_id = ic.id
+WHERE s.score_count > 0
+ORDER BY ic.`order`;
+
 -- 5.5 가장 많이 발견되는 레드플래그
 SELECT
   irf.flag_text,
@@ -241,6 +254,16 @@ LEFT JOIN interview_red_flag_finding irff ON irf.id = irff.red_flag_id
 GROUP BY irf.id
 ORDER BY found_count DESC;
 
+-- 5.5-1 가장 많이 발견되는 레드플래그 (집계 테이블 - GET /api/interviews/analytics/red-flags)
+SELECT
+  irf.flag_text,
+  irf.severity,
+  s.finding_count,
+  s.found_count
+FROM interview_red_flag_stat s
+JOIN interview_red_flag irf ON s.red_flag_id = irf.id
+ORDER BY s.found_count DESC, s.finding_count DESC;
+
 -- ==================== 6. 문서 관리 쿼리 ====================
 
 -- 6.1 프리랜서별 업로드된 문서
@@ -278,6 +301,7 @@ JOIN freelancer f ON fd.freelancer_id = f.id
 WHERE fd.document_type = 'resume' AND fd.is_analyzed = TRUE;
 
 -- ==================== 7. 대시보드 쿼리 ====================
+-- API: GET /api/dashboard/stats (7.1-1 + 7.2-1 두 번의 조회로 계산, 캐시)
 
 -- 7.1 전체 통계
 SELECT
@@ -317,6 +341,30 @@ FROM freelancer_profile
 GROUP BY experience_level
 ORDER BY experience;
 
+-- 7.1-1 전체 통계 (한 번의 조회)
+SELECT
+  (SELECT COUNT(*) FROM freelancer) as total_freelancers,
+  (SELECT COUNT(*) FROM skill) as total_skills,
+  (SELECT COUNT(*) FROM portfolio_item) as total_portfolio_items,
+  (SELECT COUNT(*) FROM review) as total_reviews,
+  (SELECT AVG(rating) FROM review) as average_rating,
+  (SELECT COUNT(*) FROM interview_evaluation) as total_evaluations,
+  (SELECT COUNT(*) FROM freelancer_document WHERE deleted_at IS NULL) as documents_uploaded;
+
+-- 7.2-1 시장 분석 + 경력별 분포 (프로필 한 번 스캔, 상태별 / 경력 구간별 합계는 애플리케이션에서)
+SELECT
+  availability,
+  CASE
+    WHEN experience < 2 THEN 'junior'
+    WHEN experience < 5 THEN 'mid'
+    WHEN experience < 10 THEN 'senior'
+    ELSE 'expert'
+  END as experience_level,
+  COUNT(*) as freelancer_count,
+  SUM(hourly_rate) as hourly_rate_sum
+FROM freelancer_profile
+GROUP BY availability, experience_level;
+
 -- ==================== 8. 데이터 정합성 검사 ====================
 
 -- 8.1 프로필이 없는 프리랜서
@@ -92,7 +92,8 @@ CREATE TABLE freelancer (
 
     INDEX idx_name (name),
     INDEX idx_email (email),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_updated_at (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='프리랜서 기본 정보';
 
 -- 7. FreelancerProfile (프리랜서 프로필)
@@ -109,7 +110,8 @@ CREATE TABLE freelancer_profile (
 
     FOREIGN KEY (freelancer_id) REFERENCES freelancer(id) ON DELETE CASCADE,
     INDEX idx_freelancer_id (freelancer_id),
-    INDEX idx_availability (availability)
+    INDEX idx_availability (availability),
+    INDEX idx_updated_at (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='프리랜서 프로필 정보';
 
 -- 8. freelancer_skill (프리랜서-스킬 연결)
@@ -157,7 +159,8 @@ CREATE TABLE review (
     FOREIGN KEY (freelancer_id) REFERENCES freelancer(id) ON DELETE CASCADE,
     INDEX idx_freelancer_id (freelancer_id),
     INDEX idx_rating (rating),
-    INDEX idx_created_at (created_at)
+    INDEX idx_created_at (created_at),
+    INDEX idx_updated_at (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='리뷰 및 평점';
 
 -- 11. FreelancerDocument (프리랜서 문서)
@@ -169,20 +172,47 @@ CREATE TABLE freelancer_document (
     file_path VARCHAR(500) NOT NULL COMMENT '파일 경로',
     file_size INT NOT NULL COMMENT '파일 크기 (바이트)',
     mime_type VARCHAR(100) NOT NULL COMMENT 'MIME 타입',
-    extracted_text LONGTEXT COMMENT '추출된 텍스트',
+    content_hash VARCHAR(64) COMMENT '파일 내용 SHA-256',
+    extracted_text LONGBLOB COMMENT '추출된 텍스트 (압축 저장)',
     extracted_data JSON COMMENT '분석된 구조화 데이터',
     is_analyzed BOOLEAN NOT NULL DEFAULT FALSE COMMENT '분석 완료 여부',
     analysis_error TEXT COMMENT '분석 중 발생한 오류',
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
     updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
+    deleted_at DATETIME COMMENT '삭제 표시 시간 (파일 정리 전까지 보존)',
 
     FOREIGN KEY (freelancer_id) REFERENCES freelancer(id) ON DELETE CASCADE,
     INDEX idx_freelancer_id (freelancer_id),
     INDEX idx_document_type (document_type),
     INDEX idx_is_analyzed (is_analyzed),
-    INDEX idx_created_at (created_at)
+    INDEX idx_content_hash (content_hash),
+    INDEX idx_created_at (created_at),
+    INDEX idx_deleted_at (deleted_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='프리랜서 문서 관리';
 
+-- 11-1. DocumentExtractionCache (문서 텍스트 추출 캐시)
+CREATE TABLE document_extraction_cache (
+    id VARCHAR(36) PRIMARY KEY COMMENT '캐시 고유ID',
+    content_hash VARCHAR(64) NOT NULL COMMENT '파일 내용 SHA-256',
+    file_format VARCHAR(10) NOT NULL COMMENT '파일 형식 (txt, md, docx, pdf, xlsx)',
+    extractor_version INT NOT NULL COMMENT '추출기 버전',
+    extracted_text LONGBLOB NOT NULL COMMENT '추출된 텍스트 (압축 저장)',
+    extraction_meta JSON NULL COMMENT '추출 메타데이터 (PDF 페이지 수, 잘림 사유 등)',
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간',
+
+    UNIQUE KEY uq_extraction_cache_key (content_hash, file_format, extractor_version)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='문서 텍스트 추출 캐시';
+
+-- 11-2. DocumentSearch (문서 전문 검색 - ngram FULLTEXT, 문서 분석 완료 시 갱신)
+CREATE TABLE document_search (
+    document_id VARCHAR(36) PRIMARY KEY COMMENT '문서 ID',
+    freelancer_id VARCHAR(36) NOT NULL COMMENT '프리랜서 ID',
+    body LONGTEXT NOT NULL COMMENT '추출된 텍스트 (검색용 원문)',
+
+    INDEX idx_freelancer_id (freelancer_id),
+    FULLTEXT INDEX ft_body (body) WITH PARSER ngram
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='문서 전문 검색 인덱스';
+
 -- ==================== Interview Evaluation Tables ====================
 
 -- 12. InterviewEvaluation (면접 평가 기록)
@@ -201,7 +231,8 @@ CREATE TABLE interview_evaluation (
     FOREIGN KEY (freelancer_id) REFERENCES freelancer(id) ON DELETE CASCADE,
     INDEX idx_freelancer_id (freelancer_id),
     INDEX idx_evaluated_at (evaluated_at),
-    INDEX idx_recommendation (recommendation)
+    INDEX idx_recommendation (recommendation),
+    INDEX idx_updated_at (updated_at)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='면접 평가 기록';
 
 -- 13. InterviewCategoryScore (면접 카테고리별 점수)
@@ -256,6 +287,35 @@ CREATE TABLE interview_red_flag_finding (
     INDEX idx_is_found (is_found)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='면접 평가 레드플래그';
 
+-- 16. InterviewCategoryScoreStat (카테고리별 점수 분포 집계 - 평가 저장 시 증분 갱신)
+CREATE TABLE interview_category_score_stat (
+    category_id VARCHAR(36) PRIMARY KEY COMMENT '카테고리ID',
+    score_count INT NOT NULL DEFAULT 0 COMMENT '점수가 매겨진 평가 수',
+    score_sum FLOAT NOT NULL DEFAULT 0 COMMENT '점수 합계',
+    score_1_count INT NOT NULL DEFAULT 0 COMMENT '하(1) 건수',
+    score_3_count INT NOT NULL DEFAULT 0 COMMENT '중(3) 건수',
+    score_5_count INT NOT NULL DEFAULT 0 COMMENT '상(5) 건수',
+    checked_sum INT NOT NULL DEFAULT 0 COMMENT '체크된 항목 수 합계',
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
+
+    FOREIGN KEY (category_id) REFERENCES interview_category(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='카테고리별 점수 분포 집계';
+
+-- 17. InterviewRedFlagStat (레드플래그별 발견 빈도 집계 - 평가 저장 시 증분 갱신)
+CREATE TABLE interview_red_flag_stat (
+    red_flag_id VARCHAR(36) PRIMARY KEY COMMENT '레드플래그ID',
+    finding_count INT NOT NULL DEFAULT 0 COMMENT '확인한 평가 수 (발견 여부 무관)',
+    found_count INT NOT NULL DEFAULT 0 COMMENT '실제 발견된 평가 수',
+    severity_low_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 low 건수',
+    severity_medium_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 medium 건수',
+    severity_high_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 high 건수',
+    severity_critical_count INT NOT NULL DEFAULT 0 COMMENT '실제 심각도 critical 건수',
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정 시간',
+
+    FOREIGN KEY (red_flag_id) REFERENCES interview_red_flag(id) ON DELETE CASCADE,
+    INDEX idx_found_count (found_count)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='레드플래그별 발견 빈도 집계';
+
 -- ==================== Optimization Notes ====================
 -- Query Optimization: Eager Loading으로 N+1 문제 해결
 -- - joinedload: 1:1 관계 (FreelancerProfile)
@@ -0,0 +1,83 @@
+"""
+SQLite 읽기 복제본 동기화 스크립트 (로컬 개발 / 테스트용)
+- primary DB 파일(SQLALCHEMY_DATABASE_URI)을 SQLite 온라인 백업 API 로 복제본 파일(DB_REPLICA_URLS)에 복사
+- 복사 중에도 primary 쓰기 / 복제본 읽기는 계속 가능 (복제본 조회는 복사가 끝난 시점부터 새 내용)
+- --interval 을 주면 주기적으로 반복 → 운영의 복제 지연을 흉내 (그 사이 쓰기는 복제본에 보이지 않음)
+
+사용 예:
+    DB_REPLICA_URLS=sqlite:///supermanager_replica.db python sync_sqlite_replica.py
+    DB_REPLICA_URLS=sqlite:///supermanager_replica.db python sync_sqlite_replica.py --interval 2
+"""
+import os
+import time
+import sqlite3
+import argparse
+
+
+def sqlite_paths():
+    """(primary 파일, [(bind key, 복제본 파일)]) - Flask-SQLAlchemy 가 해석한 실제 경로"""
+    from app import create_app
+    from app.db import db, replica_bind_keys
+
+    app = create_app()
+    with app.app_context():
+        engines = [db.engine] + [db.engines[key] for key in replica_bind_keys()]
+        for engine in engines:
+            if engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+                raise SystemExit(f'❌ SQLite 파일 DB 만 동기화할 수 있습니다: {engine.url}')
+        replicas = [(key, db.engines[key].url.database) for key in replica_bind_keys()]
+        primary = db.engine.url.database
+        for engine in engines:
+            engine.dispose()  # 복사 중 이 프로세스의 연결이 잠금을 잡지 않도록
+    return primary, replicas
+
+
+def sync(primary, replica, busy_timeout):
+    """primary → replica 전체 복사 (한 번에 복사해 복제본이 중간 상태를 보이지 않게) → 복사한 바이트"""
+    source = sqlite3.connect(primary)
+    target = sqlite3.connect(replica, timeout=busy_timeout / 1000)
+    try:
+        target.execute(f'PRAGMA busy_timeout={busy_timeout}')
+        source.backup(target, pages=-1)
+        page_size, = target.execute('PRAGMA page_size').fetchone()
+        page_count, = target.execute('PRAGMA page_count').fetchone()
+        return page_size * page_count
+    finally:
+        target.close()
+        source.close()
+
+
+def run(args):
+    primary, replicas = sqlite_paths()
+    if not replicas:
+        raise SystemExit('❌ 복제본이 없습니다 (DB_REPLICA_URLS 에 sqlite:/// 경로를 설정하세요)')
+
+    print(f'🔁 SQLite 복제본 동기화: {primary}')
+    for key, path in replicas:
+        print(f'   → {key}: {path}')
+    print()
+
+    while True:
+        for key, path in replicas:
+            started = time.perf_counter()
+            size = sync(primary, path, args.busy_timeout)
+            print(f'  ✅ {time.strftime("%H:%M:%S")} {key}: {size / 1024 / 1024:.2f}MB '
+                  f'({(time.perf_counter() - started) * 1000:.0f}ms)')
+        if not args.interval:
+            break
+        time.sleep(args.interval)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='SQLite primary 파일을 읽기 복제본 파일로 복사')
+    parser.add_argument('--interval', type=float, default=0, help='반복 주기 (초, 0 이면 한 번만)')
+    parser.add_argument('--busy-timeout', type=int, default=int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+                        help='복제본 잠금 대기 (ms)')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    try:
+        run(parse_args())
+    except KeyboardInterrupt:
+        print('\n👋 동기화 종료')
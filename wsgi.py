@@ -0,0 +1,8 @@
+"""
+WSGI Entry Point (운영 서버용)
+gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from app import create_app
+
+# preload_app 이면 마스터 프로세스에서 한 번만 생성되고 워커는 fork 로 공유
+app = create_app()